@@ -0,0 +1,141 @@
+"""
+File:   Builder_CLI.py
+Function:   This file contains the command line interface for the builder. It loads a saved dash editor
+            config file without opening the editor window, then runs the same checks the editor uses. This
+            is useful for checking configurations in scripts, or on systems without a display.
+
+            Usage:  python Builder_CLI.py check <editor_config.xml>
+                    python Builder_CLI.py busload <editor_config.xml> [--bitrate 250000]
+                    python Builder_CLI.py filters <editor_config.xml> [--slots 8]
+                    python Builder_CLI.py cost <editor_config.xml> [--calib frame_cost.json]
+                    python Builder_CLI.py calibrate [--out frame_cost.json]
+"""
+
+import argparse
+from lib import *
+
+#---CLI return codes
+cli_rtn = {'OK': 0,         #no errors found
+           'ERRS': 1,       #configuration has errors
+           'FILE': 2}       #config file couldn't be opened
+
+class cli_Main:
+    """Headless stand-in for the main editor window. Holds the loaded configuration in the same attributes
+    as the main window so the config parse and check functions can be used without the editor."""
+    def __init__(self):
+        self.cfg_pages = {}                 #dict of dash pages defined for the display. Format is {name: FrameClass}
+        self.cfg_core = dash_config()       #primary dash config values
+        self.cfg_theme = dash_theme()       #reference for dash theme information
+        self.cfg_CAN = CAN_core()           #reference for the CAN information
+        self.editr_cntl = None              #no editor in the CLI
+        self.tk_root = None                 #hidden tk root, only needed for font checks
+
+    def load(self, filepath):
+        """function opens and parses the passed editor config file
+
+        :param filepath: path to the editor config file
+        :type filepath: `string`
+        :returns: True if the file was loaded
+        :rtype: `boolean`
+        """
+        try: config_tree = ET.parse(filepath)
+        except (OSError, ET.ParseError) as e:
+            print('Unable to open XML file "' + filepath + '". System error is: ' + str(e))
+            return False
+        parseXML(self, config_tree)
+        return True
+
+    def init_tk(self):
+        """function creates a hidden tk root. Font definitions can only be checked with a tk root, which
+        requires a display.
+
+        :returns: True if a tk root is available
+        :rtype: `boolean`
+        """
+        try:
+            self.tk_root = tk.Tk()
+            self.tk_root.withdraw()         #never shown
+        except tk.TclError: self.tk_root = None
+        return self.tk_root is not None
+
+def cli_print_errs(err_list):
+    """function prints a dict of config errors in the same format as the editor "Check Config" window
+
+    :param err_list: dict of errors
+    :type err_list: {'issue_location':'issue description'}
+    :returns: CLI return code
+    :rtype: `int`
+    """
+    if not err_list:
+        print('No errors found')
+        return cli_rtn['OK']
+    for key, val in err_list.items(): print('  ' + key + ': ' + val)
+    print(str(len(err_list)) + ' error(s) found')
+    return cli_rtn['ERRS']
+
+def cli_check(master, args):
+    """function checks the loaded configuration for any errors that would result in an invalid dash config"""
+    has_tk = master.init_tk()
+    tmp_errs = XML_dashCFG_checkErrs(master)
+    if not has_tk:                                              #no display, font definitions can't be checked
+        print('WARNING: no display available, font definitions were not checked')
+        for name in master.cfg_theme.fonts: tmp_errs.pop(name, None)
+    return cli_print_errs(tmp_errs)
+
+def cli_busload(master, args):
+    """function prints the estimated CAN bus load and request schedule of the loaded configuration"""
+    bus_load = CANbus_load(master.cfg_CAN, args.bitrate or master.cfg_CAN.bitrate, master.cfg_core.Refresh)
+    print(bus_load.report())
+    return cli_print_errs(bus_load.XML_dashCFG_checkErrs())
+
+def cli_filters(master, args):
+    """function prints the CAN RX hardware filters built from the CAN channels of the loaded configuration"""
+    print(CAN_fltrOptimizer(master.cfg_CAN.data_ch, args.slots).report())
+    return cli_rtn['OK']
+
+def cli_cost(master, args):
+    """function prints the estimated page redraw times of the loaded configuration"""
+    frame_cost = dash_frameCost(master, cost_loadCoef(args.calib))
+    print(frame_cost.report())
+    return cli_print_errs(frame_cost.XML_dashCFG_checkErrs())
+
+def cli_calibrate(master, args):
+    """function runs the redraw time micro-benchmark and saves the calibration file. Run this on the dash
+    hardware, then copy the calibration file to the builder cache directory (or pass it to "cost")."""
+    coef = cost_calibrate()
+    for name, val in coef.items(): print('  {:<8} {:.4f} us'.format(name, val))
+    cost_saveCoef(coef, args.out)
+    print('Calibration saved to ' + args.out)
+    return cli_rtn['OK']
+
+#---CLI commands. Format is {command: (function, help)}
+cli_cmds = {'check': (cli_check, 'check the config for errors'),
+            'busload': (cli_busload, 'estimate the CAN bus load'),
+            'filters': (cli_filters, 'build the CAN RX hardware filters'),
+            'cost': (cli_cost, 'estimate the page redraw times'),
+            'calibrate': (cli_calibrate, 'calibrate the redraw time estimate on this system')}
+
+def cli_args():
+    """function builds the CLI argument parser
+
+    :rtype: `argparse.ArgumentParser`
+    """
+    parser = argparse.ArgumentParser(description='PyDash Builder command line interface')
+    subparsers = parser.add_subparsers(dest='cmd', required=True)
+    for cmd, (func, cmd_help) in cli_cmds.items():
+        sub = subparsers.add_parser(cmd, help=cmd_help)
+        if cmd != 'calibrate': sub.add_argument('config', help='dash editor config file (.xml)')
+        if cmd == 'busload': sub.add_argument('--bitrate', type=int, default=None, help='CAN bus bitrate in bits/sec, defaults to the config bitrate')
+        if cmd == 'filters': sub.add_argument('--slots', type=int, default=CANfltr_dfltSlots, help='number of hardware filter slots')
+        if cmd == 'cost': sub.add_argument('--calib', default=cost_calibFile, help='redraw time calibration file')
+        if cmd == 'calibrate': sub.add_argument('--out', default=cost_calibFile, help='calibration file to save')
+    return parser
+
+def main(argv=None):
+    args = cli_args().parse_args(argv)
+    master = cli_Main()
+    if 'config' in args and not master.load(args.config): return cli_rtn['FILE']
+    return cli_cmds[args.cmd][0](master, args)
+
+if __name__ == "__main__":
+    raise SystemExit(main())
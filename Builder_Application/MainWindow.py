@@ -17,6 +17,7 @@ class wndw_Main(tk.Tk):
         self.cfg_CAN = CAN_core()           #reference for the CAN information. Format is class:CAN_core
 
         self.editr_cntl = editrCntl(self)                   #instance editor control class
+        self.editr_nudge = FrmEdit_nudge(self)              #instance arrow key nudge of the selected element
         self.init_window()                                  #intialize editor window
         self.editr_wgtProps = vw_EditorWidget_props(self)   #instance widget property control
 
@@ -40,11 +41,16 @@ class wndw_Main(tk.Tk):
         self.menu_file = tk.Menu(self.menubar, tearoff=0)
         self.menu_file.add_command(label="New", command=self.config_new)                     #create new config
         self.menu_file.add_command(label="Open", command=self.config_load)                   #open existing config XML
+        self.menu_recent = tk.Menu(self.menu_file, tearoff=0, postcommand=self.recent_upd)   #recently opened config XMLs, listed when shown
+        self.menu_file.add_cascade(label="Open Recent", menu=self.menu_recent)
         self.menu_file.add_command(label="Save", command=lambda: self.config_save(False))    #save current config XML
         self.menu_file.add_command(label="Save As", command=lambda: self.config_save(True))  #save current config XML as another name
         self.menu_file.add_separator()
         self.menu_file.add_command(label="Check Config", command=self.cfg_check)             #check config for errors before generating dash XML
         self.menu_file.add_command(label="Generate Dash Config", command=self.gen_dashCFG)   #generate dash XML file (and also export images)
+        self.menu_file.add_command(label="Generate Delta Package", command=self.gen_dashCFG_delta)  #generate only the changes from a previous package
+        self.dashCFG_rawImgs = tk.BooleanVar(self, False)                                    #include raw image blobs in generated packages
+        self.menu_file.add_checkbutton(label="Include Raw Images", variable=self.dashCFG_rawImgs)
         self.menu_file.add_separator()
         self.menu_file.add_command(label="Exit", command=self.destroy)
         self.menubar.add_cascade(label="File", menu=self.menu_file)
@@ -67,6 +73,8 @@ class wndw_Main(tk.Tk):
         menu_CAN = tk.Menu(self.menubar, tearoff=0)
         menu_CAN.add_command(label="Base Config", command=lambda: self.new_toplvl(wndw_CANcore))#edit core CAN configuration
         menu_CAN.add_command(label="CAN channels", command=lambda: self.new_toplvl(wndw_CANch)) #edit mapped CAN channels
+        menu_CAN.add_separator()
+        menu_CAN.add_command(label="Replay CAN Log", command=lambda: wndw_CANreplay(self))      #replay a CAN log into the editor (no focus grab)
         self.menubar.add_cascade(label="CAN", menu=menu_CAN)
 
         #--windows menu
@@ -74,11 +82,39 @@ class wndw_Main(tk.Tk):
         menu_pages.add_command(label="Manage Pages", command=lambda: self.new_toplvl(wndw_Pages))   #edit defined pages
         self.menubar.add_cascade(label="Dash Pages", menu=menu_pages)
 
+        #--view menu
+        menu_view = tk.Menu(self.menubar, tearoff=0)
+        self.snap_guides_on = tk.BooleanVar(self, True)                                      #snap to, and show, alignment guides to other elements
+        menu_view.add_checkbutton(label="Alignment Guides", variable=self.snap_guides_on)
+        self.snap_grid_on = tk.BooleanVar(self, False)                                       #snap elements to the grid
+        menu_view.add_checkbutton(label="Snap to Grid", variable=self.snap_grid_on)
+        self.snap_grid_size = tk.IntVar(self, snap_grid_dflt)                                #snap grid size in pixels
+        menu_grid = tk.Menu(menu_view, tearoff=0)
+        for grid_sz in snap_grid_sizes: menu_grid.add_radiobutton(label=f"{grid_sz} px", variable=self.snap_grid_size, value=grid_sz)
+        menu_view.add_cascade(label="Grid Size", menu=menu_grid)
+        menu_view.add_separator()
+        self.pool_budgetMB = tk.IntVar(self, pool_budgetDflt)                                #memory budget of the built page canvases
+        menu_budget = tk.Menu(menu_view, tearoff=0)
+        for budget in pool_budgetsMB: menu_budget.add_radiobutton(label=f"{budget} MB", variable=self.pool_budgetMB, value=budget,
+                                                                  command=lambda: self.editr_cntl.canv_pool.evict())
+        menu_view.add_cascade(label="Page Memory Budget", menu=menu_budget)
+        self.menubar.add_cascade(label="View", menu=menu_view)
+
         #--help menu
         menu_help = tk.Menu(self.menubar, tearoff=0)
         menu_help.add_command(label="About", command=lambda: self.new_toplvl(wndw_About))       #about software version information
         menu_help.add_separator()
         menu_help.add_command(label="Check Fonts", command=lambda: sysCheck_fonts(self))        #checks installed fonts for any missing PyDash fonts
+        menu_help.add_separator()
+        menu_debug = tk.Menu(menu_help, tearoff=0)
+        menu_debug.add_command(label="Leak Report", command=lambda: wndw_notify(self, {'type':Popup_types['INFO'],
+                                                                                       'title':'Leak Report',
+                                                                                       'message':self.editr_cntl.res_mgr.report()}))
+        menu_debug.add_command(label="GC Pauses", command=lambda: wndw_notify(self, {'type':Popup_types['INFO'],
+                                                                                     'title':'GC Pauses',
+                                                                                     'message':self.editr_cntl.gc_pause.report()}))
+        menu_debug.add_command(label="Reset GC Pauses", command=lambda: self.editr_cntl.gc_pause.reset())
+        menu_help.add_cascade(label="Debug", menu=menu_debug)
         self.menubar.add_cascade(label="Help", menu=menu_help)
 
         #--set menubar
@@ -106,6 +142,11 @@ class wndw_Main(tk.Tk):
         self.frm_DashDisplay.grid_propagate(False)  #prevent from resizing based on children
         self.frm_DashDisplay.grid(row=1, columnspan=2, padx=10, pady=10, sticky=tk.S)
 
+        #--editor status line
+        self.status_var = tk.StringVar(value='')
+        lbl_status = tk.Label(self.frm_main, textvariable=self.status_var, font=font_norm1)
+        lbl_status.grid(row=2, columnspan=2, padx=10, pady=(0,10), sticky=tk.W)
+
         #--editor header and controls
         #-page selector
         lbl_frm_DashDisplay = tk.Label(self.frm_hdr, text="Dash Page:", font=font_hdr1)
@@ -129,12 +170,14 @@ class wndw_Main(tk.Tk):
         self.btn_bltInd.grid(row=0, column=5, padx=10, pady=10)
         self.btn_barInd=tk.Button(self.frm_hdr,text="Add Bar Ind", font=font_hdr2, command= lambda: self.new_element(DashEle_types['IND_BAR']))
         self.btn_barInd.grid(row=0, column=6, padx=10, pady=10)
+        self.btn_gauInd=tk.Button(self.frm_hdr,text="Add Gauge", font=font_hdr2, command= lambda: self.new_element(DashEle_types['IND_GAU']))
+        self.btn_gauInd.grid(row=0, column=7, padx=10, pady=10)
 
         #-delete element
         sep2 = ttk.Separator(self.frm_hdr, orient=tk.VERTICAL)
-        sep2.grid(row=0, column=7, padx=10, pady=10, sticky=tk.NS)
+        sep2.grid(row=0, column=8, padx=10, pady=10, sticky=tk.NS)
         self.btn_delEle=tk.Button(self.frm_hdr,text="Delete Element", font=font_hdr2, command= self.delete_crnt_element)
-        self.btn_delEle.grid(row=0, column=8, padx=10, pady=10)
+        self.btn_delEle.grid(row=0, column=9, padx=10, pady=10)
 
         #--element properties frame
         self.frm_alt.grid_columnconfigure(0,weight=1)   #let the whole column expand to the given width
@@ -150,6 +193,12 @@ class wndw_Main(tk.Tk):
         """function binds common keyboard shortcuts to various menu functions"""
         self.bind("<Control-s>", lambda e: self.config_save(False))
         self.bind("<Control-Shift-S>", lambda e: self.config_save(True))
+        self.bind("<Control-Next>", lambda e: self.editr_cntl.gotoEditorCanv_step(1))     #next page
+        self.bind("<Control-Prior>", lambda e: self.editr_cntl.gotoEditorCanv_step(-1))   #previous page
+        for key, (dx, dy) in nudge_keys.items():                #arrow keys nudge the selected element
+            self.bind(f"<KeyPress-{key}>", lambda e, dx=dx, dy=dy: self.editr_nudge.key_press(e, dx, dy))
+            self.bind(f"<Shift-KeyPress-{key}>", lambda e, dx=dx, dy=dy: self.editr_nudge.key_press(e, dx*nudge_stepBig, dy*nudge_stepBig))
+            self.bind(f"<KeyRelease-{key}>", self.editr_nudge.key_release)
 
     def init_cfg_defaults(self):
         self.cfg_core.set_dflt_cfg()    #set default core config values
@@ -209,14 +258,22 @@ class wndw_Main(tk.Tk):
         self.cfg_pages.clear(); self.cfg_core.clear()   #clear out config information
         self.cfg_CAN.clear(); self.cfg_theme.clear()    #clear out config information
         self.editr_cntl.ResetEditor()                   #and reset the editor window
+        self.editr_cntl.res_mgr.free_all()              #free the canvases, images, and bindings of the cleared pages
     
     def cfg_check(self):
         if self.dashCFG_check():
             messagebox.showinfo("Success", "No errors detected!")
 
-    def config_load(self):
+    def config_load(self, filepath=None):
         """function loads a saved dash config XML file. If a current config is loaded, users are wanred before being
-        prompted to browse to the saved dash config file"""
+        prompted to browse to the saved dash config file. If the file hasn't changed since it was last opened, the
+        parsed config is restored from the cache (see cfg_cache.py) instead of parsing the file again, and only the
+        theme fonts and images are checked again if it passed the config check when it was cached.
+
+        :param filepath: (optional) config file to open, skips the browse dialogue. Used by the "Open Recent" menu
+        :type filepath: `string`
+        """
+        filedict = None
         cfg_exists = self.cfg_check_exist()
         if cfg_exists:          #check for existing CFG
             delete_result = messagebox.askokcancel("Warning", "Loading a new config will delete all items in the current configuration (Colors, themes, pages, etc) and cannot be undone. Do you want to proceed?")
@@ -224,16 +281,27 @@ class wndw_Main(tk.Tk):
 
         if delete_result or not cfg_exists:         #if no cfg exists or user said it was OK
             self.cfg_clear()                        #then clear
-            filedict = xmlfile_openDialogue(self)   #and load a config file
+            if filepath is None: filedict = xmlfile_openDialogue(self)  #and load a config file
+            else: filedict = {'dir': os.path.dirname(os.path.abspath(filepath)) + '/', 'name': os.path.basename(filepath)}
         else: messagebox.showinfo("FYI", "Dash config was not loaded")  #otherwise do nothing, but give them a reminder
 
         if filedict is not None:
             self.editr_cntl.configFile_dir = filedict['dir']
             self.editr_cntl.configFile_name = filedict['name']                                  #update the latest config file name and path
-            xmlFile = XML_open(self.editr_cntl.configFile_dir, self.editr_cntl.configFile_name) #open a file at the saved path, return XML element tree obj
-            if xmlFile is not None:
-                parseXML(self, xmlFile)                                                         #parse the XML file and load data structs
-                if self.dashCFG_check() == True:                                                #check config validity, If OK, then build page
+            cfg_path = self.editr_cntl.configFile_dir + self.editr_cntl.configFile_name
+            cache_valid = cfgCache_load(self, cfg_path)                                         #restore the parsed config if the file is unchanged, None if not
+            cfg_loaded = cache_valid is not None
+            if not cfg_loaded:
+                cache_key = cfgCache_key(cfg_path)                                              #taken before parsing, in case the file changes
+                xmlFile = XML_open(self.editr_cntl.configFile_dir, self.editr_cntl.configFile_name) #open a file at the saved path, return XML element tree obj
+                if xmlFile is not None:
+                    parseXML(self, xmlFile)                                                     #parse the XML file and load data structs
+                    cfg_loaded = True
+            if cfg_loaded:
+                cfgRecent_add(cfg_path)                                                         #add to the "Open Recent" menu
+                cfg_valid = self.dashCFG_check(bool(cache_valid))                               #check config validity, only the theme files if already checked
+                if cache_valid is None: cfgCache_save(self, cfg_path, cache_key, cfg_valid)     #cache the parsed config, before any page is built
+                if cfg_valid == True:                                                           #If OK, then build page
                     messagebox.showinfo("Success", "Loaded dash config successfully!")              #let the user know it was loaded
                     self.editr_cntl.buildAllPages()                                                 #build all the pages with elements in the loaded config
                     self.editr_cntl.cboFrames_upd()                                                 #update frame select combo box    
@@ -263,9 +331,18 @@ class wndw_Main(tk.Tk):
         if ok_to_save:          #if file save conditions have been met/set 
             editr_xmlGen = editorXML_gen(self,XMLgen_mode['EDTR'])                                  #generate editor XML config file
             XML_save(self.editr_cntl.configFile_dir, self.editr_cntl.configFile_name, editr_xmlGen) #save editor XML config file
+            cfgRecent_add(self.editr_cntl.configFile_dir + self.editr_cntl.configFile_name)         #add to the "Open Recent" menu
         elif skip_message: pass #if user was previosuly warned, then skip second message
         else: messagebox.showinfo("FYI", "Unable to save dash config.")
         
+    def recent_upd(self):
+        """function lists the recently opened config files in the "Open Recent" menu, called each time the menu is shown"""
+        self.menu_recent.delete(0, tk.END)
+        tmp_paths = cfgRecent_get()
+        for i, path in enumerate(tmp_paths):
+            self.menu_recent.add_command(label=str(i+1) + ': ' + os.path.basename(path), command=lambda p=path: self.config_load(p))
+        if not tmp_paths: self.menu_recent.add_command(label="(None)", state=tk.DISABLED)
+
     def config_new(self):
         """function clears the current dash config"""
         cfg_exists = self.cfg_check_exist()
@@ -288,16 +365,32 @@ class wndw_Main(tk.Tk):
                 messagebox.showinfo("FYI", "Configuration package was not created")
         #error check message handled in dashCFG_check
 
-    def dashCFG_check(self):
+    def gen_dashCFG_delta(self):
+        """function generates a delta package, which only contains the files changed from a previous package"""
+        if self.dashCFG_check():                        #if no errors were found, ask for the previous package
+            dialogue_opts = {'initialdir':self.editr_cntl.configFile_dir,
+                             'filetypes':[('Config Package','*.zip'), ('Manifest','*.xml'), ('All Files','*.*')],
+                             'title':'Previous Configuration Package'}
+            base_dir, base_name = file_open_dialogue(dialogue_opts)
+            if base_name is None: return                #no previous package chosen
+            is_delta = self.create_dash_definition_package(base_dir + base_name)
+            if is_delta is None: messagebox.showinfo("FYI", "Configuration package was not created")
+            elif is_delta: messagebox.showinfo("Success", "Successfully created delta package!")
+            else: messagebox.showinfo("FYI", "Previous package has no manifest, a full download package was created instead")
+
+    def dashCFG_check(self, ext_only=False):
         """function checks the current dash configuration for potential errors. Any identified errors may cause an issue when
         saving the dash editor file for later use, but is primarily intended for identifying errors that would not create a valid
         dash config file to save to the PyDash.
         
         If any errors are detected, they are displayed for the user to resolve
+        :param ext_only: (optional) only check the parts of the config that depend on other files, for a config restored
+            from the config cache that was already checked
+        :type ext_only: `bool`: default FALSE
         :returns: configuration status
         :rtype: `bool` - FALSE if errors are found
         """
-        errors_list = self.gen_dashCFG_VV()     #check for potential errors
+        errors_list = self.gen_dashCFG_VV(ext_only) #check for potential errors
         if len(errors_list) != 0:               #error result is not blank, so there are errors
             err_msg = "Error detected in configuration. Please fix the following issues in the config:\n\n"
             for k,v in errors_list.items(): err_msg += k + ': ' + v +'\n'   #build error message string
@@ -307,25 +400,39 @@ class wndw_Main(tk.Tk):
             return False    #if errors are found, return false
         else: return True   #otherwise return true
     
-    def gen_dashCFG_VV(self):
+    def gen_dashCFG_VV(self, ext_only=False):
         """function checks current config for any errors that would result in an invalid configuration.
         
+        :param ext_only: (optional) only check the parts of the config that depend on other files
+        :type ext_only: `bool`: default FALSE
         :returns: any errors identified in the V&V process
         :rtype: `dictionary` in the format of {'issue_location':'issue description'}
         """
+        if ext_only: return XML_dashCFG_checkExt(self)  #theme fonts and images only
         return XML_dashCFG_checkErrs(self)  # check for errors and return list of issues
     
-    def create_dash_definition_package(self):
+    def create_dash_definition_package(self, base_pkg=None):
         """function compiles the required dash configuration package used for a PyDash
         
-        :returns: output package status
-        :rtype: `bool` - True if a download package was successfully created
+        :param base_pkg: (optional) previous package to make a delta package against
+        :type base_pkg: `string` filepath
+        :returns: output package status. For a delta package, True if a delta was created, False if a full
+            package was created instead, and None if no package was created
+        :rtype: `bool`
         """
         cfg_save_dir = genDashCFG_fileLoc(self)+'/'     #ask user where they would like to save the output configuration
         if cfg_save_dir is not None:                    #if its a valid file location, proceed with generation
-            genXML_DashCFG(self, cfg_save_dir)          #generate the output package
+            px_fmt = dash_pxFmt if self.dashCFG_rawImgs.get() else None         #raw image blobs are optional
+            is_delta, warn_list = genXML_DashCFG(self, cfg_save_dir, base_pkg, px_fmt)  #generate the output package
+            if len(warn_list) != 0:                     #package was made, but some parts were left out
+                warn_msg = "The configuration package was created with the following warnings:\n\n"
+                for k,v in warn_list.items(): warn_msg += k + ': ' + v +'\n'   #build warning message string
+                wndw_notify(self, {'type':Popup_types['WARN'],
+                                   'title':'PACKAGE WARNING',
+                                   'message':warn_msg})         #display warning message
+            if base_pkg is not None: return is_delta    #delta package was requested, return if one was made
             return True                                 #package was created successfully, return true
-        else: return False                              #if unsuccessful, return false
+        else: return None if base_pkg is not None else False    #if unsuccessful, return false
 
 #-----------------------------main loop
 if __name__ == "__main__":
@@ -0,0 +1,212 @@
+"""
+File:       CAN_busload.py
+Function:   This file handles estimating the CAN bus load created by the configured CAN channels. Channels
+            with remote requests enabled (`CAN_ch.rem_req`) are requested by the dash every `req_freq` ms,
+            which costs a remote request frame plus the response data frame on the bus. Channels without a
+            remote request are counted at their expected frequency, if one is defined.
+
+            Frame sizes are calculated for the worst case, including the extended PID and bit-stuffing
+            overhead, so the result is the highest bus utilization the configuration could create.
+"""
+from .sys import *
+from .com_defs import int_str               #needed for channel value conversion
+from .CAN_decode import CANdecode_PID       #needed for PID conversion
+
+#---CAN frame sizes, in bits
+CANbus_frmBits_std = 47         #fixed bits in a standard (11-bit PID) data frame, incl. the 3-bit interframe space
+CANbus_frmBits_ext = 67         #fixed bits in an extended (29-bit PID) data frame, incl. the 3-bit interframe space
+CANbus_stufBits_std = 34        #fixed bits in a standard frame that are subject to bit-stuffing
+CANbus_stufBits_ext = 54        #fixed bits in an extended frame that are subject to bit-stuffing
+
+def CANbus_frameBits(dlc, ext=False):
+    """function calculates the worst-case number of bits on the bus for a single CAN frame. Worst case
+    bit-stuffing adds one bit for every 4 bits in the stuffed region of the frame.
+
+    :param dlc: number of data bytes in the frame (0 for a remote request)
+    :type dlc: `int`
+    :param ext: frame uses an extended PID
+    :type ext: `boolean`
+    :returns: worst-case frame length in bits
+    :rtype: `int`
+    """
+    dlc = min(max(int(dlc or 0), 0), 8)                                 #classic CAN is limited to 8 data bytes
+    fixed = CANbus_frmBits_ext if ext else CANbus_frmBits_std           #fixed frame bits
+    stuffed = (CANbus_stufBits_ext if ext else CANbus_stufBits_std) + 8*dlc     #bits in the stuffed region
+    return fixed + 8*dlc + (stuffed - 1)//4                             #add worst-case stuff bits
+
+class CANbus_PIDload:
+    """class contains the estimated bus load for a single PID. All channels that share a PID are received
+    in the same frame, so the PID is only requested at the fastest requested channel rate."""
+    def __init__(self, PID, ext):
+        self.PID = PID              #CAN PID
+        self.ext = ext              #extended PID
+        self.channels = []          #names of the channels using this PID
+        self.dlc = 0                #largest expected DLC of the channels
+        self.rem_req = False        #PID is remote requested by the dash
+        self.period = None          #fastest request (or expected) period in ms
+
+    def add_channel(self, ch):
+        """function adds a CAN channel to the PID load
+
+        :param ch: CAN channel definition
+        :type ch: `CAN_ch`
+        """
+        self.channels.append(ch.name)
+        self.dlc = max(self.dlc, int_str(ch.dlc) or 0)
+        self.rem_req = self.rem_req or bool(ch.rem_req)
+        period = int_str(ch.req_freq)
+        if period is not None and period > 0:
+            period = max(int(round(period)), 1)                         #schedule is in whole ms
+            self.period = period if self.period is None else min(self.period, period)
+
+    def rate(self):
+        """function returns the frame rate of the PID
+
+        :returns: frames per second, or None if no frequency is defined
+        :rtype: `float`
+        """
+        if self.period is None: return None
+        return 1000 / self.period
+
+    def bits_per_cycle(self):
+        """function returns the number of bus bits used each time the PID is sent. A remote requested
+        PID costs both the remote request frame and the response data frame.
+
+        :returns: bits per request/response cycle
+        :rtype: `int`
+        """
+        bits = CANbus_frameBits(self.dlc, self.ext)
+        if self.rem_req: bits += CANbus_frameBits(0, self.ext)
+        return bits
+
+    def bits_per_sec(self):
+        """function returns the bus bits per second used by the PID
+
+        :returns: bits per second, 0 if no frequency is defined
+        :rtype: `float`
+        """
+        rate = self.rate()
+        if rate is None: return 0.0
+        return rate * self.bits_per_cycle()
+
+class CANbus_load:
+    """class estimates the CAN bus load and the remote request schedule of the configured CAN channels"""
+    def __init__(self, CAN_cfg, bitrate=sys_CAN_bitrate, refresh=refrsh_rt):
+        """
+        :param CAN_cfg: CAN configuration
+        :type CAN_cfg: `CAN_core`
+        :param bitrate: (optional) CAN bus bitrate in bits/sec
+        :type bitrate: `int`
+        :param refresh: (optional) dash refresh period in ms
+        :type refresh: `int`
+        """
+        self.bitrate = int_str(bitrate) or sys_CAN_bitrate      #bus bitrate
+        self.refresh = int_str(refresh) or refrsh_rt            #dash refresh period
+        self.PIDs = {}                                          #load of each PID. Format is {(PID, ext): CANbus_PIDload}
+        self.invalid = []                                       #channels with a PID that can't be used
+        self.calc_PIDs(CAN_cfg.data_ch)
+
+    def calc_PIDs(self, data_ch):
+        """function groups the CAN channels by PID
+
+        :param data_ch: dict of defined CAN channels
+        :type data_ch: {ch_NAME \\: `CAN_ch`}
+        """
+        for ch in data_ch.values():
+            PID = CANdecode_PID(ch.PID)
+            if PID is None: self.invalid.append(ch.name); continue
+            key = (PID, bool(ch.ext))
+            if key not in self.PIDs: self.PIDs.update({key: CANbus_PIDload(PID, bool(ch.ext))})
+            self.PIDs[key].add_channel(ch)
+
+    def utilization(self):
+        """function calculates the worst-case bus utilization of all PIDs with a defined frequency
+
+        :returns: bus utilization, where 1.0 is a fully saturated bus
+        :rtype: `float`
+        """
+        return sum(p.bits_per_sec() for p in self.PIDs.values()) / self.bitrate
+
+    def unknown_rate(self):
+        """function returns the PIDs that have no defined frequency, so can't be included in the bus load
+
+        :returns: list of PID loads
+        :rtype: `list` of `CANbus_PIDload`
+        """
+        return [p for p in self.PIDs.values() if p.period is None]
+
+    def schedule(self, horizon=1000):
+        """function builds the remote request schedule for the passed time horizon. All requests are started
+        at time 0, which is the worst case for bursts of requests.
+
+        :param horizon: (optional) schedule length in ms
+        :type horizon: `int`
+        :returns: sorted list of requests
+        :rtype: `list` of (time_ms, PID, ext)
+        """
+        tmp_sched = []
+        for p in self.PIDs.values():
+            if p.rem_req and p.period is not None:
+                tmp_sched += [(t, p.PID, p.ext) for t in range(0, horizon, p.period)]
+        tmp_sched.sort()
+        return tmp_sched
+
+    def frames_per_refresh(self):
+        """function calculates the worst-case number of frames the dash receives in a single refresh period.
+        Each PID sends at most ceil(refresh / period) frames in a refresh period.
+
+        :returns: worst-case frames per refresh
+        :rtype: `int`
+        """
+        tmp_frms = 0
+        for p in self.PIDs.values():
+            if p.period is not None: tmp_frms += -(-self.refresh // p.period)   #ceiling division
+        return tmp_frms
+
+    def report(self):
+        """function builds a text summary of the bus load, typically for the CLI
+
+        :returns: bus load summary
+        :rtype: `string`
+        """
+        tmp_rpt = 'CAN bus load at {} kbit/s, {} ms refresh\n'.format(self.bitrate/1000, self.refresh)
+        for (PID, ext), p in sorted(self.PIDs.items()):
+            rate = p.rate()
+            tmp_rpt += '  PID {:>10} {} DLC {} {:>9}  {:>12}  {:>6.2f}%  ({})\n'.format(
+                hex(PID), 'EXT' if ext else 'STD', p.dlc,
+                'RTR' if p.rem_req else 'broadcast',
+                'unknown rate' if rate is None else '{:.1f} frm/s'.format(rate),
+                100 * p.bits_per_sec() / self.bitrate, ', '.join(p.channels))
+        for p in self.unknown_rate():
+            tmp_rpt += '  NOTE: PID {} has no request or expected frequency and is not included in the load\n'.format(hex(p.PID))
+        for name in self.invalid:
+            tmp_rpt += '  NOTE: channel {} has an invalid PID and is not included in the load\n'.format(name)
+        tmp_rpt += 'Worst-case utilization: {:.1f}%\n'.format(100 * self.utilization())
+        tmp_rpt += 'Worst-case frames per refresh: {}\n'.format(self.frames_per_refresh())
+        return tmp_rpt
+
+    def XML_dashCFG_checkErrs(self):
+        """function checks the estimated bus load. A configuration that would load the bus over the limit,
+        receives more frames per refresh than the dash can process, or requests a PID faster than the dash
+        refresh is added to the temporary error dict.
+
+        :returns: dict of attributes with errors
+        :rtype: `dictionary` {attribute_name:"error message"}
+        """
+        tmp_err_list = {}   #temp dict for compiling errors
+
+        util = self.utilization()
+        if util >= 1.0:
+            tmp_err_list.update({'CAN_bus_load':'Worst-case bus load is {:.0f}% and would saturate the bus at {} kbit/s'.format(100*util, self.bitrate/1000)})
+        elif util >= CAN_busLoad_lim:
+            tmp_err_list.update({'CAN_bus_load':'Worst-case bus load is {:.0f}%, over the {:.0f}% limit at {} kbit/s'.format(100*util, 100*CAN_busLoad_lim, self.bitrate/1000)})
+
+        frms = self.frames_per_refresh()
+        if frms > CAN_rxFrm_budget:
+            tmp_err_list.update({'CAN_refresh_budget':'Worst-case {} frames per refresh is over the dash budget of {} frames'.format(frms, CAN_rxFrm_budget)})
+
+        for p in self.PIDs.values():
+            if p.rem_req and p.period is not None and p.period < self.refresh:
+                tmp_err_list.update({'CAN_PID_' + hex(p.PID):'Requested every {} ms, faster than the {} ms dash refresh'.format(p.period, self.refresh)})
+
+        return tmp_err_list
@@ -0,0 +1,297 @@
+"""
+File:       CAN_dbc.py
+Function:   This file handles importing CAN channel definitions from a DBC file. The DBC is read in a single
+            streaming pass (only message "BO_" and signal "SG_" lines are parsed) into an index of messages
+            and signals. Signals can then be looked up by name, searched and bulk-selected, and converted into
+            `CAN_ch` definitions.
+
+            Parsed indexes are cached, both in memory and on disk in the builder cache directory, keyed by the
+            DBC path, size, and modified time. Re-importing an unchanged DBC loads the cached index instead of
+            parsing the file again.
+
+            NOTE: CAN channels only support unsigned, whole-byte values (see `CAN_ch.frames`). Signals that are
+            signed, not byte-aligned, multiplexed, or use more than the 8 data bytes can't be converted, and
+            are indexed with the reason so it can be shown to the user.
+"""
+from .sys import *
+from .com_defs import CAN_ch                #needed to build CAN channels
+import re
+import mmap
+import bisect
+import pickle
+import hashlib
+
+#---DBC import constants
+CANdbc_extFlag = 0x80000000         #DBC message IDs have bit 31 set for extended PIDs
+CANdbc_idxVer = 1                   #cached index version. Increment if the index format changes
+CANdbc_maxList = 5000               #max number of signals listed in the import window
+CANdbc_cache = {}                   #in-memory cache of parsed indexes. Format is {abs_path: (size, mtime, CANdbc_index)}
+
+#--regex for the DBC message (BO_) and signal (SG_) lines. All other lines are skipped
+CANdbc_reLine = re.compile(rb'^[ \t]*(?:'
+                           rb'BO_[ \t]+(\d+)[ \t]+(\w+)[ \t]*:[ \t]*(\d+)'                  #message: id, name, dlc
+                           rb'|SG_[ \t]+(\w+)[ \t]*(\w*)[ \t]*:[ \t]*(\d+)\|(\d+)@([01])([+-])[ \t]*'   #signal: name, mux, start|length@order sign
+                           rb'\([ \t]*([-+0-9.eE]+)[ \t]*,[ \t]*([-+0-9.eE]+)[ \t]*\)[ \t]*'     #(scalar,offset)
+                           rb'\[[ \t]*([-+0-9.eE]+)[ \t]*\|[ \t]*([-+0-9.eE]+)[ \t]*\][ \t]*'   #[min|max]
+                           rb'"([^"]*)")', re.M)                                                #"unit"
+
+#--column indexes of the parsed DBC rows (see `CANdbc_reLine`)
+CANdbc_row = {'MSG_ID': 0, 'MSG_NAME': 1, 'MSG_DLC': 2,
+              'SIG_NAME': 3, 'SIG_MUX': 4, 'SIG_START': 5, 'SIG_LEN': 6, 'SIG_ORDER': 7, 'SIG_SIGN': 8,
+              'SIG_SCALAR': 9, 'SIG_OFFSET': 10, 'SIG_MIN': 11, 'SIG_MAX': 12, 'SIG_UNIT': 13}
+
+def CANdbc_num(val):
+    """function converts a DBC number to an integer if it is a whole number, otherwise a float. This keeps
+    CAN channel scalars and offsets in the same format used when entered in the editor.
+
+    :param val: number to convert
+    :type val: `bytes` or `string`
+    :rtype: `integer` or `float`
+    """
+    val = float(val)
+    return int(val) if val.is_integer() else val
+
+class CANdbc_signal:
+    """class contains a single signal read from a DBC file"""
+    def __init__(self, msg, row):
+        """
+        :param msg: message containing the signal
+        :type msg: `CANdbc_msg`
+        :param row: parsed DBC signal row
+        :type row: `tuple` of `bytes` (see `CANdbc_row`)
+        """
+        self.name = row[CANdbc_row['SIG_NAME']].decode(errors='replace')        #signal name
+        self.msg = msg.name                                                     #name of the message containing the signal
+        self.PID = msg.PID                                                      #message CAN PID
+        self.ext = msg.ext                                                      #message extended PID
+        self.dlc = msg.dlc                                                      #message DLC
+        self.mux = row[CANdbc_row['SIG_MUX']].decode()                          #multiplexer indicator ('M' or 'm<num>'), blank if not multiplexed
+        self.start = int(row[CANdbc_row['SIG_START']])                          #DBC start bit
+        self.length = int(row[CANdbc_row['SIG_LEN']])                           #signal length in bits
+        self.intel = row[CANdbc_row['SIG_ORDER']] == b'1'                       #little-endian (intel) byte order, otherwise big-endian (motorola)
+        self.signed = row[CANdbc_row['SIG_SIGN']] == b'-'                       #signed value
+        self.scalar = CANdbc_num(row[CANdbc_row['SIG_SCALAR']])                 #value scalar
+        self.offset = CANdbc_num(row[CANdbc_row['SIG_OFFSET']])                 #value offset
+        self.val_min = float(row[CANdbc_row['SIG_MIN']])                        #min value
+        self.val_max = float(row[CANdbc_row['SIG_MAX']])                        #max value
+        self.unit = row[CANdbc_row['SIG_UNIT']].decode(errors='replace')        #value unit
+        self.frames = None                                                      #1-indexed CAN channel frames, MSB first. None if not convertible
+        self.err = None                                                         #reason the signal can't be converted to a CAN channel
+        self.calc_frames()
+
+    def calc_frames(self):
+        """function converts the signal bit position into the CAN channel frames list. Only whole-byte signals
+        can be converted. For intel signals the start bit is the LSB, for motorola signals it is the MSB."""
+        if self.signed: self.err = 'Signed signals are not supported'
+        elif self.mux and self.mux != 'M': self.err = 'Multiplexed signals are not supported'   #'M' is the multiplexer itself
+        elif self.length % 8 != 0 or self.length == 0: self.err = 'Signal is not a whole number of bytes'
+        elif self.intel and self.start % 8 != 0: self.err = 'Signal is not byte-aligned'
+        elif not self.intel and self.start % 8 != 7: self.err = 'Signal is not byte-aligned'
+        else:
+            num_bytes = self.length // 8
+            first = self.start // 8                                             #byte holding the start bit
+            if self.intel: tmp_frms = list(range(first + num_bytes - 1, first - 1, -1))    #LSB first in the frame
+            else: tmp_frms = list(range(first, first + num_bytes))                        #MSB first in the frame
+            if max(tmp_frms) >= 8: self.err = 'Signal is outside the 8 data bytes of a CAN frame'
+            else: self.frames = [f + 1 for f in tmp_frms]                       #CAN channel frames are 1-indexed
+
+class CANdbc_msg:
+    """class contains a single message read from a DBC file. The message signals are the parsed DBC rows
+    from `first_row` up to (not including) `end_row`."""
+    __slots__ = ('name', 'PID', 'ext', 'dlc', 'first_row', 'end_row')
+
+    def __init__(self, name, dbc_id, dlc, first_row, end_row):
+        self.name = name                                #message name
+        self.ext = bool(dbc_id & CANdbc_extFlag)        #extended PID
+        self.PID = dbc_id & ~CANdbc_extFlag             #CAN PID
+        self.dlc = dlc                                  #message DLC
+        self.first_row = first_row                      #first signal row
+        self.end_row = end_row                          #end of the signal rows
+
+class CANdbc_index:
+    """class is the index of a parsed DBC file, with lookups by message and by signal name. The DBC lines are
+    kept as the raw parsed rows and are only converted to signals when they are looked up, which keeps both
+    parsing and loading from the cache fast for large DBC files."""
+    def __init__(self):
+        self.rows = []              #raw parsed DBC rows, see `CANdbc_row`
+        self.messages = {}          #messages in the DBC. Format is {msg_name: CANdbc_msg}
+        self.msg_rows = []          #sorted first signal row of each message, for row to message lookups
+        self.msg_order = []         #messages in the same order as msg_rows
+        self.sig_names = None       #signal rows by name, built on first use. Format is {sig_name: [row, ...]}
+        self.labels = None          #search labels of each row, built on first use
+
+    def __getstate__(self):
+        """function returns the index data saved to the cache. Lookups built on first use aren't saved."""
+        return {'rows': self.rows,
+                'messages': [(m.name, m.PID | (CANdbc_extFlag if m.ext else 0), m.dlc, m.first_row, m.end_row)
+                             for m in self.msg_order]}
+
+    def __setstate__(self, state):
+        """function restores the index from the cache data"""
+        self.__init__()
+        self.rows = state['rows']
+        self.set_messages([CANdbc_msg(*m) for m in state['messages']])
+
+    def set_messages(self, msgs):
+        """function sets the messages of the index and the row lookups
+
+        :param msgs: messages, in row order
+        :type msgs: `list` of `CANdbc_msg`
+        """
+        self.msg_order = msgs
+        self.msg_rows = [m.first_row for m in msgs]
+        self.messages = {m.name: m for m in msgs}
+
+    def parse(self, filepath):
+        """function reads the DBC file in a single pass. The file is memory-mapped and all message and signal
+        lines are matched in one regex scan, so no per-line python processing is needed. Signals are then
+        assigned to the message that precedes them.
+
+        :param filepath: path to the DBC file
+        :type filepath: `string`
+        """
+        with open(filepath, 'rb') as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm: self.rows = CANdbc_reLine.findall(mm)
+            except ValueError: self.rows = []                   #empty files can't be mapped
+
+        msg_idx = [i for i, row in enumerate(self.rows) if row[CANdbc_row['MSG_NAME']]]   #message rows
+        tmp_msgs = []
+        for n, i in enumerate(msg_idx):
+            row = self.rows[i]
+            end = msg_idx[n+1] if n+1 < len(msg_idx) else len(self.rows)
+            tmp_msgs.append(CANdbc_msg(row[CANdbc_row['MSG_NAME']].decode(errors='replace'),
+                                       int(row[CANdbc_row['MSG_ID']]), int(row[CANdbc_row['MSG_DLC']]), i+1, end))
+        self.set_messages(tmp_msgs)
+
+    def num_signals(self):
+        """function returns the number of signals in the DBC
+
+        :rtype: `integer`
+        """
+        return len(self.rows) - len(self.messages)
+
+    def signal(self, row):
+        """function converts the passed signal row into a signal
+
+        :param row: signal row index
+        :type row: `integer`
+        :rtype: `CANdbc_signal`
+        """
+        msg = self.msg_order[bisect.bisect_right(self.msg_rows, row) - 1]     #message the row belongs to
+        return CANdbc_signal(msg, self.rows[row])
+
+    def msg_signals(self, msg_name):
+        """function returns the signal rows of the named message
+
+        :rtype: `range` of row indexes
+        """
+        msg = self.messages[msg_name]
+        return range(msg.first_row, msg.end_row)
+
+    def find_signal(self, sig_name):
+        """function returns the rows of all signals with the passed name. Signal names can be repeated in
+        different messages.
+
+        :rtype: `list` of row indexes
+        """
+        if self.sig_names is None:
+            self.sig_names = {}
+            for msg in self.msg_order:
+                for i in range(msg.first_row, msg.end_row):
+                    self.sig_names.setdefault(self.rows[i][CANdbc_row['SIG_NAME']].decode(errors='replace'), []).append(i)
+        return self.sig_names.get(sig_name, [])
+
+    def label(self, row):
+        """function returns the display label of a signal row, as "message.signal"
+
+        :rtype: `string`
+        """
+        msg = self.msg_order[bisect.bisect_right(self.msg_rows, row) - 1]
+        return msg.name + '.' + self.rows[row][CANdbc_row['SIG_NAME']].decode(errors='replace')
+
+    def find(self, text):
+        """function returns the signal rows whose "message.signal" label contains the passed text (not case
+        sensitive). Rows are returned in DBC order.
+
+        :param text: text to search for. All signals are returned if blank
+        :type text: `string`
+        :rtype: `list` of row indexes
+        """
+        if self.labels is None:
+            self.labels = [(i, (msg.name + '.' + self.rows[i][CANdbc_row['SIG_NAME']].decode(errors='replace')).lower())
+                           for msg in self.msg_order for i in range(msg.first_row, msg.end_row)]
+        text = text.strip().lower()
+        return [i for i, lbl in self.labels if text in lbl]
+
+    def to_CANch(self, rows, exist_names=()):
+        """function converts the passed signal rows into CAN channels. The signal name is used as the channel
+        name. If the name is already used (by an existing channel or another selected signal) then the message
+        name is added as a prefix, and if that is also used a number is added as a suffix ("MSG_SIG_2", "MSG_SIG_3",
+        etc.), so an existing channel is never replaced. Signals that can't be converted are returned with the reason.
+
+        :param rows: signal rows to convert
+        :type rows: `iterable` of row indexes
+        :param exist_names: (optional) names of the CAN channels already defined
+        :type exist_names: `iterable` of `string`
+        :returns: tuple of the converted channels and the skipped signals
+        :rtype: ({ch_NAME: `CAN_ch`}, {"message.signal": "reason"})
+        """
+        tmp_chs = {}; tmp_skipped = {}
+        used_names = set(exist_names)
+        for row in rows:
+            sig = self.signal(row)
+            if sig.frames is None: tmp_skipped.update({sig.msg + '.' + sig.name: sig.err}); continue
+            name = sig.name if sig.name not in used_names else sig.msg + '_' + sig.name
+            base_name, num = name, 2
+            while name in used_names: name = base_name + '_' + str(num); num += 1      #prefixed name also used
+            used_names.add(name)
+            tmp_chs.update({name: CAN_ch(NAME=name, PID=hex(sig.PID), EXT=sig.ext, DLC=sig.dlc,
+                                         FRAMES=','.join(str(f) for f in sig.frames),
+                                         SCALAR=sig.scalar, OFFSET=sig.offset)})
+        return tmp_chs, tmp_skipped
+
+def CANdbc_cacheFile(filepath):
+    """function returns the on-disk cache file for the passed DBC. The file name is a hash of the DBC path.
+
+    :param filepath: absolute path to the DBC file
+    :type filepath: `string`
+    :rtype: `string`
+    """
+    return os.path.join(sys_cache_dir, 'dbc_' + hashlib.sha1(filepath.encode()).hexdigest() + '.idx')
+
+def CANdbc_load(filepath):
+    """function loads the index for the passed DBC file. If the file hasn't changed since it was last parsed,
+    the cached index is used (first the in-memory cache, then the on-disk cache). Otherwise the file is parsed
+    and the index saved to both caches. Failures to read or write the on-disk cache are ignored.
+
+    :param filepath: path to the DBC file
+    :type filepath: `string`
+    :returns: DBC index
+    :rtype: `CANdbc_index`
+    """
+    filepath = os.path.abspath(filepath)
+    stat = os.stat(filepath)
+    key = (stat.st_size, stat.st_mtime_ns)                  #file is unchanged if the size and modified time match
+
+    cached = CANdbc_cache.get(filepath)
+    if cached is not None and cached[:2] == key: return cached[2]
+
+    cache_file = CANdbc_cacheFile(filepath)
+    try:
+        with open(cache_file, 'rb') as f:
+            ver, cache_key, dbc_idx = pickle.load(f)
+        if ver == CANdbc_idxVer and cache_key == key:
+            CANdbc_cache.update({filepath: key + (dbc_idx,)})
+            return dbc_idx
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, AttributeError): pass    #no or invalid cache
+
+    dbc_idx = CANdbc_index()
+    dbc_idx.parse(filepath)
+    CANdbc_cache.update({filepath: key + (dbc_idx,)})
+    try:
+        os.makedirs(sys_cache_dir, exist_ok=True)
+        with open(cache_file, 'wb') as f:
+            pickle.dump((CANdbc_idxVer, key, dbc_idx), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError: pass                                    #cache is optional, ignore write failures
+    return dbc_idx
@@ -0,0 +1,239 @@
+"""
+File:       CAN_decode.py
+Function:   This file handles the decoding of raw CAN frames into the engineering values defined by the
+            configured CAN channels (see the `CAN_ch` class). Frames are processed in batches as NumPy
+            arrays, grouped by PID, and every channel of a PID is calculated at once from the channel
+            "frames" list, scalar, and offset. This is the same math the dash applies when a message is
+            received, so channel definitions can be checked against real CAN logs before loading a dash.
+
+            NOTE: this file intentionally does not import any of the tkinter based application files so
+            it can be shared as-is with the dash application.
+"""
+
+try: import numpy as np             #needed for vectorized decoding. Optional so the editor runs without it
+except ImportError: np = None
+
+#---decoder constants
+CANdecode_maxDLC = 8                #max number of data bytes in a (classic) CAN frame
+CANdecode_extFlag = 1 << 31         #flag added to a PID to build a unique key for extended frames
+CANdecode_maxExact = 6              #max number of frames that can be combined exactly using float math
+
+def CANdecode_PID(PID):
+    """function converts the passed CAN PID into an integer. PIDs are typically stored in the configuration
+    as a hex string (like '0x63'), but decimal strings and integers are also handled.
+
+    :param PID: CAN PID to convert
+    :type PID: `string` or `integer`
+    :returns: the converted PID, or None if the value could not be converted
+    :rtype: `integer`
+    """
+    if PID is None or PID == '': return None                #no PID defined
+    elif type(PID) == int: return PID                       #already in int format, no need to convert
+    try: return int(str(PID).strip(), 0)                    #base-0 handles '0x' hex and plain decimal strings
+    except ValueError: return None                          #if unknown, return None
+
+def CANdecode_key(PID, ext=False):
+    """function builds the unique lookup key for a PID. Standard and extended frames can have the same
+    numerical PID so the extended frame flag is added to the key.
+
+    :param PID: CAN PID
+    :type PID: `integer`
+    :param ext: frame uses an extended PID
+    :type ext: `boolean`
+    :returns: PID lookup key
+    :rtype: `integer`
+    """
+    return PID | (CANdecode_extFlag if ext else 0)
+
+def CANdecode_chk_numpy():
+    """function checks that the NumPy package is available, as it is required for decoding. If it is not
+    available, an import error is raised with a message indicating how to resolve it."""
+    if np is None: raise ImportError('The NumPy package is required for CAN decoding. Install with "pip install numpy"')
+
+class CAN_decodeGroup:
+    """class contains the pre-calculated decode definition for all CAN channels that share a single PID.
+    The frames of each channel are converted into a weight matrix so that all channels of the PID can be
+    decoded with a single matrix multiply."""
+    def __init__(self, key, channels):
+        """
+        :param key: PID lookup key (see `CANdecode_key`)
+        :type key: `integer`
+        :param channels: CAN channel definitions that share the PID
+        :type channels: `list` of `CAN_ch`
+        """
+        self.key = key                                          #PID lookup key
+        self.names = [ch.name for ch in channels]               #channel names, in decode column order
+        self.frames = []                                        #0-indexed byte list for each channel
+        self.min_dlc = []                                       #min received DLC required to decode each channel
+
+        for ch in channels:
+            frm_idx = [int(f) - 1 for f in ch.frames]           #configured frames are 1-indexed
+            self.frames.append(frm_idx)
+            self.min_dlc.append(max(frm_idx) + 1)
+
+        #--float math is exact for up to 6 combined bytes (53-bit mantissa), otherwise use integer shifts
+        self.exact_float = all(len(f) <= CANdecode_maxExact for f in self.frames)
+
+        #--weight matrix. first listed frame is the most significant byte
+        self.weights = np.zeros((CANdecode_maxDLC, len(channels)), dtype=np.float64)
+        for col, frm_idx in enumerate(self.frames):
+            for pos, byte in enumerate(frm_idx):
+                self.weights[byte, col] += float(256 ** (len(frm_idx) - pos - 1))
+
+        self.scalar = np.array([float(ch.scalar) for ch in channels], dtype=np.float64) #per-channel scalar
+        self.offset = np.array([float(ch.offset) for ch in channels], dtype=np.float64) #per-channel offset
+        self.min_dlc = np.array(self.min_dlc, dtype=np.int64)
+
+    def raw_values(self, data):
+        """function calculates the raw (un-scaled) value of every channel in the group
+
+        :param data: frame data bytes, one row per received message
+        :type data: `np.ndarray` uint8 of shape (num_msgs, 8)
+        :returns: raw channel values, one column per channel
+        :rtype: `np.ndarray` float64 of shape (num_msgs, num_channels)
+        """
+        if self.exact_float: return data.astype(np.float64) @ self.weights     #all channels at once
+
+        raw = np.empty((data.shape[0], len(self.names)), dtype=np.float64)     #combine with integer shifts
+        for col, frm_idx in enumerate(self.frames):
+            tmp_val = np.zeros(data.shape[0], dtype=np.uint64)
+            for byte in frm_idx:
+                tmp_val = (tmp_val << np.uint64(8)) | data[:, byte].astype(np.uint64)
+            raw[:, col] = tmp_val
+        return raw
+
+    def decode(self, data, dlc=None):
+        """function calculates the engineering value of every channel in the group. Value is calculated as
+        (raw * scalar) + offset. If the received DLC is passed, messages that are too short for a channel
+        are marked invalid for that channel.
+
+        :param data: frame data bytes, one row per received message
+        :type data: `np.ndarray` uint8 of shape (num_msgs, 8)
+        :param dlc: (optional) received DLC of each message
+        :type dlc: `np.ndarray` int of shape (num_msgs,)
+        :returns: tuple of the channel values and a valid mask, both shape (num_msgs, num_channels)
+        :rtype: (`np.ndarray` float64, `np.ndarray` bool)
+        """
+        vals = self.raw_values(data)                            #raw values
+        vals *= self.scalar                                     #apply scalar
+        vals += self.offset                                     #and offset
+
+        if dlc is None: valid = np.ones(vals.shape, dtype=bool) #no DLC info, all values are valid
+        else: valid = dlc[:, None] >= self.min_dlc[None, :]     #message long enough for each channel
+        return vals, valid
+
+class CAN_decoder:
+    """class is the vectorized CAN decode engine. The configured CAN channels are grouped by PID on creation,
+    then batches of raw frames can be decoded into the values for every channel."""
+    def __init__(self, data_ch):
+        """
+        :param data_ch: dict of defined CAN channels, typically `CAN_core.data_ch`
+        :type data_ch: {ch_NAME \\: `CAN_ch`}
+        """
+        CANdecode_chk_numpy()                                   #numpy is required for the decoder
+
+        self.groups = []                                        #list of decode groups, one per PID
+        self.skipped = {}                                       #channels that couldn't be decoded. Format is {name: reason}
+        self.keys = None                                        #sorted PID keys of the groups
+        self.build_groups(data_ch)
+
+    def build_groups(self, data_ch):
+        """function groups the passed CAN channels by PID and builds the decode groups. Any channel that
+        does not have a usable definition is skipped and added to the skipped dict with the reason.
+
+        :param data_ch: dict of defined CAN channels
+        :type data_ch: {ch_NAME \\: `CAN_ch`}
+        """
+        tmp_groups = {}                                         #temp dict of channels by PID key
+        for name, ch in data_ch.items():
+            PID = CANdecode_PID(ch.PID)
+            if PID is None: self.skipped.update({name:'PID is undefined or not a valid number'}); continue
+            if not ch.frames: self.skipped.update({name:'No frames are defined'}); continue
+            if min(ch.frames) < 1 or max(ch.frames) > CANdecode_maxDLC:
+                self.skipped.update({name:'Frames must be in the range 1-' + str(CANdecode_maxDLC)}); continue
+            if ch.scalar is None or ch.offset is None:
+                self.skipped.update({name:'Scalar or offset is undefined'}); continue
+            tmp_groups.setdefault(CANdecode_key(PID, ch.ext), []).append(ch)
+
+        keys = sorted(tmp_groups)                               #keep groups sorted by key for searchsorted lookups
+        self.groups = [CAN_decodeGroup(k, tmp_groups[k]) for k in keys]
+        self.keys = np.array(keys, dtype=np.int64)
+
+    def decode(self, ids, data, ext=None, dlc=None):
+        """function decodes a batch of raw CAN frames. Frames are grouped by PID with a single sort, then
+        each group is decoded at once. Frames with a PID that isn't used by a channel are ignored.
+
+        :param ids: PID of each frame
+        :type ids: `np.ndarray` int of shape (num_msgs,)
+        :param data: frame data bytes. Shorter frames should be zero padded
+        :type data: `np.ndarray` uint8 of shape (num_msgs, 8)
+        :param ext: (optional) frame uses an extended PID. If not passed, PIDs over 0x7FF are treated as extended
+        :type ext: `np.ndarray` bool of shape (num_msgs,)
+        :param dlc: (optional) received DLC of each frame
+        :type dlc: `np.ndarray` int of shape (num_msgs,)
+        :returns: dict of decoded values. Rows are the indices into the passed batch for each value
+        :rtype: `dictionary` {ch_NAME: (rows, values)}
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        data = np.asarray(data, dtype=np.uint8)
+        if ext is None: ext = ids > 0x7FF                       #no ext info, infer from the PID size
+        keys = ids | np.where(np.asarray(ext, dtype=bool), CANdecode_extFlag, 0)
+        if dlc is not None: dlc = np.asarray(dlc, dtype=np.int64)
+
+        tmp_result = {}
+        if len(self.groups) == 0 or len(ids) == 0:              #nothing to decode
+            for grp in self.groups:
+                for name in grp.names: tmp_result.update({name:(np.empty(0, dtype=np.int64), np.empty(0))})
+            return tmp_result
+
+        #--find the decode group of each frame. Frames with an unused PID get the group count (ignored)
+        grp_idx = np.searchsorted(self.keys, keys)
+        grp_idx[grp_idx == len(self.keys)] = 0                  #out of range lookups, checked below
+        grp_idx[self.keys[grp_idx] != keys] = len(self.keys)
+        if len(self.keys) < 0xFFFF: grp_idx = grp_idx.astype(np.uint16)  #small int type lets numpy use a radix sort
+
+        order = np.argsort(grp_idx, kind='stable')              #sort once, keeps time order within a group
+        bounds = np.searchsorted(grp_idx[order], np.arange(len(self.keys) + 1))
+
+        for i, grp in enumerate(self.groups):
+            rows = order[bounds[i]:bounds[i+1]]                 #batch rows for this PID
+            vals, valid = grp.decode(data[rows], None if dlc is None else dlc[rows])
+            for col, name in enumerate(grp.names):
+                tmp_result.update({name:(rows[valid[:, col]], vals[valid[:, col], col])})
+        return tmp_result
+
+    def decode_stats(self, ids, data, ext=None, dlc=None):
+        """function decodes a batch of raw CAN frames and summarizes the result of each channel. This is
+        useful for checking channel definitions against a CAN log.
+
+        :returns: dict of channel statistics
+        :rtype: `dictionary` {ch_NAME: {'count':int, 'min':float, 'max':float, 'mean':float}}
+        """
+        tmp_stats = {}
+        for name, (rows, vals) in self.decode(ids, data, ext, dlc).items():
+            if len(vals) == 0: tmp_stats.update({name:{'count':0, 'min':None, 'max':None, 'mean':None}})
+            else: tmp_stats.update({name:{'count':len(vals),
+                                          'min':float(vals.min()),
+                                          'max':float(vals.max()),
+                                          'mean':float(vals.mean())}})
+        return tmp_stats
+
+    def chk_log_errs(self, ids, data, ext=None, dlc=None):
+        """function checks the channel definitions against a batch of logged frames. Any channel that is
+        never received, is received with a shorter DLC than the channel frames require, or can't be decoded
+        is added to the error dict. The format matches the other configuration error checks.
+
+        :returns: dict of channels with errors
+        :rtype: `dictionary` {ch_NAME:"error message"}
+        """
+        tmp_err_list = {}   #temp dict for compiling errors
+        for name, reason in self.skipped.items(): tmp_err_list.update({name:reason})
+
+        stats = self.decode_stats(ids, data, ext, dlc)
+        if dlc is not None: all_rx = self.decode(ids, data, ext)    #decode without the DLC check for comparison
+        for name, stat in stats.items():
+            if stat['count'] == 0:
+                if dlc is not None and len(all_rx[name][0]) > 0:
+                    tmp_err_list.update({name:'PID is received but DLC is too short for the defined frames'})
+                else: tmp_err_list.update({name:'PID is not received in the log'})
+        return tmp_err_list
@@ -0,0 +1,178 @@
+"""
+File:       CAN_filter.py
+Function:   This file handles building the hardware CAN acceptance filters used when the CAN RX filter
+            (`CAN_core.rx_filter`) is enabled. CAN controllers only have a few (id, mask) filter slots, where
+            a frame is accepted if (frame_PID & mask) == (id & mask). The PIDs of the defined CAN channels
+            are combined into the fewest filters that fit in the available slots, and the number of extra
+            (unused) PIDs the filters let through is reported as the false-accept rate.
+
+            Filters are combined greedily: each PID starts as its own exact filter, then the pair of filters
+            that adds the fewest false-accepts when combined is merged until the filters fit in the slots.
+            Standard and extended PIDs can't share a filter, so if both are used and there's only one slot,
+            a single accept-all filter (mask 0) is used instead. A mask 0 filter accepts every frame, standard
+            or extended, and is written with the "ACCEPT_ALL" attribute set on the filters block.
+
+            NOTE: like CAN_decode.py, this file does not import any of the tkinter based application files
+            so it can be shared as-is with the dash application.
+"""
+
+import heapq
+from .CAN_decode import CANdecode_PID
+
+#---filter constants
+CANfltr_dfltSlots = 8           #default number of hardware filter slots available on the CAN controller
+CANfltr_bits = {False: 11,      #number of PID bits. Format is {ext: num_bits}
+                True: 29}
+
+class CAN_fltr:
+    """class contains a single hardware acceptance filter"""
+    def __init__(self, PID, mask, ext):
+        """
+        :param PID: filter PID
+        :type PID: `integer`
+        :param mask: filter mask. Only bits set in the mask are compared
+        :type mask: `integer`
+        :param ext: filter is for extended PIDs
+        :type ext: `boolean`
+        """
+        self.PID = PID & mask       #filter PID, don't care bits cleared
+        self.mask = mask            #filter mask
+        self.ext = ext              #extended PID filter
+
+    def accepts(self, PID):
+        """function checks if the filter accepts the passed PID
+
+        :param PID: CAN PID
+        :type PID: `integer`
+        :rtype: `boolean`
+        """
+        return (PID & self.mask) == self.PID
+
+    def num_accepted(self):
+        """function returns the number of PIDs the filter accepts
+
+        :rtype: `integer`
+        """
+        return 1 << (CANfltr_bits[self.ext] - bin(self.mask).count('1'))
+
+    def merge(self, other):
+        """function returns the smallest filter that accepts all PIDs of this filter and the passed filter.
+        Any bit that is masked in only one filter, or that differs between the filter PIDs, is cleared from
+        the mask.
+
+        :param other: filter to combine with
+        :type other: `CAN_fltr`
+        :rtype: `CAN_fltr`
+        """
+        mask = self.mask & other.mask & ~(self.PID ^ other.PID)
+        return CAN_fltr(self.PID, mask, self.ext)
+
+    def covers(self, other):
+        """function checks if this filter accepts every PID the passed filter accepts
+
+        :rtype: `boolean`
+        """
+        return (self.ext == other.ext and (self.mask & other.mask) == self.mask
+                and (other.PID & self.mask) == self.PID)
+
+class CAN_fltrOptimizer:
+    """class builds the acceptance filters for the defined CAN channels and reports the false-accept rate"""
+    def __init__(self, data_ch, slots=CANfltr_dfltSlots):
+        """
+        :param data_ch: dict of defined CAN channels, typically `CAN_core.data_ch`
+        :type data_ch: {ch_NAME \\: `CAN_ch`}
+        :param slots: (optional) number of hardware filter slots
+        :type slots: `integer`
+        """
+        self.slots = max(int(slots), 1)                         #available filter slots
+        self.PIDs = {False: set(), True: set()}                 #PIDs to accept. Format is {ext: set(PID)}
+        self.accept_all = False                                 #filters accept every frame, PIDs didn't fit in the slots
+        for ch in data_ch.values():
+            PID = CANdecode_PID(ch.PID)
+            if PID is not None: self.PIDs[bool(ch.ext)].add(PID)
+        self.filters = self.optimize()                          #resulting filters
+
+    def cost(self, fltr):
+        """function returns the merge cost of a filter. The cost is the fraction of the PID space that the
+        filter accepts, so standard and extended filters can be compared with each other.
+
+        :rtype: `float`
+        """
+        return fltr.num_accepted() / (1 << CANfltr_bits[fltr.ext])
+
+    def optimize(self):
+        """function combines the PIDs into the fewest filters that fit in the available slots. Merge costs
+        are kept in a heap, and entries for filters that have already been merged are skipped when popped.
+
+        :returns: list of filters
+        :rtype: `list` of `CAN_fltr`
+        """
+        tmp_fltrs = {}                                          #current filters. Format is {fltr_idx: CAN_fltr}
+        heap = []                                               #merge candidates as (added_cost, idx_a, idx_b)
+        def add_fltr(idx, fltr):                                #add a filter and its merge costs with all current filters
+            for j, f in tmp_fltrs.items():
+                if f.ext == fltr.ext:
+                    heapq.heappush(heap, (self.cost(fltr.merge(f)) - self.cost(fltr) - self.cost(f), j, idx))
+            tmp_fltrs.update({idx: fltr})
+
+        next_idx = 0
+        for ext, PIDs in self.PIDs.items():                     #start with an exact filter for each PID
+            full_mask = (1 << CANfltr_bits[ext]) - 1
+            for PID in sorted(PIDs): add_fltr(next_idx, CAN_fltr(PID, full_mask, ext)); next_idx += 1
+
+        while len(tmp_fltrs) > self.slots and heap:
+            added, i, j = heapq.heappop(heap)
+            if i not in tmp_fltrs or j not in tmp_fltrs: continue   #stale entry, already merged
+            new = tmp_fltrs.pop(i).merge(tmp_fltrs.pop(j))
+            for k in [k for k, f in tmp_fltrs.items() if new.covers(f)]: tmp_fltrs.pop(k)   #drop covered filters
+            add_fltr(next_idx, new); next_idx += 1
+
+        if len(tmp_fltrs) > self.slots:                         #standard and extended PIDs but only 1 slot
+            self.accept_all = True
+            return [CAN_fltr(0, 0, False)]                      #can't filter, accept everything
+        return sorted(tmp_fltrs.values(), key=lambda f: (f.ext, f.PID))
+
+    def false_accepts(self, ext):
+        """function counts the PIDs accepted by the filters that aren't used by a CAN channel. Standard PIDs
+        are counted exactly, extended PIDs are the upper bound (filters are assumed not to overlap).
+
+        :param ext: count the extended PIDs
+        :type ext: `boolean`
+        :rtype: `integer`
+        """
+        fltrs = [f for f in self.filters if f.ext == ext]
+        if self.accept_all: return (1 << CANfltr_bits[ext]) - len(self.PIDs[ext])     #everything accepted
+        if not ext:
+            return sum(1 for PID in range(1 << CANfltr_bits[ext])
+                       if PID not in self.PIDs[ext] and any(f.accepts(PID) for f in fltrs))
+        return sum(f.num_accepted() for f in fltrs) - len(self.PIDs[ext])
+
+    def false_accept_rate(self, ext):
+        """function returns the fraction of unused PIDs that are accepted by the filters
+
+        :param ext: rate for the extended PIDs
+        :type ext: `boolean`
+        :rtype: `float` from 0 to 1
+        """
+        unused = (1 << CANfltr_bits[ext]) - len(self.PIDs[ext])
+        if unused == 0: return 0.0
+        return self.false_accepts(ext) / unused
+
+    def report(self):
+        """function builds a text summary of the filters, typically for the CLI
+
+        :returns: filter summary
+        :rtype: `string`
+        """
+        tmp_rpt = 'CAN RX filters: {} of {} slots used\n'.format(len(self.filters), self.slots)
+        if self.accept_all:
+            tmp_rpt += '  Standard and extended PIDs can\'t share a single slot, the filter accepts every frame\n'
+        for f in self.filters:
+            tmp_rpt += '  {} PID {:>10}  mask {:>10}  accepts {}\n'.format('ALL' if self.accept_all else 'EXT' if f.ext else 'STD', hex(f.PID),
+                                                                       hex(f.mask), 'every frame' if self.accept_all else f.num_accepted())
+        for ext in (False, True):
+            if self.PIDs[ext]:
+                tmp_rpt += '{} PIDs: {} used, {} false-accepts ({:.4f}% of unused PIDs)\n'.format(
+                    'Extended' if ext else 'Standard', len(self.PIDs[ext]),
+                    self.false_accepts(ext), 100 * self.false_accept_rate(ext))
+        return tmp_rpt
@@ -0,0 +1,213 @@
+"""
+File:       CAN_log.py
+Function:   This file handles reading recorded CAN log files so they can be decoded using the defined CAN
+            channels (see CAN_decode.py). Log files are memory-mapped and read lazily in batches, so even
+            very long logs (like an hour-long race log) are never loaded into memory all at once.
+
+            Supported log formats are:
+                ~candump log files (candump -l):        (1436509052.249713) can0 123#11223344
+                ~candump console output (candump -ta):  (1436509052.249713)  can0  123   [4]  11 22 33 44
+                ~Vector ASC files:                      0.001234 1  123             Rx   d 4 11 22 33 44
+
+            NOTE: like CAN_decode.py, this file does not import any of the tkinter based application files
+            so it can be shared as-is with the dash application.
+"""
+
+import mmap
+from .CAN_decode import np, CANdecode_chk_numpy, CANdecode_maxDLC
+
+#---log reader constants
+CANlog_types = {'CANDUMP': 1,   #candump log file format
+                'CONSOLE': 2,   #candump console output format
+                'ASC': 3}       #vector ASC format
+
+CANlog_batchSz = 100000         #default max number of frames returned in a single batch
+CANlog_dfltPeriod = 0.001       #time step (in sec) between frames if the log has no timestamps
+CANlog_detectLines = 50         #number of lines checked when detecting the log format
+
+class CANlog_reader:
+    """class reads a CAN log file in batches. The file is memory-mapped and only the lines for the current
+    batch are parsed, then returned as NumPy arrays that can be passed directly to the `CAN_decoder`."""
+    def __init__(self, filepath):
+        """
+        :param filepath: absolute path to the log file
+        :type filepath: `string`
+        """
+        CANdecode_chk_numpy()                                   #numpy is required for the log batches
+
+        self.filepath = filepath                                #log file path
+        self.log_type = None                                    #log format, see `CANlog_types`
+        self.base = 16                                          #number base of the PID and data (ASC can be dec)
+        self.pos = 0                                            #current read position in the file
+        self.eof = False                                        #end of the log file has been reached
+        self.pending = None                                     #parsed frame that was read past a batch time limit
+        self.t_start = None                                     #timestamp of the first frame in the log
+        self.last_ts = None                                     #timestamp of the last frame read
+        self.num_read = 0                                       #number of frames read
+
+        self.file = open(filepath, 'rb')
+        try: self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)   #map the file, not read it
+        except ValueError: self.mm = None                       #empty files can't be mapped
+        self.size = 0 if self.mm is None else len(self.mm)      #size of the log file in bytes
+
+        if self.mm is None: self.eof = True
+        else:
+            self.detect_format()                                #determine the type of log
+            self.t_start = self.first_timestamp()               #get the log start time
+
+    def close(self):
+        """function closes the memory map and the file"""
+        if self.mm is not None: self.mm.close(); self.mm = None
+        self.file.close()
+
+    def rewind(self):
+        """function resets the reader back to the start of the log file"""
+        self.pos = 0
+        self.eof = self.mm is None
+        self.pending = None
+        self.last_ts = None
+        self.num_read = 0
+
+    def progress(self):
+        """function returns how much of the log file has been read
+
+        :returns: fraction of the log file read
+        :rtype: `float` from 0 to 1
+        """
+        if self.size == 0: return 1.0
+        return self.pos / self.size
+
+    def readline(self):
+        """function reads the next line from the memory mapped file. Only this line is copied out of the map.
+
+        :returns: the next line, or None at the end of the file
+        :rtype: `bytes`
+        """
+        if self.pos >= self.size: return None
+        end = self.mm.find(b'\n', self.pos)                     #find the end of the line
+        if end < 0: end = self.size
+        line = self.mm[self.pos:end]
+        self.pos = end + 1
+        return line
+
+    def detect_format(self):
+        """function checks the first lines of the log file to determine the log format. For ASC files, the
+        number base defined in the file header is also read."""
+        self.pos = 0
+        for i in range(CANlog_detectLines):
+            line = self.readline()
+            if line is None: break
+            line = line.strip()
+            if line.startswith(b'base '):                       #ASC header, like "base hex  timestamps absolute"
+                self.log_type = CANlog_types['ASC']
+                self.base = 10 if line.split()[1] == b'dec' else 16
+            elif self.log_type is None and b'#' in line and line.startswith(b'('):
+                self.log_type = CANlog_types['CANDUMP']; break
+            elif self.log_type is None and b'[' in line and b']' in line:
+                self.log_type = CANlog_types['CONSOLE']; break
+            elif self.log_type is None and line.lower().startswith((b'date', b'begin triggerblock')):
+                self.log_type = CANlog_types['ASC']
+        if self.log_type is None: self.log_type = CANlog_types['ASC']  #default to ASC if nothing else matched
+        self.pos = 0
+
+    def first_timestamp(self):
+        """function finds the timestamp of the first frame in the log, then resets the read position
+
+        :returns: first timestamp in seconds
+        :rtype: `float`
+        """
+        tmp_ts = None
+        while True:
+            frame = self.parse_line(self.readline())
+            if frame is False: break                            #end of file
+            if frame is not None: tmp_ts = frame[0]; break
+        self.rewind()
+        return tmp_ts
+
+    def parse_line(self, line):
+        """function parses a single log line into a frame. Lines that aren't a data frame (like comments,
+        headers, error frames or remote requests) are skipped.
+
+        :param line: log line
+        :type line: `bytes`
+        :returns: frame as (timestamp, PID, ext, dlc, data_bytes), None if the line is skipped, or False at the end of the file
+        :rtype: `tuple`
+        """
+        if line is None: return False
+        try:
+            if self.log_type == CANlog_types['CANDUMP']: return self.parse_candump(line)
+            elif self.log_type == CANlog_types['CONSOLE']: return self.parse_console(line)
+            else: return self.parse_ASC(line)
+        except (ValueError, IndexError): return None            #malformed line, skip it
+
+    def parse_candump(self, line):
+        """function parses a candump log file line, like "(1436509052.249713) can0 123#11223344"
+        """
+        parts = line.split()
+        if len(parts) < 3 or b'#' not in parts[2]: return None
+        ts = float(parts[0].strip(b'()'))
+        PID_str, data_str = parts[2].split(b'#', 1)
+        if data_str.startswith((b'R', b'#')): return None       #remote request or CAN FD frame
+        data = bytes.fromhex(data_str.replace(b'.', b'').decode())
+        return ts, int(PID_str, 16), len(PID_str) > 3, len(data), data
+
+    def parse_console(self, line):
+        """function parses a candump console output line, like "(1436509052.249713)  can0  123   [4]  11 22 33 44".
+        If the line has no timestamp, then a fixed time step is used between frames."""
+        parts = line.split()
+        ts = None
+        if parts and parts[0].startswith(b'('): ts = float(parts.pop(0).strip(b'()'))
+        if len(parts) < 3 or not parts[2].startswith(b'['): return None
+        if b'remote' in line: return None                       #remote request
+        dlc = int(parts[2].strip(b'[]'))
+        data = bytes(int(b, 16) for b in parts[3:3+dlc])
+        if ts is None: ts = self.num_read * CANlog_dfltPeriod   #no timestamps, use a fixed step
+        return ts, int(parts[1], 16), len(parts[1]) > 3, dlc, data
+
+    def parse_ASC(self, line):
+        """function parses a Vector ASC line, like "0.001234 1  123             Rx   d 4 11 22 33 44".
+        Extended PIDs are marked with a trailing "x"."""
+        parts = line.split()
+        if len(parts) < 6 or parts[3] not in (b'Rx', b'Tx') or parts[4] != b'd': return None
+        ts = float(parts[0])
+        PID_str = parts[2]
+        ext = PID_str.endswith((b'x', b'X'))
+        PID = int(PID_str.rstrip(b'xX'), self.base)
+        dlc = int(parts[5], 16)
+        data = bytes(int(b, self.base) for b in parts[6:6+dlc])
+        return ts, PID, ext, dlc, data
+
+    def read_batch(self, max_msgs=CANlog_batchSz, t_end=None):
+        """function reads the next batch of frames from the log. The batch ends after the max number of
+        frames, or when a frame is past the passed end time (relative to the start of the log).
+
+        :param max_msgs: (optional) max number of frames to read
+        :type max_msgs: `int`
+        :param t_end: (optional) end time of the batch, in seconds from the start of the log
+        :type t_end: `float`
+        :returns: tuple of arrays (timestamps, PIDs, ext, dlc, data). Timestamps are relative to the start of the log
+        :rtype: (`np.ndarray` float64, int64, bool, int64, uint8 of shape (num_msgs, 8))
+        """
+        tmp_ts = []; tmp_ids = []; tmp_ext = []; tmp_dlc = []
+        tmp_data = bytearray()                                  #data bytes, zero padded to 8 per frame
+        t0 = self.t_start or 0.0
+
+        while len(tmp_ts) < max_msgs:
+            if self.pending is not None: frame = self.pending; self.pending = None
+            else: frame = self.parse_line(self.readline())
+            if frame is False: self.eof = True; break           #end of file
+            if frame is None: continue                          #skipped line
+            if t_end is not None and frame[0] - t0 > t_end:     #past the batch time, save for the next batch
+                self.pending = frame; break
+
+            ts, PID, ext, dlc, data = frame
+            tmp_ts.append(ts - t0); tmp_ids.append(PID); tmp_ext.append(ext); tmp_dlc.append(dlc)
+            tmp_data += data[:CANdecode_maxDLC].ljust(CANdecode_maxDLC, b'\x00')
+            self.num_read += 1
+
+        if tmp_ts: self.last_ts = tmp_ts[-1]
+        return (np.array(tmp_ts, dtype=np.float64),
+                np.array(tmp_ids, dtype=np.int64),
+                np.array(tmp_ext, dtype=bool),
+                np.array(tmp_dlc, dtype=np.int64),
+                np.frombuffer(bytes(tmp_data), dtype=np.uint8).reshape(-1, CANdecode_maxDLC))
@@ -0,0 +1,247 @@
+"""
+File:       CAN_replay.py
+Function:   This file handles replaying a recorded CAN log through the defined CAN channels and displaying the
+            result live in the dash editor. The log is read lazily (see CAN_log.py), decoded with the channel
+            decoder (see CAN_decode.py), and the elements of the currently displayed page are updated at the
+            dash refresh rate, similar to how they would be shown on the dash.
+"""
+from .sys import *
+from .com_defs import int_str, updPages, gauge_angle, gauge_point   #needed for element values, restoring pages, and gauge needles
+from .CAN_decode import CAN_decoder
+from .CAN_log import CANlog_reader
+
+#---replay constants
+CANreplay_speeds = {'0.25x': 0.25,      #playback speed options. Format is {display_name: speed multiplier}
+                    '0.5x': 0.5,
+                    '1x': 1.0,
+                    '2x': 2.0,
+                    '4x': 4.0}
+
+#---alert levels
+Alert_lvl = {'NONE': 0,     #value is within the normal range
+             'WARN': 1,     #value is in the warning range
+             'DNGR': 2}     #value is in the danger range
+
+def CANreplay_fmt(val, sigdig):
+    """function formats a decoded value for display in a data label, using the label significant digits
+    (number of digits after the decimal)
+
+    :param val: value to format
+    :type val: `float`
+    :param sigdig: number of digits after the decimal
+    :type sigdig: `int` or `string`
+    :returns: formatted value
+    :rtype: `string`
+    """
+    digits = int_str(sigdig) or 0                   #default to no decimal if not defined
+    return '{:.{}f}'.format(val, max(int(digits), 0))
+
+def CANreplay_alert(ele_cfg, val):
+    """function finds the alert level of the passed value using the warning/danger limits of the element.
+    If warnings are not enabled for the element, no alert is returned.
+
+    :param ele_cfg: element config with warning limits (data label or bar indicator)
+    :type ele_cfg: `Label_Data` or `Indicator_Bar`
+    :param val: current element value
+    :type val: `float`
+    :returns: alert level
+    :rtype: `Alert_lvl`
+    """
+    if not ele_cfg.warn_en: return Alert_lvl['NONE']
+    if ele_cfg.lim_DngrLo is not None and val <= ele_cfg.lim_DngrLo: return Alert_lvl['DNGR']
+    if ele_cfg.lim_DngrHi is not None and val >= ele_cfg.lim_DngrHi: return Alert_lvl['DNGR']
+    if ele_cfg.lim_WarnLo is not None and val <= ele_cfg.lim_WarnLo: return Alert_lvl['WARN']
+    if ele_cfg.lim_WarnHi is not None and val >= ele_cfg.lim_WarnHi: return Alert_lvl['WARN']
+    return Alert_lvl['NONE']
+
+class CAN_replay:
+    """class controls the replay of a CAN log into the dash editor. The log is advanced by one dash refresh
+    period per update, and the latest decoded value of every channel is used to draw the current page."""
+    def __init__(self, master):
+        self.master_ref = master            #master window ref
+        self.reader = None                  #log file reader
+        self.decoder = None                 #CAN channel decoder
+        self.values = {}                    #latest value of each channel. Format is {ch_NAME: value}
+        self.blt_state = {}                 #latest state of each bullet indicator. Format is {element_name: hi_state}
+        self.t_log = 0.0                    #current replay time, in seconds from the start of the log
+        self.speed = 1.0                    #playback speed multiplier
+        self.running = False                #replay is running
+        self.after_id = None                #scheduled update ref
+        self.upd_callback = None            #optional function called after each update (like a status display)
+
+    def load_log(self, filepath):
+        """function opens a CAN log for replay and builds the channel decoder from the current CAN channels
+
+        :param filepath: absolute path to the log file
+        :type filepath: `string`
+        """
+        self.stop()                                                 #stop and close any current log
+        if self.reader is not None: self.reader.close()
+        self.decoder = CAN_decoder(self.master_ref.cfg_CAN.data_ch) #build decoder from defined channels
+        self.reader = CANlog_reader(filepath)                       #open the log
+        self.values.clear(); self.blt_state.clear()
+        self.t_log = 0.0
+
+    def close(self):
+        """function stops the replay and closes the log"""
+        self.stop()
+        if self.reader is not None: self.reader.close()
+        self.reader = None
+
+    def refresh_ms(self):
+        """function returns the dash refresh period, defaulting to the hardware default if not defined
+
+        :returns: refresh period in ms
+        :rtype: `int`
+        """
+        return int(int_str(self.master_ref.cfg_core.Refresh) or refrsh_rt)
+
+    def start(self):
+        """function starts (or resumes) the replay"""
+        if self.reader is None or self.running: return
+        if self.reader.eof and self.reader.pending is None:         #log was already finished, start over
+            self.reader.rewind(); self.values.clear(); self.blt_state.clear(); self.t_log = 0.0
+        self.running = True
+        self.replay_upd()
+
+    def pause(self):
+        """function pauses the replay, leaving the current values displayed"""
+        self.running = False
+        if self.after_id is not None:
+            self.master_ref.after_cancel(self.after_id)
+            self.after_id = None
+
+    def stop(self):
+        """function stops the replay, rewinds the log, and restores all pages to their configured state"""
+        was_active = self.running or bool(self.values)
+        self.pause()
+        if self.reader is not None: self.reader.rewind()
+        self.values.clear(); self.blt_state.clear()
+        self.t_log = 0.0
+        if was_active: updPages(self.master_ref)                    #restore the editor view of all pages
+
+    def replay_upd(self):
+        """function advances the replay by one refresh period. All frames in that period are decoded, the
+        channel values updated, and the current page redrawn. The next update is then scheduled."""
+        if not self.running: return
+        period = self.refresh_ms()
+        self.t_log += period / 1000 * self.speed                    #advance log time by one refresh
+
+        while True:                                                 #read all frames up to the new log time
+            ts, ids, ext, dlc, data = self.reader.read_batch(t_end=self.t_log)
+            if len(ts) > 0:
+                for name, (rows, vals) in self.decoder.decode(ids, data, ext, dlc).items():
+                    if len(vals) > 0: self.values[name] = float(vals[-1])   #keep the latest value
+            if self.reader.eof or self.reader.pending is not None: break
+
+        page = self.master_ref.editr_cntl.current_page
+        if page is not None and page.canvObj is not None: self.draw_page(page)
+        if self.upd_callback is not None: self.upd_callback()
+
+        if self.reader.eof and self.reader.pending is None: self.running = False   #end of log
+        else: self.after_id = self.master_ref.after(period, self.replay_upd)
+
+    def draw_page(self, page):
+        """function updates the dynamic elements on the passed page using the latest channel values.
+        Elements whose channel has not been received yet are left as-is.
+
+        :param page: dash page to update
+        :type page: `dash_page` class instance
+        """
+        for ele in page.Lbl_dat.values():
+            if ele.data_ch in self.values: self.draw_lblDat(ele, self.values[ele.data_ch])
+        for ele in page.Ind_blt.values():
+            if ele.data_ch in self.values: self.draw_indBlt(ele, self.values[ele.data_ch])
+        for ele in page.Ind_bar.values():
+            if ele.data_ch in self.values: self.draw_indBar(ele, self.values[ele.data_ch])
+        for ele in page.Ind_gau.values():
+            if ele.data_ch in self.values: self.draw_indGau(ele, self.values[ele.data_ch])
+
+    def alert_clr(self, alert):
+        """function returns the theme color for the passed alert level
+
+        :param alert: alert level
+        :type alert: `Alert_lvl`
+        :returns: HEX color, or None if no alert or the color is undefined
+        :rtype: `string`
+        """
+        thm = self.master_ref.cfg_theme
+        if alert == Alert_lvl['DNGR']: return thm.colors.get(thm.alert_dngr)
+        elif alert == Alert_lvl['WARN']: return thm.colors.get(thm.alert_warn)
+        return None
+
+    def draw_lblDat(self, ele_cfg, val):
+        """function updates a data label with the passed value. If the value is in a warning or danger range,
+        the background pad uses the alert color and the text uses the alert text color. If the label isn't
+        padded then the text uses the alert color instead.
+
+        :param ele_cfg: data label config
+        :type ele_cfg: `Label_Data`
+        :param val: current channel value
+        :type val: `float`
+        """
+        canv = ele_cfg.editor_canvObj
+        thm = self.master_ref.cfg_theme
+        fg_clr = thm.colors.get(ele_cfg.fill)                       #normal text and pad colors
+        pad_clr = thm.colors.get(ele_cfg.clr_bg)
+
+        alert_clr = self.alert_clr(CANreplay_alert(ele_cfg, val))
+        if alert_clr is not None:
+            if ele_cfg.padID is not None: pad_clr = alert_clr; fg_clr = thm.colors.get(thm.alert_FG, fg_clr)
+            else: fg_clr = alert_clr
+
+        canv.itemconfigure(ele_cfg.objID, text=CANreplay_fmt(val, ele_cfg.sigdig), fill=fg_clr)
+        if ele_cfg.padID is not None and pad_clr is not None: canv.itemconfigure(ele_cfg.padID, fill=pad_clr)
+
+    def draw_indBlt(self, ele_cfg, val):
+        """function updates a bullet indicator with the passed value. The indicator switches to the "hi" color
+        at or above the hi limit and back to the "lo" color at or below the lo limit.
+
+        :param ele_cfg: bullet indicator config
+        :type ele_cfg: `Indicator_Bullet`
+        :param val: current channel value
+        :type val: `float`
+        """
+        hi_state = self.blt_state.get(ele_cfg.name, False)         #between limits, keep the last state
+        if ele_cfg.lim_hi is not None and val >= ele_cfg.lim_hi: hi_state = True
+        elif ele_cfg.lim_lo is not None and val <= ele_cfg.lim_lo: hi_state = False
+        self.blt_state[ele_cfg.name] = hi_state
+
+        clr = self.master_ref.cfg_theme.colors.get(ele_cfg.clr_hi if hi_state else ele_cfg.clr_lo)
+        if clr is not None: ele_cfg.editor_canvObj.itemconfigure(ele_cfg.objID, fill=clr)
+
+    def draw_indBar(self, ele_cfg, val):
+        """function updates a bar indicator with the passed value. The bar is filled relative to the scale
+        lo/hi values. Wide bars fill left to right, tall bars fill bottom to top.
+
+        :param ele_cfg: bar indicator config
+        :type ele_cfg: `Indicator_Bar`
+        :param val: current channel value
+        :type val: `float`
+        """
+        lo = ele_cfg.scale_lo; hi = ele_cfg.scale_hi
+        if lo is None or hi is None or hi == lo: return             #scale is undefined
+        frac = min(max((val - lo) / (hi - lo), 0.0), 1.0)           #filled fraction of the bar
+
+        x0 = ele_cfg.x0; y0 = ele_cfg.y0
+        x1 = x0 + ele_cfg.width; y1 = y0 + ele_cfg.height
+        if ele_cfg.width >= ele_cfg.height: x1 = x0 + ele_cfg.width * frac     #horizontal bar
+        else: y0 = y1 - ele_cfg.height * frac                                  #vertical bar
+
+        clr = self.alert_clr(CANreplay_alert(ele_cfg, val)) or self.master_ref.cfg_theme.colors.get(ele_cfg.fill)
+        canv = ele_cfg.editor_canvObj
+        canv.coords(ele_cfg.objID, x0, y0, x1, y1)
+        if clr is not None: canv.itemconfigure(ele_cfg.objID, fill=clr)
+
+    def draw_indGau(self, ele_cfg, val):
+        """function updates the needle of a gauge indicator with the passed value. The needle angle is relative
+        to the scale lo/hi values.
+
+        :param ele_cfg: gauge indicator config
+        :type ele_cfg: `Indicator_Gauge`
+        :param val: current channel value
+        :type val: `float`
+        """
+        r = (ele_cfg.size or 0)/2; cx = ele_cfg.x0 + r; cy = ele_cfg.y0 + r
+        ang = gauge_angle(ele_cfg.ang_start or 0, ele_cfg.ang_sweep or 0, ele_cfg.scale_lo, ele_cfg.scale_hi, val)
+        ele_cfg.editor_canvObj.coords(ele_cfg.objID + '_ndl', cx, cy, *gauge_point(cx, cy, r*gauge_needleLen, ang))
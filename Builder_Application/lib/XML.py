@@ -10,6 +10,16 @@ from .com_defs import *
 import xml.etree.ElementTree as ET
 import zipfile as ZF
 import shutil as shutil
+from .CAN_busload import CANbus_load     #needed for CAN bus load checks
+from .CAN_filter import CAN_fltrOptimizer #needed for CAN RX hardware filters
+from .dash_render import render_plan     #needed for the compiled page render plan
+from .dash_cost import dash_frameCost    #needed for page frame time checks
+from .dash_bincfg import bincfg_encode, bincfg_verify    #needed for the binary dash config
+from .dash_manifest import *             #needed for the package manifest and delta packages
+from .dash_rawimg import rawimg_export, rawimg_name    #needed for the raw image blobs
+from .dash_glyph import glyph_bake       #needed for the data label glyph atlases
+from .dash_fontpkg import fontpkg_chars, fontpkg_bundle  #needed for the bundled fonts
+from .dash_gauge import gauge_bake         #needed for the gauge face and needle images
 
 def xmlfile_openDialogue(master):
     """function opens the file picker dialogue to open a saved XML file.
@@ -239,6 +249,15 @@ def parseXML_PAGES(block, master_ref):
                     tmp_bar_ele.master_ref = master_ref                         #set reference to main window
                     read_elm.update({lbl.attrib.get('NAME') : tmp_bar_ele})     #append data labels to read elements
             read_lbl.clear() #clear temp dict
+            for lbl_data in elmnts.findall('IND_GAU'):
+                for lbl in lbl_data:
+                    read_lbl.update({'NAME' : lbl.attrib.get('NAME')})
+                    for atributes in lbl:
+                        read_lbl.update({atributes.tag : atributes.text})
+                    tmp_gau_ele = Indicator_Gauge(**read_lbl)                   #instance element
+                    tmp_gau_ele.master_ref = master_ref                         #set reference to main window
+                    read_elm.update({lbl.attrib.get('NAME') : tmp_gau_ele})     #append gauges to read elements
+            read_lbl.clear() #clear temp dict
 
         read_frame.master_ref = master_ref      #set reference back to main window
         read_frame.update_eleCfg(read_elm)      #add frame elements
@@ -294,6 +313,8 @@ def editorXML_gen(master_ref, XMLmode):
             BULLET_IND
                 IND...n
             BAR_IND
+                IND...n
+            GAUGE_IND
                 IND...n"""
 
     dashCFG_tree = ET.ElementTree(dashCFG)  #make the tree
@@ -392,6 +413,16 @@ def genXML_CAN(root_XML, XMLmode, can_cfg):
                 if(atrb == 'frames'): sub.text = ",".join(str(e) for e in val)  #if frames attribute, then join
                 else: sub.text = xmlGen_str(val)                            #and set its value
 
+    if XMLmode == XMLgen_mode['DASH'] and can_cfg.rx_filter is True:   #dash config with RX filter, add hardware filters
+        CANcfg_fltr = ET.SubElement(CANcfg,'FILTERS')                       #add CAN filters subelement to CAN config
+        fltr_opt = CAN_fltrOptimizer(can_cfg.data_ch)
+        if fltr_opt.accept_all: CANcfg_fltr.set('ACCEPT_ALL', 'True')       #single mask 0 filter, accepts standard and extended frames
+        for fltr in fltr_opt.filters:                                       #cycle through optimized filters
+            fltr_ele = ET.SubElement(CANcfg_fltr, 'FLTR')                       #add filter
+            ET.SubElement(fltr_ele, 'PID').text = hex(fltr.PID)                 #filter PID
+            ET.SubElement(fltr_ele, 'MASK').text = hex(fltr.mask)               #filter mask
+            ET.SubElement(fltr_ele, 'EXT').text = xmlGen_str(fltr.ext)          #extended PID filter
+
 def genXML_PAGES(root_XML, XMLmode, page_cfg):
     """function generates the pages block for a PyDash editor config save file
     
@@ -427,6 +458,9 @@ def genXML_PAGES(root_XML, XMLmode, page_cfg):
         lbl_bar = ET.SubElement(elm, 'IND_BAR')
         genXML_elements(lbl_bar, XMLmode, dat.Ind_bar.items())       #add bar indicators
 
+        lbl_gau = ET.SubElement(elm, 'IND_GAU')
+        genXML_elements(lbl_gau, XMLmode, dat.Ind_gau.items())       #add gauge indicators
+
 def genXML_elements(xml_parent, XMLmode, elm_dict):
     """function generates the elements block for a PyDash editor config save file - this is specific
     to the `pages` configuration and contains all the elements on a page.
@@ -462,12 +496,99 @@ def XML_dashCFG_checkErrs(master_ref):
     tmp_err_str.update(master_ref.cfg_theme.XML_dashCFG_checkErrs())    #append any theme errors
     tmp_err_str.update(master_ref.cfg_core.XML_dashCFG_checkErrs())     #append any core config errors
     tmp_err_str.update(master_ref.cfg_CAN.XML_dashCFG_checkErrs())      #append any CAN config errors
+    tmp_err_str.update(CANbus_load(master_ref.cfg_CAN, master_ref.cfg_CAN.bitrate,
+                                   master_ref.cfg_core.Refresh).XML_dashCFG_checkErrs())   #append any CAN bus load errors
     for cfg in master_ref.cfg_pages.values():
         tmp_err_str.update(cfg.XML_dashCFG_checkErrs())                 #append any page config errors
+    if not tmp_err_str:                                                 #the estimate compiles the pages, so only once the rest is valid
+        tmp_err_str.update(dash_frameCost(master_ref).XML_dashCFG_checkErrs())  #append any page frame time errors
 
     return tmp_err_str
 
-def genXML_DashCFG(master, tmp_assy_dir):
+def XML_dashCFG_checkExt(master_ref):
+    """function checks only the parts of the dash config that depend on files outside the config file, which are
+    the theme fonts and images. Used for a config restored from the config cache (see cfg_cache.py) that passed
+    the full check when it was cached, the rest of the config is unchanged since.
+
+    :param master: reference back to the main/master window
+    :type master: `tk.window` ref
+    :returns: dict of errors - empty dict returned if no errors
+    :rtype: {'issue_location':'issue description'}
+    """
+    return master_ref.cfg_theme.XML_dashCFG_checkErrs()                 #theme errors, fonts and image files
+
+def renderXML_gen(plan):
+    """function builds the render plan XML file from a compiled render plan. Each page is a flat list of draw
+    items in z-order, with all named references already resolved (see dash_render.py)
+
+    :param plan: compiled render plan
+    :type plan: `render_plan`
+    :returns: generated XML file element tree
+    :rtype: XML ET.file() object
+    """
+    renderCFG = ET.Element('RENDER')                    #define the root element
+
+    render_ch = ET.SubElement(renderCFG, 'CHANNELS')    #add used CAN channels
+    for idx, dat in enumerate(plan.channels):
+        ch = ET.SubElement(render_ch, 'CH')                 #add can channel
+        ch.set('IDX', str(idx))                             #set channel index, used by the draw items
+        ch.set('NAME', dat.name)                            #set channel name
+        for atrb in dat.fields_dashCFG:
+            sub = ET.SubElement(ch, atrb.upper())
+            val = getattr(dat, atrb)
+            if(atrb == 'frames'): sub.text = ",".join(str(e) for e in val)  #if frames attribute, then join
+            else: sub.text = xmlGen_str(val)
+
+    render_atlas = ET.SubElement(renderCFG, 'ATLASES')  #add data label glyph atlases
+    for idx, atlas in enumerate(plan.atlases):
+        atl = ET.SubElement(render_atlas, 'ATLAS')
+        atl.set('IDX', str(idx))                            #set atlas index, used by the draw items
+        for atrb in ('image', 'font_file', 'font_px', 'width', 'height', 'ascent', 'descent'):
+            ET.SubElement(atl, atrb.upper()).text = xmlGen_str(getattr(atlas, atrb))
+        for char, metrics in atlas.glyphs.items():
+            glyph = ET.SubElement(atl, 'GLYPH')
+            glyph.set('CHR', char)
+            for atrb, val in zip(('X', 'Y', 'W', 'H', 'XOFF', 'YOFF', 'ADV'), metrics): glyph.set(atrb, str(val))
+
+    render_sprite = ET.SubElement(renderCFG, 'SPRITES') #add gauge needle sprite sheets
+    for idx, sprite in enumerate(plan.sprites):
+        spr = ET.SubElement(render_sprite, 'SPRITE')
+        spr.set('IDX', str(idx))                            #set sprite sheet index, used by the draw items
+        for atrb in ('image', 'width', 'height'):
+            ET.SubElement(spr, atrb.upper()).text = xmlGen_str(getattr(sprite, atrb))
+        ET.SubElement(spr, 'FRAMES').text = xmlGen_str(len(sprite.frames))
+        for metrics in sprite.frames:                       #in needle angle order, lower bound of the scale first
+            frm = ET.SubElement(spr, 'FRM')
+            for atrb, val in zip(('X', 'Y', 'W', 'H', 'XOFF', 'YOFF'), metrics): frm.set(atrb, str(val))
+
+    render_pgs = ET.SubElement(renderCFG, 'FRAMES')     #add compiled pages
+    for name, page in plan.pages.items():
+        frm = ET.SubElement(render_pgs, 'FRM')              #add page
+        frm.set('NAME', name)                               #set name
+        ET.SubElement(frm, 'WIDTH').text = xmlGen_str(page.width)
+        ET.SubElement(frm, 'HEIGHT').text = xmlGen_str(page.height)
+        ET.SubElement(frm, 'BG_CLR').text = xmlGen_str(page.bg_clr)
+        rgns = ET.SubElement(frm, 'REGIONS')                #add region map
+        for idx, bbox in enumerate(page.regions):
+            rgn = ET.SubElement(rgns, 'REGION')
+            rgn.set('IDX', str(idx))                            #set region index, used by the draw items
+            rgn.text = ",".join(str(e) for e in bbox)
+        items = ET.SubElement(frm, 'ITEMS')
+        for item in page.items:                             #cycle through the draw list
+            itm = ET.SubElement(items, 'ITEM')
+            itm.set('TYPE', item.type); itm.set('LAYER', item.layer); itm.set('NAME', xmlGen_str(item.name))
+            for atrb in item.fields_dashCFG:
+                val = getattr(item, atrb)
+                if val is None: continue                            #attribute not used by the item type
+                sub = ET.SubElement(itm, atrb.upper())
+                if type(val) in (tuple, list): sub.text = ",".join(str(e) for e in val)    #join coords, boxes, and font tuples
+                else: sub.text = xmlGen_str(val)
+
+    renderCFG_tree = ET.ElementTree(renderCFG)          #make the tree
+    ET.indent(renderCFG_tree, space="  ")               #format
+    return renderCFG_tree
+
+def genXML_DashCFG(master, tmp_assy_dir, base_pkg=None, px_fmt=None):
     """function serves as the primary point for calling the various class functions that
     generate the output configuration zip package
     
@@ -475,15 +596,103 @@ def genXML_DashCFG(master, tmp_assy_dir):
     :type master: `tk.window` ref
     :param tmp_assy_dir: filepath to the chosen save location
     :type tmp_assy_dir: `string`
+    :param base_pkg: (optional) previous package (or its manifest) to make a delta package against
+    :type base_pkg: `string` filepath
+    :param px_fmt: (optional) pixel format of the raw image blobs, key of `Rawimg_fmts`. No raw images are
+        made if None
+    :type px_fmt: `string`
+    :returns: True if a delta package was made, False if a full package was made. And a dict of warnings, for
+        parts of the package that were left out - empty dict returned if no warnings
+    :rtype: `tuple` (`boolean`, {'issue_location':'issue description'})
     """
+    tmp_warn = {}                                       #package warnings
     cfg_save_dir = tmp_assy_dir + 'tmp_cfg_dir/'        #append a temp directory to the chosen location for making the download package
     tgt_archive_name = tmp_assy_dir + dashCFG_PKGname   #final archive name
 
     os.mkdir(cfg_save_dir)                              #make the temp dir
     cfg_XML = editorXML_gen(master,XMLgen_mode['DASH']) #generate XML for the dash configuration
     XML_save(cfg_save_dir, dashCFG_CFGname, cfg_XML)    #save dash XML config file
+    bin_diffs = genDashCFG_bin(cfg_save_dir, cfg_XML)   #save binary copy of the dash config
+    if len(bin_diffs) != 0:
+        tmp_warn.update({dashCFG_BINname:'Binary config not saved, it decodes to a different config than the XML (' + str(len(bin_diffs))
+                         + ' difference(s), first is ' + bin_diffs[0] + '). The dash will load the XML config'})
     genDashCFG_themeImgs(master, cfg_save_dir)          #make a temp directory with theme images
+    plan = render_plan(master)                          #compile the page render plan
+    for font_file in fontpkg_bundle(fontpkg_chars(plan), cfg_save_dir + dashCFG_fontDir):  #bundle the used fonts, before the static labels are drawn
+        tmp_warn.update({'Font "' + font_file + '"':'Font file not found, not bundled. The dash will use its installed font of the same name'})
+    gauge_bake(plan, cfg_save_dir + dashCFG_imgDir)     #pre-draw the gauge faces and needles, before the static content
+    plan.bake_static(cfg_save_dir + dashCFG_imgDir)     #pre-draw the static content of each page
+    glyph_bake(plan, cfg_save_dir + dashCFG_imgDir)     #pre-draw the data label glyphs
+    XML_save(cfg_save_dir, dashCFG_renderName, renderXML_gen(plan))     #save render plan file
+    if px_fmt is not None: genDashCFG_rawImgs(plan, cfg_save_dir + dashCFG_imgDir, px_fmt)  #pre-decoded images
+    is_delta = genDashCFG_manifest(cfg_save_dir, base_pkg)  #add manifest, and remove unchanged files for a delta
+    if is_delta: tgt_archive_name = tmp_assy_dir + dashCFG_deltaName
     genDashCFG_pkgAssy(cfg_save_dir,tgt_archive_name)   #generate total package zip file for dash config
+    return is_delta, tmp_warn
+
+def genDashCFG_manifest(sav_loc, base_pkg=None):
+    """function saves the package manifest (see dash_manifest.py). If a base package is passed, files that
+    are unchanged from the base package are removed so only the changed files are packaged, and the
+    manifest lists the files to remove from the dash.
+
+    :param sav_loc: location of the temporary package files
+    :type sav_loc: `string` filepath
+    :param base_pkg: (optional) previous package (or its manifest) to make a delta package against
+    :type base_pkg: `string` filepath
+    :returns: True if a delta package was made. False if a full package was made, including when the base
+        package has no manifest
+    :rtype: `boolean`
+    """
+    files = manifest_build(sav_loc)                         #hash all package files
+    base = manifest_load(base_pkg) if base_pkg is not None else None
+    try: base_files = manifest_parse(base) if base is not None else None
+    except (ET.ParseError, ValueError): base_files = None   #not a valid manifest, make a full package
+
+    if base_files is None:
+        XML_save(sav_loc, manifest_name, manifest_XML(files))
+        return False
+
+    changed, removed = manifest_delta(files, base_files)
+    for path in files:
+        if path not in changed: os.remove(os.path.join(sav_loc, *path.split('/')))     #unchanged, already on the dash
+    XML_save(sav_loc, manifest_name, manifest_XML(files, manifest_hash(base), removed))
+    return True
+
+def genDashCFG_rawImgs(plan, img_dir, px_fmt):
+    """function saves a raw image blob (see dash_rawimg.py) next to each image drawn by the dash, at the
+    size it's placed on the page. Blobs are named after the package image, with a ".raw" extension.
+
+    :param plan: compiled render plan, with the static page images already drawn
+    :type plan: `render_plan`
+    :param img_dir: package image directory
+    :type img_dir: `string` filepath
+    :param px_fmt: pixel format, key of `Rawimg_fmts`
+    :type px_fmt: `string`
+    """
+    tmp_jobs = {}                                           #format is {raw_file_name: (source_path, (width, height))}
+    for page in plan.pages.values():
+        for item in page.items:
+            if item.type != 'IMG': continue
+            src = item.src or os.path.join(img_dir, item.image) #static page images only exist in the package
+            tmp_jobs.update({rawimg_name(item.image): (src, (item.bbox[2] - item.bbox[0], item.bbox[3] - item.bbox[1]))})
+    rawimg_export(tmp_jobs, img_dir, px_fmt)
+
+def genDashCFG_bin(sav_loc, cfg_XML):
+    """function saves the binary version of the dash config (see dash_bincfg.py). The binary file is
+    only saved if it decodes to the same config as the XML, otherwise the dash will load the XML.
+
+    :param sav_loc: location of the temporary package files
+    :type sav_loc: `string` filepath
+    :param cfg_XML: generated dash XML config
+    :type cfg_XML: XML ET.file() object
+    :returns: differences found by `bincfg_verify`, empty if the binary config was saved
+    :rtype: `list` of `string`
+    """
+    bin_cfg = bincfg_encode(cfg_XML)
+    tmp_diffs = bincfg_verify(cfg_XML, bin_cfg)
+    if tmp_diffs: return tmp_diffs                          #differences found, don't save
+    with open(sav_loc + dashCFG_BINname, 'wb') as f: f.write(bin_cfg)
+    return tmp_diffs
 
 def genDashCFG_fileLoc(master):
     """function opens the file picker dialogue to choose a location to save the configuration package to
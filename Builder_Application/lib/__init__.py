@@ -3,4 +3,19 @@
 from .editor_windows import *
 from .editor_control import *
 from .XML import *
-from .com_defs import *
\ No newline at end of file
+from .com_defs import *
+from .CAN_decode import *
+from .CAN_log import *
+from .CAN_replay import *
+from .CAN_busload import *
+from .CAN_filter import *
+from .CAN_dbc import *
+from .dash_render import *
+from .dash_cost import *
+from .dash_bincfg import *
+from .dash_manifest import *
+from .dash_rawimg import *
+from .dash_glyph import *
+from .dash_fontpkg import *
+from .dash_gauge import *
+from .cfg_cache import *
\ No newline at end of file
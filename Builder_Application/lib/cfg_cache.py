@@ -0,0 +1,153 @@
+"""
+File:       cfg_cache.py
+Function:   This file handles the cache of parsed editor config files, and the list of recently opened config
+            files. Parsing an editor config (see XML.py) converts every value from its XML text and makes every
+            config class again. When a config file is parsed, the parsed model (core, theme, CAN, and pages
+            configs) is saved to the builder cache directory, so opening the same file again only loads the model.
+
+            Cache files are keyed by the config file path, and hold a small header (path, size, modified time,
+            content hash, and check result) followed by the model. The header is checked before the model is
+            loaded: if the size and modified time match, the file is unchanged. If only the modified time changed,
+            the content hash is checked, so a file that was saved or copied without changes still uses the cache,
+            and the header is saved again with the new modified time so the file isn't hashed at the next open.
+
+            A restored model is validated incrementally. The header has the result of the full config check when
+            the model was cached; the model can't have changed since, so only the parts of the check that depend on
+            files outside the config (theme fonts and images) are run again (see `XML_dashCFG_checkExt`).
+
+            The model is saved once it's checked, before any page is built, so it doesn't hold any editor objects.
+            Back-references to the master window (see `weak_attr`) are saved as a placeholder and set to the window
+            the model is loaded into.
+"""
+from .sys import *
+from .dash_manifest import manifest_hash   #needed for the content hash of the config file
+import weakref
+import pickle
+import hashlib
+
+#---config cache constants
+cfgCache_ver = 2                    #cached model version. Increment if any config class or the header changes
+cfgCache_master = 'MASTER'          #placeholder saved for back-references to the master window
+cfgCache_none = 'NONE'              #placeholder saved for editor objects, loaded as None
+cfgRecent_file = os.path.join(os.path.dirname(sys_cache_dir), 'recent.txt')   #recently opened config files, one path per line
+cfgRecent_max = 8                   #max number of recently opened config files
+
+class cfgCache_pickler(pickle.Pickler):
+    """class saves a parsed model, replacing the master window and editor objects with placeholders"""
+    def __init__(self, file, master):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.master = master            #reference back to the main/master window
+
+    def persistent_id(self, obj):
+        if isinstance(obj, weakref.ref): return cfgCache_master if obj() is self.master else cfgCache_none
+        if isinstance(obj, (tk.Misc, tk.Image, ImageTk.PhotoImage, tkFont.Font)): return cfgCache_none
+        return None                     #saved as normal
+
+class cfgCache_unpickler(pickle.Unpickler):
+    """class loads a parsed model, setting back-references to the passed master window"""
+    def __init__(self, file, master):
+        super().__init__(file)
+        self.master = master            #reference back to the main/master window
+
+    def persistent_load(self, pid):
+        if pid == cfgCache_master: return weakref.ref(self.master)
+        return None
+
+def cfgCache_file(filepath):
+    """function returns the on-disk cache file for the passed config file. The file name is a hash of the path.
+
+    :param filepath: absolute path to the config file
+    :type filepath: `string`
+    :rtype: `string`
+    """
+    return os.path.join(sys_cache_dir, 'cfg_' + hashlib.sha1(filepath.encode()).hexdigest() + '.model')
+
+def cfgCache_key(filepath):
+    """function returns the cache key of the passed config file. Should be taken before the file is parsed, so
+    a file changed while parsing isn't cached as the parsed version.
+
+    :param filepath: path to the config file
+    :type filepath: `string`
+    :returns: file size, modified time, and content hash. None if the file can't be read
+    :rtype: `tuple`
+    """
+    try:
+        stat = os.stat(filepath)
+        return (stat.st_size, stat.st_mtime_ns, manifest_hash(filepath))
+    except OSError: return None
+
+def cfgCache_load(master, filepath):
+    """function restores the parsed model of the passed config file from the cache, if the file hasn't changed
+    since it was cached. The model is set to the master window the same as `parseXML`. Failures to read the cache
+    are ignored.
+
+    :param master: reference back to the main/master window
+    :type master: `tk.window` ref
+    :param filepath: path to the config file
+    :type filepath: `string`
+    :returns: None if the file needs to be parsed. Otherwise True if the model passed the full config check when
+        it was cached, False if it didn't
+    :rtype: `boolean`
+    """
+    filepath = os.path.abspath(filepath)
+    try:
+        stat = os.stat(filepath)
+        with open(cfgCache_file(filepath), 'rb') as f:
+            ver, cache_path, size, mtime, file_hash, valid = pickle.load(f)    #header only, the model isn't loaded yet
+            if ver != cfgCache_ver or cache_path != filepath or size != stat.st_size: return None
+            hash_only = mtime != stat.st_mtime_ns                           #modified time changed, check the contents
+            if hash_only and file_hash != manifest_hash(filepath): return None
+            model = cfgCache_unpickler(f, master).load()
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, AttributeError, ImportError, TypeError): return None     #no or invalid cache
+    master.cfg_core, master.cfg_theme, master.cfg_CAN, master.cfg_pages = model
+    if hash_only: cfgCache_save(master, filepath, (stat.st_size, stat.st_mtime_ns, file_hash), valid)  #save the new modified time
+    return valid
+
+def cfgCache_save(master, filepath, key, valid):
+    """function saves the parsed model of the master window to the cache. Must be called before any page is built.
+    Failures to write the cache are ignored.
+
+    :param master: reference back to the main/master window
+    :type master: `tk.window` ref
+    :param filepath: path to the config file
+    :type filepath: `string`
+    :param key: cache key of the config file, see `cfgCache_key`
+    :type key: `tuple`
+    :param valid: True if the model passed the full config check
+    :type valid: `boolean`
+    """
+    if key is None: return
+    filepath = os.path.abspath(filepath)
+    cache_file = cfgCache_file(filepath)
+    try:
+        os.makedirs(sys_cache_dir, exist_ok=True)
+        with open(cache_file, 'wb') as f:
+            pickle.dump((cfgCache_ver, filepath) + key + (bool(valid),), f, protocol=pickle.HIGHEST_PROTOCOL)
+            cfgCache_pickler(f, master).dump((master.cfg_core, master.cfg_theme, master.cfg_CAN, master.cfg_pages))
+    except (OSError, pickle.PicklingError, TypeError, AttributeError):     #cache is optional, remove a partly written file
+        try: os.remove(cache_file)
+        except OSError: pass
+
+def cfgRecent_get():
+    """function returns the recently opened config files, newest first. Files that no longer exist are skipped.
+
+    :rtype: `list` of `string`
+    """
+    try:
+        with open(cfgRecent_file, 'r', encoding='utf-8') as f: tmp_paths = f.read().splitlines()
+    except OSError: return []
+    return [p for p in tmp_paths if p and os.path.isfile(p)][:cfgRecent_max]
+
+def cfgRecent_add(filepath):
+    """function moves the passed config file to the top of the recently opened config files. Failures to write
+    the list are ignored.
+
+    :param filepath: path to the config file
+    :type filepath: `string`
+    """
+    filepath = os.path.abspath(filepath)
+    tmp_paths = [filepath] + [p for p in cfgRecent_get() if p != filepath]
+    try:
+        os.makedirs(os.path.dirname(cfgRecent_file), exist_ok=True)
+        with open(cfgRecent_file, 'w', encoding='utf-8') as f: f.write('\n'.join(tmp_paths[:cfgRecent_max]) + '\n')
+    except OSError: pass
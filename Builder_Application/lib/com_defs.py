@@ -9,13 +9,16 @@ Function:   This file handles any "common" function and class definitions (hence
 """
 
 from .sys import *
+import math
+import weakref
 
 #-----------------------------common definitions-----------------------------
 #---dash element types
 DashEle_types = {'LBL_STAT': 1,     #static label
                  'LBL_DAT':2,       #data label (dynamic value)
                  'IND_BLT':3,       #bullet indicator
-                 'IND_BAR':4}       #bar indicator
+                 'IND_BAR':4,       #bar indicator
+                 'IND_GAU':5}       #analog gauge indicator
 
 #---element position
 Ele_Order = {'FG': 1,   #foreground
@@ -41,6 +44,10 @@ Popup_types = {'INFO':1,     #generic notification window
 XMLgen_mode = { 'EDTR': 1,   #editor XML file type
                 'DASH': 2}   #dash configuration file type
 
+#---named tk fonts of the theme fonts. Named fonts belong to the tk interpreter, not the theme, so a theme of a new or
+#   loaded config reuses the font of the same name. Format is {tk_font_name : tkFont.Font}
+dash_tkFonts = {}
+
 #-----------------------------common functions-----------------------------
 def bool_str(val):
     """converts string to boolean value
@@ -119,7 +126,37 @@ def tup_str(tup):
     csr = ", ".join(tup)
     return csr
 
-def draw_rectangle(prnt_canv, x0, y0, x1, y1, clr, r=pad_radius):
+def rectangle_points(x0, y0, x1, y1, r=pad_radius):
+    """function builds the polygon points of a rectangle with rounded corners. The points are intended to
+    be drawn as a smoothed polygon, see `draw_rectangle`
+
+    :param x0: start x coordinate
+    :type x0: `int`
+    :param y0: start y coordinate
+    :type y0: `int`
+    :param x1: end x coordinate
+    :type x1: `int`
+    :param y1: end y coordinate
+    :type y1: `int`
+    :param r: (optional) rectangle corner radius
+    :type r: num pixels in `int`
+    :returns: flat list of polygon points
+    :rtype: `list` of `int` [x0, y0, x1, y1, ...]
+    """
+    return [x0+r, y0, x0+r, y0,   #polygon points
+            x1-r, y0, x1-r, y0,
+            x1, y0,
+            x1, y0+r, x1, y0+r,
+            x1, y1-r, x1, y1-r,
+            x1, y1,
+            x1-r, y1, x1-r, y1,
+            x0+r, y1, x0+r, y1,
+            x0, y1,
+            x0, y1-r, x0, y1-r,
+            x0, y0+r, x0, y0+r,
+            x0, y0]
+
+def draw_rectangle(prnt_canv, x0, y0, x1, y1, clr, r=pad_radius, tags=()):
     """function draws a rectagle on the parent canvas. Rectangle is based on the passed coords.
     The start coordinate is upper-left corner of the rectangle, end coordinate is lower-left corner 
     of the rectangle. Can pass an optional value (r) to add a radius to the rectangle corners    
@@ -138,23 +175,107 @@ def draw_rectangle(prnt_canv, x0, y0, x1, y1, clr, r=pad_radius):
     :type clr: HEX string color value
     :param r: (optional) rectangle corner radius
     :type r: num pixels in `int`
+    :param tags: (optional) canvas tags of the rectangle
+    :type tags: `tuple` of `string`
     :returns: reference ID of the created object
     :rtype: `tk.canvas` reference
     """
-    points = [x0+r, y0, x0+r, y0,   #create the polycon points
-              x1-r, y0, x1-r, y0,
-              x1, y0,
-              x1, y0+r, x1, y0+r,
-              x1, y1-r, x1, y1-r,
-              x1, y1,
-              x1-r, y1, x1-r, y1,
-              x0+r, y1, x0+r, y1,
-              x0, y1,
-              x0, y1-r, x0, y1-r,
-              x0, y0+r, x0, y0+r,
-              x0, y0]
-    
-    return prnt_canv.create_polygon(points, smooth = True, fill=clr)    #create the background polygon and return refID
+    points = rectangle_points(x0, y0, x1, y1, r)  #create the polycon points
+    return prnt_canv.create_polygon(points, smooth = True, fill=clr, tags=tags)    #create the background polygon and return refID
+
+def gauge_point(cx, cy, r, ang):
+    """function calculates a point on a gauge. Gauge angles are in degrees, clockwise from straight up
+    (12 o'clock), so a start angle of -135 and a sweep of 270 is a typical gauge that starts at the
+    lower left.
+
+    :param cx: gauge center x coordinate
+    :type cx: `float`
+    :param cy: gauge center y coordinate
+    :type cy: `float`
+    :param r: distance from the gauge center
+    :type r: `float`
+    :param ang: gauge angle
+    :type ang: `float` in degrees
+    :returns: point coordinates
+    :rtype: `tuple` (x, y)
+    """
+    return (cx + r*math.sin(math.radians(ang)), cy - r*math.cos(math.radians(ang)))
+
+def gauge_angle(ang_start, ang_sweep, scale_lo, scale_hi, val):
+    """function calculates the needle angle of a gauge value. Values outside the scale are limited to the
+    start or end of the sweep.
+
+    :param ang_start: gauge angle at the lower bound of the scale
+    :type ang_start: `int` in degrees
+    :param ang_sweep: gauge angle from the lower to the upper bound of the scale
+    :type ang_sweep: `int` in degrees
+    :param scale_lo: lower bound of scale
+    :type scale_lo: `int`
+    :param scale_hi: upper bound of scale
+    :type scale_hi: `int`
+    :param val: gauge value
+    :type val: `float`
+    :rtype: `float` in degrees
+    """
+    if scale_lo is None or scale_hi is None or scale_hi == scale_lo: return ang_start
+    frac = min(max((val - scale_lo) / (scale_hi - scale_lo), 0.0), 1.0)
+    return ang_start + ang_sweep*frac
+
+def gauge_ticks(ang_start, ang_sweep, ticks_major, ticks_minor):
+    """function calculates the tick angles of a gauge
+
+    :param ang_start: gauge start angle
+    :type ang_start: `int` in degrees
+    :param ang_sweep: gauge sweep angle
+    :type ang_sweep: `int` in degrees
+    :param ticks_major: number of major divisions of the scale
+    :type ticks_major: `int`
+    :param ticks_minor: number of minor divisions of each major division
+    :type ticks_minor: `int`
+    :returns: tick angles and if the tick is a major tick
+    :rtype: `list` of `tuple` (angle, is_major)
+    """
+    tmp_ticks = []
+    div_major = max(ticks_major or 0, 0); div_minor = max(ticks_minor or 1, 1)
+    if div_major == 0: return tmp_ticks
+    for i in range(div_major*div_minor + 1):
+        tmp_ticks.append((ang_start + ang_sweep*i/(div_major*div_minor), i % div_minor == 0))
+    return tmp_ticks
+
+def draw_gauge(prnt_canv, tag, kwargs):
+    """function draws the editor preview of a gauge on the parent canvas. A gauge is several canvas objects,
+    so they're all given the same tag and the tag is used as the gauge reference ID. The needle is drawn at
+    the lower bound of the scale and is also tagged as "<tag>_ndl" so it can be moved on its own.
+
+    :param prnt_canv: parent canvas to draw the gauge on
+    :type prnt_canv: `tk.Canvas`
+    :param tag: gauge tag, or None to make a new tag
+    :type tag: `string`
+    :param kwargs: gauge kwargs, see `Indicator_Gauge.get_edtr_wgt_kwargs`
+    :type kwargs: `dictionary`
+    :returns: gauge tag
+    :rtype: `string`
+    """
+    x0 = kwargs.get('x0'); y0 = kwargs.get('y0'); size = kwargs.get('size') or 0
+    r = size/2; cx = x0 + r; cy = y0 + r
+    ang_start = kwargs.get('ang_start') or 0; ang_sweep = kwargs.get('ang_sweep') or 0
+    clr_names = kwargs.get('clr_names', {})                         #named colors, used for the color tags
+    grp_tags = tuple(kwargs.get('tags', ()))                        #tags of every gauge object, like the element group tag
+
+    face_id = prnt_canv.create_oval(x0, y0, x0+size, y0+size, fill=kwargs.get('fill'), outline=kwargs.get('outline'), width=2)
+    if tag is None: tag = 'gauge' + str(face_id)                    #face ID is unique, use it to make a unique tag
+    prnt_canv.itemconfigure(face_id, tags=(tag,) + grp_tags + clr_tags({'fill': clr_names.get('fill'), 'outline': clr_names.get('outline')}))
+    for ang, is_major in gauge_ticks(ang_start, ang_sweep, kwargs.get('ticks_major'), kwargs.get('ticks_minor')):
+        r_in = r*(gauge_tickOut - (gauge_tickMajor if is_major else gauge_tickMinor))
+        prnt_canv.create_line(*gauge_point(cx, cy, r_in, ang), *gauge_point(cx, cy, r*gauge_tickOut, ang),
+                              fill=kwargs.get('outline'), width=2 if is_major else 1,
+                              tags=(tag,) + grp_tags + clr_tags({'fill': clr_names.get('outline')}))
+    ndl_tags = grp_tags + clr_tags({'fill': clr_names.get('needle')})
+    prnt_canv.create_line(cx, cy, *gauge_point(cx, cy, r*gauge_needleLen, ang_start), fill=kwargs.get('needle'),
+                          width=max(size*gauge_needleW, 1), capstyle=tk.ROUND, tags=(tag, tag + '_ndl') + ndl_tags)
+    hub_r = size*gauge_hubR
+    prnt_canv.create_oval(cx-hub_r, cy-hub_r, cx+hub_r, cy+hub_r, fill=kwargs.get('needle'), outline='', tags=(tag,) + ndl_tags)
+    return tag
 
 def instance_widget(ele_type, prnt_canv, widg_kwargs):
     """function to create a new element in the dash page editor. If only an opbject is created, the
@@ -175,6 +296,7 @@ def instance_widget(ele_type, prnt_canv, widg_kwargs):
     try:    #processing for widgets with background padding
         pad = widg_kwargs.pop('pad', False)
         clr_bg = widg_kwargs.pop('clr_bg',None)
+        pad_tags = widg_kwargs.pop('pad_tags', ())
     except: pass
     
     #make objects
@@ -186,13 +308,15 @@ def instance_widget(ele_type, prnt_canv, widg_kwargs):
         wigt_ref = prnt_canv.create_oval(widg_kwargs.pop('x0'), widg_kwargs.pop('y0'),widg_kwargs.pop('x1'), widg_kwargs.pop('y1'),**widg_kwargs)       #set result as oval
     elif ele_type == DashEle_types['IND_BAR']:
         wigt_ref = prnt_canv.create_rectangle(widg_kwargs.pop('x0'), widg_kwargs.pop('y0'),widg_kwargs.pop('x1'), widg_kwargs.pop('y1'),**widg_kwargs)  #set result as rectangle
+    elif ele_type == DashEle_types['IND_GAU']:
+        wigt_ref = draw_gauge(prnt_canv, None, widg_kwargs)     #set result as the gauge tag
 
     if pad == True:                     #if widget has background padding, then make it
-        pad_ref = elePad_create(prnt_canv, wigt_ref, clr_bg)   
+        pad_ref = elePad_create(prnt_canv, wigt_ref, clr_bg, pad_tags)
         return wigt_ref, pad_ref        #and return created widget reference and pad object reference
     else: return wigt_ref, None         #otherwise, only return created widget reference
 
-def elePad_create(prnt_canv, prnt_wgt, pad_clr):
+def elePad_create(prnt_canv, prnt_wgt, pad_clr, tags=()):
     """function supports dash element creation. If element has a "background pad" rectangle, this function
     is used to create it.
 
@@ -202,13 +326,15 @@ def elePad_create(prnt_canv, prnt_wgt, pad_clr):
     :type prnt_wgt: dash element class reference
     :param pad_clr: fill color
     :type pad_clr: HEX string color value
+    :param tags: (optional) canvas tags of the pad, see `clr_tags`
+    :type tags: `tuple` of `string`
     :returns: tuple of reference ID of the created object
     :rtype: `tk.canvas` reference
     """
     prntX0, prntY0, prntX1, prntY1 = prnt_canv.bbox(prnt_wgt)           #find the size of the parent widget
     padX0=prntX0-pad_margin; padX1=prntX1+pad_margin                    #calculate X0, x1 for background pad object
     padY0=prntY0; padY1=prntY1                                          #calcualte Y0, Y1 for background pad object
-    pad_ref_id = draw_rectangle(prnt_canv, padX0, padY0, padX1, padY1, pad_clr)    #create the background pad rectangle
+    pad_ref_id = draw_rectangle(prnt_canv, padX0, padY0, padX1, padY1, pad_clr, tags=tags)    #create the background pad rectangle
     prnt_canv.tag_lower(pad_ref_id, prnt_wgt)                           #place the background pad below the parent widget
     return pad_ref_id   #return the background pad ID
 
@@ -253,7 +379,32 @@ def updPages(master_ref):
     #TODO: should this be in the "dash_control" class?
     for page in master_ref.cfg_pages.values(): page.update_page()   #cycle through all pages and update
 
-def addImg(canv, image, x=0, y=0):
+def updColor(master_ref, clr_name):
+    """Function updates the editor canvas objects that use a named color after the color is edited. Canvas
+    objects are tagged with the named colors they use (see `clr_tags`), so each page is updated with a single
+    itemconfigure call per color option instead of updating every element on every page.
+
+    :param master_ref: reference back to the main/master window
+    :type master_ref: `tk.window` ref
+    :param clr_name: theme definition - named color
+    :type clr_name: `string`
+    """
+    clr_val = master_ref.cfg_theme.colors.get(clr_name)
+    if clr_val is None: return
+    for page in master_ref.cfg_pages.values(): page.update_color(clr_name, clr_val)
+
+def clr_tags(clr_opts):
+    """Function builds the canvas tags of an editor object from the named colors it uses. The object is tagged
+    with "clr_<option>:<color name>" for each canvas option set from a named color (see `updColor`).
+
+    :param clr_opts: named color of each canvas option, None if the option isn't set from a named color
+    :type clr_opts: `dictionary` {canvas_option:color_name}
+    :returns: canvas tags
+    :rtype: `tuple` of `string`
+    """
+    return tuple(clr_tagFmt.format(opt, name) for opt, name in clr_opts.items() if name is not None)
+
+def addImg(canv, image, x=0, y=0, tags=None):
     """Function loops through the page(s) in the instanced page dict in the master window. This dict contains the
     defined editor pages. For each page, it's individual "update_page" function is called. This is typically
     helpful when a core definition like a named color ref is updated and all objects that reference the named
@@ -268,11 +419,13 @@ def addImg(canv, image, x=0, y=0):
     :type x: `int`
     :param y: y0 position of the image, upper-left corner (default=0)
     :type y: `int`
+    :param tags: (optional) canvas tag(s) of the image item
+    :type tags: `string` or `tuple`
     :returns: PhotoImage reference
     :rtype: `tk.PhotoImage` int
     """
     tkImg = tk.PhotoImage(master=canv, file=image)                  #create tk photoImage
-    canv.create_image(x, y, image = tkImg, anchor=tk.NW)            #place image
+    canv.create_image(x, y, image = tkImg, anchor=tk.NW, tags=tags) #place image
     return tkImg    #return tk image for ref
 
 def upd_definition_refs(master_ref, obj_name, ref_dict):
@@ -374,6 +527,22 @@ def file_dir_dialogue(file_dialoge_kwargs):
         return None, None
 
 #---------------------configuration classes used in multiple files---------------------
+class weak_attr:
+    '''attribute that only keeps a weak reference to its value, used for back-references (like `master_ref`). Pages
+    and elements are owned by the master window, and element editor bindings are owned by the element, so a strong
+    back-reference would make a reference cycle. Objects in a cycle are only freed by the cyclic garbage collector,
+    which pauses the editor on large configs. Reading the attribute returns None once the referenced object is freed.'''
+    def __set_name__(self, owner, name):
+        self.attr = '_wk_' + name           #instance attribute that holds the weak reference
+
+    def __get__(self, obj, objtype=None):
+        if obj is None: return self
+        ref = obj.__dict__.get(self.attr)
+        return None if ref is None else ref()
+
+    def __set__(self, obj, value):
+        obj.__dict__[self.attr] = None if value is None else weakref.ref(value)
+
 class dash_config:
     """Configuration class for core dash options (HW configuration). Examples of contained information
     includes screen resolution, backlight PWM value, and other "core" options."""
@@ -447,6 +616,7 @@ class dash_theme:
         self.fonts = {}         #dictionary for named font data. Format is {name : font_class}
         self.colors = {}        #dictionary for color data. Format is {name : 'color val'} 
         self.images = {}        #dict for images. Format is {name : 'img_filepath'}
+        self.tk_fonts = {}      #named tk fonts used by the editor canvas items. Format is {name : tkFont.Font}. Kept when cleared, so the names stay valid
 
         self.alert_FG=None      #named color for FG (text) when alert color-changing is enabled
         self.alert_warn=None    #warning named color for BG when alert color-changing is enabled
@@ -457,6 +627,13 @@ class dash_theme:
         self.colors_ext_ref = {}
         self.images_ext_ref = {}
 
+    def __getstate__(self):
+        """function returns the theme data saved to the config cache (see cfg_cache.py). The named tk fonts aren't
+        saved, they're looked up again the first time the restored theme draws a font."""
+        state = self.__dict__.copy()
+        state.update({'tk_fonts': {}})
+        return state
+
     def set_dflt_cfg(self):
         """function sets the default values for the editor config"""
         dflt_alert_clrs = {'Alert_FG':'#000000',
@@ -503,6 +680,35 @@ class dash_theme:
         """
         for f in passed_fonts:                          #cycle through all passed fonts
             self.fonts.update({f.font_name:f})          #update theme font data
+            if f.font_name in self.tk_fonts:            #font is already drawn in the editor
+                try: self.tk_font(f.font_name)          #then re-configure the named font, which updates every canvas item using it
+                except tk.TclError: pass                #invalid font definition, reported by the config check
+
+    def tk_font(self, fnt_name):
+        """function returns the named tk font of a theme font. Editor canvas items reference the font by name
+        instead of a font tuple, so a font edit is a single configure call that tk applies to every item.
+        The named font is created the first time the font is used, and re-configured when the font definition
+        is replaced (edited, or a new config loaded).
+
+        :param fnt_name: theme definition - named font
+        :type fnt_name: `string`
+        :returns: named tk font, or None if the font isn't defined
+        :rtype: `tkFont.Font`
+        """
+        fnt = self.fonts.get(fnt_name)
+        if fnt is None: return None
+        tk_fnt = self.tk_fonts.get(fnt_name)
+        if tk_fnt is None:                              #first use of the font name by this theme
+            tk_name = dash_tkFontName.format(fnt_name)
+            tk_fnt = dash_tkFonts.get(tk_name)
+            if tk_fnt is None:                          #first use of the font name, reuse it if tk already has it
+                tk_fnt = tkFont.Font(name=tk_name, exists=tk_name in tkFont.names(), **fnt.font_opts())
+                dash_tkFonts.update({tk_name: tk_fnt})
+            else: tk_fnt.configure(**fnt.font_opts())   #font name used by a previous theme
+            self.tk_fonts.update({fnt_name: tk_fnt})
+        elif fnt.tk_fnt is not tk_fnt: tk_fnt.configure(**fnt.font_opts())   #new definition of the font
+        fnt.tk_fnt = tk_fnt
+        return tk_fnt
 
     def set_imgs(self, passed_img):
         """function sets/updates the defined theme images(s) based on the passed dict.
@@ -622,11 +828,11 @@ class dash_theme:
                 tmp_err_list.update({k:'Unable to locate image file at configured path'})
         
         if not self.chk_exist_colors(self.alert_FG):
-            tmp_err_list.update({'Theme definition for "Alert_FG_color"':'Named color "' + self.alert_FG + '" not defined in theme'})
+            tmp_err_list.update({'Theme definition for "Alert_FG_color"':'Named color "' + str(self.alert_FG) + '" not defined in theme'})
         if not self.chk_exist_colors(self.alert_warn):
-            tmp_err_list.update({'Theme definition for "Alert_WARN_color"':'Named color "' + self.alert_warn + '" not defined in theme'})
+            tmp_err_list.update({'Theme definition for "Alert_WARN_color"':'Named color "' + str(self.alert_warn) + '" not defined in theme'})
         if not self.chk_exist_colors(self.alert_dngr):
-            tmp_err_list.update({'Theme definition for "Alert_DANGER_color"':'Named color "' + self.alert_dngr + '" not defined in theme'})
+            tmp_err_list.update({'Theme definition for "Alert_DANGER_color"':'Named color "' + str(self.alert_dngr) + '" not defined in theme'})
 
         return tmp_err_list #return any errors
 
@@ -663,6 +869,7 @@ class dash_font:
         #--pre-build the font tuple for easy access elsewhere in the program
         self.fnt_tup = None                                 #assembled font tuple
         self.build_font_tpl()                               #build font tuple
+        self.tk_fnt = None                                  #tk font object, the named editor font once drawn (see `dash_theme.tk_font`)
 
         #--create tupple for class attributes used to save editor XML file
         self.fields_editorCFG = ('typeface', 'point', 'pad')
@@ -670,6 +877,12 @@ class dash_font:
         #--create tupple for class attributes used to generate dash config file
         self.fields_dashCFG = ('fnt_tup')
 
+    def __getstate__(self):
+        """function returns the font data saved to the config cache (see cfg_cache.py), without the tk font object"""
+        state = self.__dict__.copy()
+        state.update({'tk_fnt': None})
+        return state
+
     def build_font_tpl(self):
         """function builds an appropriate font tuple that is typical of the format
         used in various tkinter inputs. The tupple is then stored in a class attribute."""
@@ -679,6 +892,16 @@ class dash_font:
                         ('bold' if self.bold else 'normal'),
                         ('italic' if self.bold else 'roman'))
 
+    def font_opts(self):
+        """function returns the font tuple as tk font options
+
+        :rtype: `dictionary` {option:value}
+        """
+        return {'family': self.fnt_tup[0],
+                'size': self.fnt_tup[1],
+                'weight':self.fnt_tup[2],
+                'slant':self.fnt_tup[3]}
+
     def XML_dashCFG_checkErrs(self):
         """function checks the required class attributes to see if they are set and if the set value is
         a correct format and/or reference. If it is not set, or the value is not correct for the configuration,
@@ -690,11 +913,10 @@ class dash_font:
         :rtype: `dictionary` {attribute_name:"error message"}
         """
         errs = False
-        fnt_dict = {'family': self.fnt_tup[0],
-                         'size': self.fnt_tup[1],
-                         'weight':self.fnt_tup[2],
-                         'slant':self.fnt_tup[3]}   #build font option dict
-        try: myfont = tkFont.Font(**fnt_dict)       #try to define font object using options
+        fnt_dict = self.font_opts()                 #build font option dict
+        try:                                        #try to define font object using options
+            if self.tk_fnt is None: self.tk_fnt = tkFont.Font(**fnt_dict)   #first check, keep the font for the next check
+            else: self.tk_fnt.configure(**fnt_dict)                         #reuse the font, named if drawn in the editor
         except: errs = True                         #if unable to, then return that there is an error
         return errs
 
@@ -706,6 +928,8 @@ class CAN_core:
 
         :param base_PID: CAN PID of the device itself
         :type base_PID: integer
+        :param bitrate: CAN bus bitrate in bits/sec
+        :type bitrate: integer
         :param CANfilter_en: enable RX CAN filter based on defined CAN channels
         :type CANfilter_en: boolean
         :param data_ch: dictionary for display chan channels
@@ -722,6 +946,7 @@ class CAN_core:
         :type CAN_rxNotifier: `CAN_core` class method
         """
         self.base_PID = None    #CAN PID of the dash itself
+        self.bitrate = None     #CAN bus bitrate in bits/sec. The default bitrate is used if not set (configs saved before it was added)
         self.rx_filter = None   #enable RX CAN filter based on defined CAN channels
         self.data_ch = {}       #dictionary for display chan channels. Format is {ch_NAME : class[CAN_ch]}
 
@@ -731,6 +956,7 @@ class CAN_core:
     def set_dflt_cfg(self):
         """function sets the default values for the editor config"""
         self.base_PID = sys_CAN_base_PID
+        self.bitrate = sys_CAN_bitrate
         self.rx_filter = False
 
     def upd_cfg(self, **kwargs):
@@ -742,6 +968,7 @@ class CAN_core:
         """
         kwargs = {k.upper(): v for k, v in kwargs.items()}  #convert kwarg names to uppercase. Allows for use with XML and editor attributes
         if 'BASE_PID' in kwargs: self.base_PID = kwargs.get('BASE_PID')
+        if 'BITRATE' in kwargs: self.bitrate = int_str(kwargs.get('BITRATE'))
         if 'RX_FILTER' in kwargs: self.rx_filter = bool_str(kwargs.get('RX_FILTER'))
 
     def len(self):
@@ -762,6 +989,7 @@ class CAN_core:
         """function clears out all class attributes and sets to None"""
         self.data_ch.clear()
         self.base_PID = None
+        self.bitrate = None
         self.rx_filter = None
     
     def set_CAN_ch(self, passed_ch):
@@ -826,6 +1054,8 @@ class CAN_core:
 
         if self.base_PID is None or self.base_PID == '': tmp_err_list.update({'Base_PID':'No base PID is defined and is required'})
         if self.rx_filter is None or self.rx_filter == '': tmp_err_list.update({'RX_Filter':'CAN RX message filter can be set to true or false but is undefined'})
+        if self.bitrate is not None and (type(self.bitrate) != int or self.bitrate <= 0):
+            tmp_err_list.update({'Bitrate':'CAN bus bitrate must be a whole number of bits/sec'})
 
         for v in self.data_ch.values():                     #cycle through all CAN channels
             tmp_err_list.update(v.XML_dashCFG_checkErrs())  #and add any errors
@@ -893,6 +1123,7 @@ class CAN_ch:
 
 class dash_page:
     '''Configuration class to store page elements and the canvas reference object to edit'''
+    master_ref = weak_attr()    #reference back to the master window, weak so the page model isn't a reference cycle
     def __init__(self, **kwargs):
         kwargs = {k.upper(): v for k, v in kwargs.items()}  #convert kwarg names to uppercase. Allows for use with XML and editor attributes
         self.name = kwargs.get('NAME', 0)                   #frame name
@@ -910,6 +1141,7 @@ class dash_page:
         self.Lbl_dat = {}   #dict of data labels. Format is {'Name' : Label_Data_Class}
         self.Ind_blt = {}   #dict of bullet indicators. Format is {'Name' : Ind_Bullet_Class}
         self.Ind_bar = {}   #dict of bar indicators. Format is {'Name' : Ind_Bar_Class}
+        self.Ind_gau = {}   #dict of gauge indicators. Format is {'Name' : Ind_Gauge_Class}
 
         #--local vars
         self.canvObj = None     #canvas object for reference
@@ -947,7 +1179,7 @@ class dash_page:
         
         frm_bg_img = self.master_ref.cfg_theme.images.get(self.bg_img)  #get frame background image path
         if frm_bg_img is not None:
-            img = addImg(self.canvObj, frm_bg_img)  #add background image
+            img = addImg(self.canvObj, frm_bg_img, tags=page_bgTag)    #add background image
             self.canvObj.bg_img = img               #add/update image to canvas element dict to prevent trash collection
         
         self.upd_page_def_refs()                    #update external refs
@@ -959,12 +1191,41 @@ class dash_page:
         Additionally, function updates the external_ref dicts for theme references related to the page
         attributes (IE background color, background image, etc.)"""
         
+        if self.canvObj is None: self.upd_page_def_refs(); return   #canvas not built (or evicted), it's updated when re-built
         for elm in self.Lbl_stc.values(): elm.upd_editor_obj()  #update all static labels
         for elm in self.Lbl_dat.values(): elm.upd_editor_obj()  #update all data labels
         for elm in self.Ind_blt.values(): elm.upd_editor_obj()  #update all bullet indicators
         for elm in self.Ind_bar.values(): elm.upd_editor_obj()  #update all bar indicators
+        for elm in self.Ind_gau.values(): elm.upd_editor_obj()  #update all gauge indicators
         self.upd_page_def_refs()                                #update any page refs
 
+    def update_color(self, clr_name, clr_val):
+        """function updates the editor canvas objects of the page that use a named color, using the color tags
+        of the objects (see `clr_tags`)
+
+        :param clr_name: edited theme definition - named color
+        :type clr_name: `string`
+        :param clr_val: new color value
+        :type clr_val: HEX string color value
+        """
+        if self.canvObj is None: return
+        if self.bg_clr == clr_name: self.canvObj.configure(bg=clr_val)     #page background
+        for opt in clr_tagOpts:
+            self.canvObj.itemconfigure(clr_tagFmt.format(opt, clr_name), **{opt: clr_val})
+
+    def update_font(self, fnt_name):
+        """function updates the editor canvas objects after a font edit. Text items use the named tk font
+        (see `dash_theme.tk_font`) so they are already updated, only the background pads of the labels using
+        the font need to be re-sized to the new text size.
+
+        :param fnt_name: edited theme definition - named font
+        :type fnt_name: `string`
+        """
+        if self.canvObj is None: return
+        for elm in list(self.Lbl_stc.values()) + list(self.Lbl_dat.values()):
+            if elm.font == fnt_name and elm.pad == True: elm.upd_editor_obj()
+            if elm.font == fnt_name and elm.wgtCtl is not None: elm.wgtCtl.edge_upd()    #text size changed, update the alignment guide edges
+
     def upd_config(self, kwargs):
         """function updates configuration values based on the passed kwargs
         
@@ -991,6 +1252,8 @@ class dash_page:
                     self.Ind_blt.update({k:v})   #add or update bullet indicator
                 case Indicator_Bar():
                     self.Ind_bar.update({k:v})   #add or update bar indicator
+                case Indicator_Gauge():
+                    self.Ind_gau.update({k:v})   #add or update gauge indicator
 
     def get_eleCfg(self, ele_type, ele_name):
         """function returns the dash element configuration based on the passed type and name.
@@ -1007,6 +1270,7 @@ class dash_page:
         elif ele_type == DashEle_types['LBL_DAT']: ele_cfg = self.Lbl_dat[ele_name]
         elif ele_type == DashEle_types['IND_BLT']: ele_cfg = self.Ind_blt[ele_name]
         elif ele_type == DashEle_types['IND_BAR']: ele_cfg = self.Ind_bar[ele_name]
+        elif ele_type == DashEle_types['IND_GAU']: ele_cfg = self.Ind_gau[ele_name]
 
         return ele_cfg
 
@@ -1042,6 +1306,7 @@ class dash_page:
             case Label_Data(): self.Lbl_dat.pop(obj_name)
             case Indicator_Bullet(): self.Ind_blt.pop(obj_name)
             case Indicator_Bar(): self.Ind_bar.pop(obj_name)
+            case Indicator_Gauge(): self.Ind_gau.pop(obj_name)
     
     def del_page_ext_refs(self):
         """function deletes all external refs for page elements, in preparation for deleting a page. Additionally
@@ -1052,6 +1317,7 @@ class dash_page:
         for dat in self.Lbl_stc.keys(): del_definition_refs(self.master_ref, dat) #data labels
         for blt in self.Lbl_stc.keys(): del_definition_refs(self.master_ref, blt) #bullet indicators
         for bar in self.Lbl_stc.keys(): del_definition_refs(self.master_ref, bar) #bar indicators
+        for gau in self.Ind_gau.keys(): del_definition_refs(self.master_ref, gau) #gauge indicators
     
     def XML_dashCFG_checkErrs(self):
         """function checks the required class attributes to see if they are set and if the set value is
@@ -1069,7 +1335,7 @@ class dash_page:
         if self.bg_clr is None: tmp_err_list.update({self.name +'-BG_Color':'Color not defined'})
         else:
             if not self.master_ref.cfg_theme.chk_exist_colors(self.bg_clr):
-                tmp_err_list.update({self.name +'-BG_Color':'Named color "' + self.bg_clr + '" not defined in theme'})
+                tmp_err_list.update({self.name +'-BG_Color':'Named color "' + str(self.bg_clr) + '" not defined in theme'})
         if self.bg_img is not None:
             if not self.master_ref.cfg_theme.chk_exist_imgs(self.bg_img):
                 tmp_err_list.update({self.name +'-BG_Image':'Named image "' + self.bg_img + '" not defined in theme'})
@@ -1081,11 +1347,13 @@ class dash_page:
         for v in self.Lbl_dat.values(): tmp_err_list.update(v.XML_dashCFG_checkErrs(self.name))
         for v in self.Ind_blt.values(): tmp_err_list.update(v.XML_dashCFG_checkErrs(self.name))
         for v in self.Ind_bar.values(): tmp_err_list.update(v.XML_dashCFG_checkErrs(self.name))
+        for v in self.Ind_gau.values(): tmp_err_list.update(v.XML_dashCFG_checkErrs(self.name))
 
         return tmp_err_list #return error list
 
 class Label_Static:
     '''Configuration class for static label types'''
+    master_ref = weak_attr()    #reference back to the master window, weak so the page model isn't a reference cycle
     def __init__(self, **kwargs):
         """widget creation args"""
         kwargs = {k.upper(): v for k, v in kwargs.items()}  #convert kwarg names to uppercase. Allows for use with XML and editor attributes
@@ -1178,10 +1446,10 @@ class Label_Static:
         elif self.pad==True and self.padID is None:                 #if pad objection was checked
             if pad_clr is None: pass    #do nothing if no color is defined
             else:                       #there is a color defined
-                self.padID = elePad_create(self.editor_canvObj, self.objID, pad_clr)    #then create the pad object - with the specified color
+                self.padID = elePad_create(self.editor_canvObj, self.objID, pad_clr, (ele_grpTag.format(self.name),) + clr_tags({'fill': self.clr_bg}))  #then create the pad object - with the specified color
         elif self.pad==True and self.padID is not None:             #if there is a valid background pad
             self.padID = elePad_delete(self.editor_canvObj, self.padID)             #then delete pad object
-            self.padID = elePad_create(self.editor_canvObj, self.objID, pad_clr)    #and rebuild
+            self.padID = elePad_create(self.editor_canvObj, self.objID, pad_clr, (ele_grpTag.format(self.name),) + clr_tags({'fill': self.clr_bg}))  #and rebuild
         
         self.wgtCtl.upd_refs()  #update control bindings after changes have been made
     
@@ -1196,22 +1464,24 @@ class Label_Static:
         :rtype: `dictionary` {element_kwarg_name:value}
         """
         #--shorthand refs for theme items
-        thm_clrs = self.master_ref.cfg_theme.colors
-        thm_fnts = self.master_ref.cfg_theme.fonts
+        thm = self.master_ref.cfg_theme
+        thm_clrs = thm.colors
         
         #--build dict with all kwargs needed to create or update editor widget
         out_kwargs = {'x0': self.x0,
                       'y0': self.y0,
                       'text': self.text,
                       'fill': thm_clrs[self.fill],          #transform from keyword to color HEX code
-                      'font': thm_fnts[self.font].fnt_tup,  #transform from font name to tuple
-                      'anchor':tk.NW}
+                      'font': thm.tk_font(self.font).name,  #transform from font name to named tk font
+                      'anchor':tk.NW,
+                      'tags': (ele_grpTag.format(self.name),) + clr_tags({'fill': self.fill})}
 
         if inc_pad == True:                     #include pad kwags with output
             try: color = thm_clrs[self.clr_bg]  #if a valid color is defined, go get it
             except: color = None                    #otherwise assign "None"
             out_kwargs.update({'pad':self.pad,
-                               'clr_bg': color})
+                               'clr_bg': color,
+                               'pad_tags': (ele_grpTag.format(self.name),) + clr_tags({'fill': self.clr_bg})})
                     
         return out_kwargs   #retun the complete kwarg dict
 
@@ -1252,17 +1522,18 @@ class Label_Static:
                         tmp_err_list.update({pg_name +'-'+ self.name +'-label_font':'Named font "' + val + '" not defined in theme'})
                 elif attr == 'fill':
                     if not self.master_ref.cfg_theme.chk_exist_colors(val):
-                        tmp_err_list.update({pg_name +'-'+ self.name +'-fill_color':'Named color "' + val + '" not defined in theme'})
+                        tmp_err_list.update({pg_name +'-'+ self.name +'-fill_color':'Named color "' + str(val) + '" not defined in theme'})
                 elif attr == 'pad':
                     if (val is None) or val == '':
                         tmp_err_list.update({pg_name +'-'+ self.name +'-'+ attr:'Required value for page static label is undefined'})
                     if val == True and not self.master_ref.cfg_theme.chk_exist_colors(self.clr_bg):
-                        tmp_err_list.update({pg_name +'-'+ self.name +'-pad_color':'Named color "' + self.clr_bg + '" not defined in theme'})
+                        tmp_err_list.update({pg_name +'-'+ self.name +'-pad_color':'Named color "' + str(self.clr_bg) + '" not defined in theme'})
 
         return tmp_err_list
 
 class Label_Data:
     '''Configuration class for data label types'''
+    master_ref = weak_attr()    #reference back to the master window, weak so the page model isn't a reference cycle
     def __init__(self, **kwargs):
         """widget creation args"""
         kwargs = {k.upper(): v for k, v in kwargs.items()}  #convert kwarg names to uppercase. Allows for use with XML and editor attributes
@@ -1362,13 +1633,13 @@ class Label_Data:
         elif self.pad==True and self.padID is None:                 #if pad objection was checked
             if pad_clr is None: pass    #do nothing if no color is defined
             else:                       #there is a color defined
-                self.padID = elePad_create(self.editor_canvObj, self.objID, pad_clr)    #then create the pad object - with the specified color
+                self.padID = elePad_create(self.editor_canvObj, self.objID, pad_clr, (ele_grpTag.format(self.name),) + clr_tags({'fill': self.clr_bg}))  #then create the pad object - with the specified color
         elif self.pad==True and self.padID is not None:             #if there is a valid background pad
             '''Instead of just updating the color and position, deleting and re-building also accounts
                 for the size change of a parent object. This allows re-scaling on font change or value
                 change and then also inherently adjusts for position and all that good stuff too.'''
             self.padID = elePad_delete(self.editor_canvObj, self.padID)             #then delete pad object
-            self.padID = elePad_create(self.editor_canvObj, self.objID, pad_clr)    #and rebuild
+            self.padID = elePad_create(self.editor_canvObj, self.objID, pad_clr, (ele_grpTag.format(self.name),) + clr_tags({'fill': self.clr_bg}))  #and rebuild
             
         self.wgtCtl.upd_refs()  #update control bindings after changes have been made
 
@@ -1383,22 +1654,24 @@ class Label_Data:
         :rtype: `dictionary` {element_kwarg_name:value}
         """
         #--shorthand refs for theme items
-        thm_clrs = self.master_ref.cfg_theme.colors
-        thm_fnts = self.master_ref.cfg_theme.fonts
+        thm = self.master_ref.cfg_theme
+        thm_clrs = thm.colors
         
         #--build dict with all kwargs needed to create or update editor widget
         out_kwargs = {'x0': self.x0,
                       'y0': self.y0,
                       'text': self.max_val,
                       'fill': thm_clrs[self.fill],          #transform from keyword to color HEX code
-                      'font': thm_fnts[self.font].fnt_tup,  #transform from font name to tuple
-                      'anchor':tk.NW}
+                      'font': thm.tk_font(self.font).name,  #transform from font name to named tk font
+                      'anchor':tk.NW,
+                      'tags': (ele_grpTag.format(self.name),) + clr_tags({'fill': self.fill})}
 
         if inc_pad == True:                     #include pad kwags with output
             try: color = thm_clrs[self.clr_bg]  #if a valid color is defined, go get it
             except: color = None                    #otherwise assign "None"
             out_kwargs.update({'pad':self.pad,
-                               'clr_bg': color})
+                               'clr_bg': color,
+                               'pad_tags': (ele_grpTag.format(self.name),) + clr_tags({'fill': self.clr_bg})})
         
         return out_kwargs   #retun the complete kwarg dict
 
@@ -1441,7 +1714,7 @@ class Label_Data:
                         tmp_err_list.update({pg_name +'-'+ self.name +'-label_font':'Named font "' + val + '" not defined in theme'})
                 elif attr == 'fill':
                     if not self.master_ref.cfg_theme.chk_exist_colors(val):
-                        tmp_err_list.update({pg_name +'-'+ self.name +'-fill_color':'Named color "' + val + '" not defined in theme'})
+                        tmp_err_list.update({pg_name +'-'+ self.name +'-fill_color':'Named color "' + str(val) + '" not defined in theme'})
                 elif attr == 'data_ch':
                     if not self.master_ref.cfg_CAN.chk_exist_CANch(val):
                         tmp_err_list.update({pg_name +'-'+ self.name +'-CAN_ch':'Named CAN channel "' + val + '" not defined in theme'})
@@ -1449,7 +1722,7 @@ class Label_Data:
                     if (val is None) or val == '':
                         tmp_err_list.update({pg_name +'-'+ self.name +'-'+ attr:'Required value for page data label is undefined'})
                     if val == True and not self.master_ref.cfg_theme.chk_exist_colors(self.clr_bg):
-                        tmp_err_list.update({pg_name +'-'+ self.name +'-pad_color':'Named color "' + self.clr_bg + '" not defined in theme'})
+                        tmp_err_list.update({pg_name +'-'+ self.name +'-pad_color':'Named color "' + str(self.clr_bg) + '" not defined in theme'})
                 elif attr == 'warn_en':
                     if (val is None) or val == '':
                         tmp_err_list.update({pg_name +'-'+ self.name +'-'+ attr:'Required value for page data label is undefined'})
@@ -1467,6 +1740,7 @@ class Label_Data:
 
 class Indicator_Bullet:
     '''Configuration class for bullet indicator types'''
+    master_ref = weak_attr()    #reference back to the master window, weak so the page model isn't a reference cycle
     def __init__(self, **kwargs):
         """widget creation args"""
         kwargs = {k.upper(): v for k, v in kwargs.items()}      #convert kwarg names to uppercase. Allows for use with XML and editor attributes
@@ -1558,7 +1832,8 @@ class Indicator_Bullet:
                       'x1': self.x0 + self.size,
                       'y1': self.y0 + self.size,
                       'fill': thm_clrs[self.clr_lo],    #transform from keyword to color HEX code
-                      'outline': thm_clrs[self.outln]}  #transform from keyword to color HEX code
+                      'outline': thm_clrs[self.outln],  #transform from keyword to color HEX code
+                      'tags': (ele_grpTag.format(self.name),) + clr_tags({'fill': self.clr_lo, 'outline': self.outln})}
         
         return out_kwargs   #retun the complete kwarg dict
     
@@ -1599,7 +1874,7 @@ class Indicator_Bullet:
                         tmp_err_list.update({pg_name +'-'+ self.name +'-label_font':'Named font "' + val + '" not defined in theme'})
                 elif (attr == 'clr_lo') or (attr == 'clr_hi') or (attr == 'outln'):
                     if not self.master_ref.cfg_theme.chk_exist_colors(val):
-                        tmp_err_list.update({pg_name +'-'+ self.name +'-fill_color':'Named color "' + val + '" not defined in theme'})
+                        tmp_err_list.update({pg_name +'-'+ self.name +'-fill_color':'Named color "' + str(val) + '" not defined in theme'})
                 elif attr == 'data_ch':
                     if not self.master_ref.cfg_CAN.chk_exist_CANch(val):
                         tmp_err_list.update({pg_name +'-'+ self.name +'-CAN_ch':'Named CAN channel "' + val + '" not defined in theme'})
@@ -1608,6 +1883,7 @@ class Indicator_Bullet:
 
 class Indicator_Bar:
     '''Configuration class for bar indicator types'''
+    master_ref = weak_attr()    #reference back to the master window, weak so the page model isn't a reference cycle
     def __init__(self, **kwargs):
         """widget creation args"""
         kwargs = {k.upper(): v for k, v in kwargs.items()}      #convert kwarg names to uppercase. Allows for use with XML and editor attributes
@@ -1708,7 +1984,8 @@ class Indicator_Bar:
                       'x1': self.x0 + self.width,
                       'y1': self.y0 + self.height,
                       'fill': thm_clrs[self.fill],          #transform from keyword to color HEX code
-                      'outline': thm_clrs[self.outln]}    #transform from keyword to color HEX code
+                      'outline': thm_clrs[self.outln],    #transform from keyword to color HEX code
+                      'tags': (ele_grpTag.format(self.name),) + clr_tags({'fill': self.fill, 'outline': self.outln})}
         
         return out_kwargs   #retun the complete kwarg dict
     
@@ -1749,7 +2026,7 @@ class Indicator_Bar:
                         tmp_err_list.update({pg_name +'-'+ self.name +'-label_font':'Named font "' + val + '" not defined in theme'})
                 elif (attr == 'fill') or (attr == 'outln'):
                     if not self.master_ref.cfg_theme.chk_exist_colors(val):
-                        tmp_err_list.update({pg_name +'-'+ self.name +'-fill_color':'Named color "' + val + '" not defined in theme'})
+                        tmp_err_list.update({pg_name +'-'+ self.name +'-fill_color':'Named color "' + str(val) + '" not defined in theme'})
                 elif attr == 'data_ch':
                     if not self.master_ref.cfg_CAN.chk_exist_CANch(val):
                         tmp_err_list.update({pg_name +'-'+ self.name +'-CAN_ch':'Named CAN channel "' + val + '" not defined in theme'})
@@ -1757,7 +2034,7 @@ class Indicator_Bar:
                     if (val is None) or val == '':
                         tmp_err_list.update({pg_name +'-'+ self.name +'-'+ attr:'Required value for page bar indicator is undefined'})
                     if val == True and not self.master_ref.cfg_theme.chk_exist_colors(self.clr_bg):
-                        tmp_err_list.update({pg_name +'-'+ self.name +'-pad_color':'Named color "' + self.clr_bg + '" not defined in theme'})
+                        tmp_err_list.update({pg_name +'-'+ self.name +'-pad_color':'Named color "' + str(self.clr_bg) + '" not defined in theme'})
                 elif attr == 'warn_en':
                     if (val is None) or val == '':
                         tmp_err_list.update({pg_name +'-'+ self.name +'-'+ attr:'Required value for page bar indicator is undefined'})
@@ -1773,6 +2050,146 @@ class Indicator_Bar:
 
         return tmp_err_list
 
+class Indicator_Gauge:
+    '''Configuration class for analog gauge indicator types'''
+    master_ref = weak_attr()    #reference back to the master window, weak so the page model isn't a reference cycle
+    def __init__(self, **kwargs):
+        """widget creation args"""
+        kwargs = {k.upper(): v for k, v in kwargs.items()}      #convert kwarg names to uppercase. Allows for use with XML and editor attributes
+        self.x0 = int_str(kwargs.get('X0', 0))                  #position - X0
+        self.y0 = int_str(kwargs.get('Y0', 0))                  #position - Y0
+        self.size = int_str(kwargs.get('SIZE', None))           #gauge diameter
+        self.fill = kwargs.get('FILL', None)                    #named face color (see theme class)
+        self.outln = kwargs.get('OUTLN', None)                  #named outline and tick color (see theme class)
+        self.needle = kwargs.get('NEEDLE', None)                #named needle color (see theme class)
+
+        """configuration args"""
+        self.name = kwargs.get('NAME', None)                    #label name
+        self.data_ch = kwargs.get('DATA_CH', None)              #Named linked CAN channel (see CAN class)
+        self.scale_lo = int_str(kwargs.get('SCALE_LO', None))   #lower bound of scale
+        self.scale_hi = int_str(kwargs.get('SCALE_HI', None))   #upper bound of scale
+        self.ang_start = int_str(kwargs.get('ANG_START', -135)) #needle angle at the lower bound, degrees clockwise from straight up
+        self.ang_sweep = int_str(kwargs.get('ANG_SWEEP', 270))  #needle angle from the lower to the upper bound, degrees clockwise
+        self.ticks_major = int_str(kwargs.get('TICKS_MAJOR', 10))  #number of major divisions of the scale
+        self.ticks_minor = int_str(kwargs.get('TICKS_MINOR', 5))   #number of minor divisions of each major division
+
+        #-----ref vars
+        self.master_ref = None      #reference back to the master window > needed for theme and font transformations
+
+        #-----local vars
+        self.objID = None           #canvas object reference ID - once created. For gauges this is the tag of all the gauge objects
+        self.editor_canvObj =None   #canvas ref where the editor object is placed -> used for editor updates
+        self.wgtCtl = None          #bindings for editor control
+
+        #--create tupple for class attributes used to save editor XML file
+        self.fields_editorCFG = ('x0', 'y0', 'size', 'fill', 'outln', 'needle', 'data_ch', 'scale_lo', 'scale_hi', 'ang_start', 'ang_sweep', 'ticks_major', 'ticks_minor')
+
+        #--create tupple for class attributes used to generate dash config file
+        self.fields_dashCFG = self.fields_editorCFG
+
+    def upd_config(self, kwargs):
+        """function updates element configuration values based on the passed kwargs. This is
+        typically used when instancing a new element.
+
+        :param kwargs: element attributes to update
+        :type kwargs: `dict` formatted {kwarg_name:value}
+        """
+        self.__dict__.update(kwargs)
+
+    def editor_upd_config(self, passed_args):
+        """function updates the visual state and stored configuration of a dash element based on
+        the passed arguments. This is typically used when changing the element via the editor.
+
+        :param passed_args: element attributes to update
+        :type passed_args: `dict` formatted {kwarg_name:value}
+        """
+        #condition coords and size: needed for manual editor updating
+        for k in ('x0', 'y0', 'size', 'ang_start', 'ang_sweep', 'ticks_major', 'ticks_minor'):
+            if passed_args.get(k) == '' or (k in passed_args and passed_args.get(k) is None): passed_args.update({k:0})
+        for k in ('scale_lo', 'scale_hi'):          #scale values are entered as text
+            if k in passed_args:
+                try: passed_args.update({k: int_str(passed_args.get(k))})
+                except ValueError: passed_args.update({k: None})    #partially entered value, like "-"
+
+        self.upd_config(passed_args)                #update configuration data
+        self.upd_editor_obj()                       #update editor canvas object
+        self.upd_ele_def_refs()                     #update core references (like fonts, colors, etc)
+
+    def upd_editor_obj(self):
+        """function updates the canvas objects that are in the dash editor. A gauge is several canvas objects,
+        so they're deleted and redrawn with the same tag, which keeps the editor bindings of the tag.
+        """
+        canv = self.editor_canvObj
+        canv.delete(self.objID)                                     #remove the current gauge objects
+        draw_gauge(canv, self.objID, self.get_edtr_wgt_kwargs())    #and redraw them with the same tag
+
+    def get_edtr_wgt_kwargs(self):
+        """function gets the kwargs required to create or update the editor canvas objects. Returns a dict of
+        parameters that's used to draw the gauge preview (see `draw_gauge`).
+
+        :returns: dict of element kwargs
+        :rtype: `dictionary` {element_kwarg_name:value}
+        """
+        #--shorthand refs for theme items
+        thm_clrs = self.master_ref.cfg_theme.colors
+
+        #--build dict with all kwargs needed to create or update editor widget
+        out_kwargs = {'x0': self.x0,
+                      'y0': self.y0,
+                      'size': self.size,
+                      'fill': thm_clrs.get(self.fill),      #transform from keyword to color HEX code
+                      'outline': thm_clrs.get(self.outln),  #transform from keyword to color HEX code
+                      'needle': thm_clrs.get(self.needle),  #transform from keyword to color HEX code
+                      'ang_start': self.ang_start,
+                      'ang_sweep': self.ang_sweep,
+                      'ticks_major': self.ticks_major,
+                      'ticks_minor': self.ticks_minor,
+                      'clr_names': {'fill': self.fill, 'outline': self.outln, 'needle': self.needle},
+                      'tags': (ele_grpTag.format(self.name),)}
+
+        return out_kwargs   #retun the complete kwarg dict
+
+    def upd_ele_def_refs(self):
+        """function builds the reference dict to update the external refs for core definitions. For example,
+        if the dash element uses colors named "FG" and "BG" the generated ref_dict would be {'COLORS':(FG,BG)}.
+        After creating the ref dict, the external references are updated.
+        """
+        colors = (self.fill, self.outln, self.needle)   #colors used for element
+        can_chs = (self.data_ch,)                       #CAN channels used for element
+        ref_dict = {'COLORS':colors,
+                    'CAN_CH':can_chs}       #dict of the used references. Format is {'ref_type':(tup of named ref values)}
+        upd_definition_refs(self.master_ref, self.name, ref_dict)   #update the core references
+
+    def XML_dashCFG_checkErrs(self, pg_name):
+        """function checks the required class attributes to see if they are set and if the set value is
+        a correct format and/or reference. If it is not set, or the value is not correct for the configuration,
+        then the attribute name, and an error message are added to the temporary error dict.
+
+        :param pg_name: the dash page which the element is contained on - makes for a better error message fi needed
+        :type pg_name: `string`
+        :returns: dict of attributes with errors
+        :rtype: `dictionary` {attribute_name:"error message"}
+        """
+        tmp_err_list = {}   #temp dict for compiling errors
+
+        for attr, val in self.__dict__.items():
+            if attr in self.fields_dashCFG:
+                if (attr == 'x0') or (attr == 'y0') or (attr == 'size') or (attr == 'scale_lo') or (attr == 'scale_hi') or (attr == 'ang_start') or (attr == 'ang_sweep'):
+                    if (val is None) or val == '':
+                        tmp_err_list.update({pg_name +'-'+ self.name +'-'+ attr:'Required value for page gauge indicator is undefined'})
+                elif (attr == 'fill') or (attr == 'outln') or (attr == 'needle'):
+                    if not self.master_ref.cfg_theme.chk_exist_colors(val):
+                        tmp_err_list.update({pg_name +'-'+ self.name +'-'+ attr +'_color':'Named color "' + str(val) + '" not defined in theme'})
+                elif attr == 'data_ch':
+                    if not self.master_ref.cfg_CAN.chk_exist_CANch(val):
+                        tmp_err_list.update({pg_name +'-'+ self.name +'-CAN_ch':'Named CAN channel "' + str(val) + '" not defined in theme'})
+        if self.scale_lo is not None and self.scale_lo == self.scale_hi:
+            tmp_err_list.update({pg_name +'-'+ self.name +'-scale':'Gauge scale lower and upper bounds are the same'})
+        if self.ang_sweep is not None and not (0 < abs(self.ang_sweep) <= 360):
+            tmp_err_list.update({pg_name +'-'+ self.name +'-ang_sweep':'Gauge sweep must be between 1 and 360 degrees'})
+
+        return tmp_err_list
+
 #---------------------additional common classes---------------------
 class wndw_notify(tk.Toplevel):
     '''custom notification window class. Fixed size window that wraps text and can handle longer messages.
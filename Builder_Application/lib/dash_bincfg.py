@@ -0,0 +1,348 @@
+"""
+File:       dash_bincfg.py
+Function:   This file handles the compact binary version of the dash configuration file. The binary file has
+            the same structure as the dash XML configuration (same element tags, attributes, and nesting), but
+            every value is stored pre-converted to its type, so the dash doesn't have to parse XML or convert
+            strings when loading a configuration.
+
+            File layout (all varints are unsigned LEB128):
+                header:     magic `bincfg_magic`, format version (1 byte)
+                strings:    count (varint), then each string as length (varint) + UTF-8 bytes. Every tag,
+                            attribute name, and string value is stored once and referenced by its index.
+                root:       a single element record
+            Element record:
+                length (varint) of the rest of the record, so a reader can skip elements it doesn't use
+                tag (string index), number of attributes (varint), each attribute as name (string index) +
+                value, element value, number of children (varint), then the child element records
+            Value: type (1 byte, see `Bincfg_types`) followed by the type's data
+
+            A value is only converted when it converts back to exactly the same text, so the binary file
+            holds the same information as the XML. `bincfg_verify` checks this for a generated file.
+
+            NOTE: like CAN_decode.py, this file does not import any of the tkinter based application files
+            so it can be shared as-is with the dash application.
+"""
+
+import struct
+
+#---binary config constants
+bincfg_magic = b'PDCB'          #file identifier
+bincfg_ver = 1                  #file format version
+
+#---value types
+Bincfg_types = {'NONE': 0,      #no value (blank XML text)
+                'STR': 1,       #string table index
+                'INT': 2,       #zigzag varint
+                'FLOAT': 3,     #little-endian double
+                'FALSE': 4,     #boolean false, no data
+                'TRUE': 5,      #boolean true, no data
+                'COLOR': 6,     #"#RRGGBB" color as a little-endian uint32 0xRRGGBB
+                'HEX': 7,       #"0x.." value (like a CAN PID) as a varint
+                'LIST': 8}      #comma separated integers as a count (varint) + zigzag varints
+
+#-----------------------------writer-----------------------------
+def bincfg_varint(val):
+    """function encodes an unsigned integer as a varint
+
+    :param val: value to encode
+    :type val: `int` >= 0
+    :rtype: `bytes`
+    """
+    tmp_out = bytearray()
+    while True:
+        byte = val & 0x7F
+        val >>= 7
+        if val: tmp_out.append(byte | 0x80)
+        else: tmp_out.append(byte); return bytes(tmp_out)
+
+def bincfg_zigzag(val):
+    """function encodes a signed integer as a zigzag varint
+
+    :param val: value to encode
+    :type val: `int`
+    :rtype: `bytes`
+    """
+    return bincfg_varint(val*2 if val >= 0 else -val*2 - 1)
+
+def bincfg_intText(text):
+    """function converts text to an integer, only if the integer converts back to exactly the same text
+
+    :param text: text to convert
+    :type text: `string`
+    :returns: integer value, or None if the text isn't an integer
+    :rtype: `int`
+    """
+    try: val = int(text)
+    except ValueError: return None
+    return val if str(val) == text else None
+
+class bincfg_writer:
+    """class encodes an XML element tree into the binary config format"""
+    def __init__(self):
+        self.strings = []           #string table
+        self.str_idx = {}           #index of each string in the table. Format is {string: index}
+
+    def intern(self, text):
+        """function returns the string table index of the passed string, adding it to the table if needed
+
+        :param text: string to intern
+        :type text: `string`
+        :rtype: `int`
+        """
+        if text not in self.str_idx:
+            self.str_idx.update({text: len(self.strings)})
+            self.strings.append(text)
+        return self.str_idx[text]
+
+    def value(self, text):
+        """function encodes a text value using the most compact type that converts back to the same text
+
+        :param text: XML text or attribute value
+        :type text: `string` or None
+        :rtype: `bytes`
+        """
+        t = Bincfg_types
+        if text is None or text == '': return bytes([t['NONE']])
+        if text == 'True': return bytes([t['TRUE']])
+        if text == 'False': return bytes([t['FALSE']])
+        val = bincfg_intText(text)
+        if val is not None: return bytes([t['INT']]) + bincfg_zigzag(val)
+        if len(text) == 7 and text[0] == '#':
+            try:
+                val = int(text[1:], 16)
+                if '#{:06X}'.format(val) == text: return bytes([t['COLOR']]) + struct.pack('<I', val)
+            except ValueError: pass
+        if text[:2] == '0x':
+            try:
+                val = int(text, 16)
+                if hex(val) == text: return bytes([t['HEX']]) + bincfg_varint(val)
+            except ValueError: pass
+        if ',' in text:
+            vals = [bincfg_intText(v) for v in text.split(',')]
+            if None not in vals:
+                return bytes([t['LIST']]) + bincfg_varint(len(vals)) + b''.join(bincfg_zigzag(v) for v in vals)
+        try:
+            val = float(text)
+            if repr(val) == text: return bytes([t['FLOAT']]) + struct.pack('<d', val)
+        except ValueError: pass
+        return bytes([t['STR']]) + bincfg_varint(self.intern(text))
+
+    def element(self, ele):
+        """function encodes an XML element and its children as an element record. The text of an element
+        with children is only formatting whitespace, so it isn't stored.
+
+        :param ele: XML element
+        :type ele: `ET.Element`
+        :rtype: `bytes`
+        """
+        rec = bytearray(bincfg_varint(self.intern(ele.tag)))
+        rec += bincfg_varint(len(ele.attrib))
+        for name, val in ele.attrib.items(): rec += bincfg_varint(self.intern(name)) + self.value(val)
+        rec += self.value(None if len(ele) else (ele.text or '').strip())
+        rec += bincfg_varint(len(ele))
+        for child in ele: rec += self.element(child)
+        return bincfg_varint(len(rec)) + bytes(rec)
+
+    def encode(self, root):
+        """function encodes a complete XML element tree
+
+        :param root: root XML element, or element tree
+        :type root: `ET.Element` or `ET.ElementTree`
+        :returns: binary config file contents
+        :rtype: `bytes`
+        """
+        if hasattr(root, 'getroot'): root = root.getroot()
+        body = self.element(root)                               #encode first to build the string table
+        tmp_out = bytearray(bincfg_magic) + bytes([bincfg_ver])
+        tmp_out += bincfg_varint(len(self.strings))
+        for text in self.strings:
+            raw = text.encode('utf-8')
+            tmp_out += bincfg_varint(len(raw)) + raw
+        return bytes(tmp_out + body)
+
+def bincfg_encode(root):
+    """function encodes an XML element tree into the binary config format
+
+    :param root: root XML element, or element tree
+    :type root: `ET.Element` or `ET.ElementTree`
+    :rtype: `bytes`
+    """
+    return bincfg_writer().encode(root)
+
+#-----------------------------reader-----------------------------
+class bincfg_node:
+    """class contains a single element of a loaded binary config. Similar to an XML element, with `find`,
+    `findall`, and `get`, but the value and attributes are already converted to their types."""
+    __slots__ = ('tag', 'attrib', 'value', 'children')
+    def __init__(self, tag, attrib, value, children):
+        self.tag = tag              #element tag
+        self.attrib = attrib        #element attributes. Format is {name: value}
+        self.value = value          #element value, None if blank
+        self.children = children    #child elements
+
+    def __iter__(self): return iter(self.children)
+    def __len__(self): return len(self.children)
+
+    def get(self, name, default=None):
+        """function returns the value of an attribute
+
+        :param name: attribute name
+        :type name: `string`
+        """
+        return self.attrib.get(name, default)
+
+    def find(self, tag):
+        """function returns the first child with the passed tag, or None"""
+        for child in self.children:
+            if child.tag == tag: return child
+        return None
+
+    def findall(self, tag):
+        """function returns all children with the passed tag"""
+        return [child for child in self.children if child.tag == tag]
+
+class bincfg_reader:
+    """class decodes a binary config file"""
+    def __init__(self, data):
+        """
+        :param data: binary config file contents
+        :type data: `bytes`
+        """
+        if data[:len(bincfg_magic)] != bincfg_magic: raise ValueError('Not a PyDash binary config file')
+        if data[len(bincfg_magic)] != bincfg_ver: raise ValueError('Unsupported binary config version ' + str(data[len(bincfg_magic)]))
+        self.data = data
+        self.pos = len(bincfg_magic) + 1
+        self.strings = [self.string() for i in range(self.varint())]   #string table
+        t = Bincfg_types
+        self.val_funcs = {t['NONE']: lambda: None,             #value read function of each type. Format is {type: function}
+                          t['STR']: lambda: self.strings[self.varint()],
+                          t['INT']: self.zigzag,
+                          t['FLOAT']: lambda: self.unpack('<d', 8),
+                          t['FALSE']: lambda: False,
+                          t['TRUE']: lambda: True,
+                          t['COLOR']: lambda: '#{:06X}'.format(self.unpack('<I', 4)),
+                          t['HEX']: self.varint,
+                          t['LIST']: lambda: [self.zigzag() for i in range(self.varint())]}
+
+    def varint(self):
+        """function reads an unsigned varint
+
+        :rtype: `int`
+        """
+        byte = self.data[self.pos]; self.pos += 1
+        if byte < 0x80: return byte                             #single byte, the most common case
+        val = byte & 0x7F; shift = 7
+        while True:
+            byte = self.data[self.pos]; self.pos += 1
+            val |= (byte & 0x7F) << shift
+            if not byte & 0x80: return val
+            shift += 7
+
+    def zigzag(self):
+        """function reads a zigzag encoded signed varint
+
+        :rtype: `int`
+        """
+        val = self.varint()
+        return (val >> 1) ^ -(val & 1)
+
+    def unpack(self, fmt, size):
+        """function reads a fixed size value
+
+        :param fmt: struct format of the value
+        :type fmt: `string`
+        :param size: value size in bytes
+        :type size: `int`
+        """
+        val = struct.unpack_from(fmt, self.data, self.pos)[0]
+        self.pos += size
+        return val
+
+    def string(self):
+        """function reads a length-prefixed UTF-8 string
+
+        :rtype: `string`
+        """
+        size = self.varint()
+        text = self.data[self.pos:self.pos + size].decode('utf-8')
+        self.pos += size
+        return text
+
+    def value(self):
+        """function reads a typed value
+
+        :returns: value converted to its type, colors are returned as "#RRGGBB" strings
+        """
+        t = self.data[self.pos]; self.pos += 1
+        func = self.val_funcs.get(t)
+        if func is None: raise ValueError('Unknown binary config value type ' + str(t))
+        return func()
+
+    def element(self):
+        """function reads an element record and its children
+
+        :rtype: `bincfg_node`
+        """
+        self.varint()                                           #record length, only needed to skip records
+        tag = self.strings[self.varint()]
+        attrib = {}
+        for i in range(self.varint()):
+            name = self.strings[self.varint()]
+            attrib[name] = self.value()
+        value = self.value()
+        children = [self.element() for i in range(self.varint())]
+        return bincfg_node(tag, attrib, value, children)
+
+def bincfg_read(data):
+    """function decodes a binary config file
+
+    :param data: binary config file contents
+    :type data: `bytes`
+    :returns: root element
+    :rtype: `bincfg_node`
+    """
+    return bincfg_reader(data).element()
+
+def bincfg_text(val, hex_val=False):
+    """function converts a decoded value back to its XML text
+
+    :param val: decoded value
+    :param hex_val: (optional) value was stored as a "0x.." value
+    :type hex_val: `boolean`
+    :rtype: `string`
+    """
+    if val is None: return ''
+    if hex_val and type(val) == int: return hex(val)
+    if type(val) == list: return ','.join(str(v) for v in val)
+    if type(val) == float: return repr(val)
+    return str(val)
+
+def bincfg_verify(root, data):
+    """function checks that a binary config decodes to the same configuration as the XML it was made from.
+    Every tag, attribute, and value is compared as XML text.
+
+    :param root: root XML element, or element tree
+    :type root: `ET.Element` or `ET.ElementTree`
+    :param data: binary config file contents
+    :type data: `bytes`
+    :returns: list of differences, empty if the configurations match
+    :rtype: `list` of `string`
+    """
+    if hasattr(root, 'getroot'): root = root.getroot()
+    tmp_diffs = []
+    def chk(xml_ele, node, path):
+        path = path + '/' + xml_ele.tag
+        if xml_ele.tag != node.tag: tmp_diffs.append(path + ': tag is ' + node.tag); return
+        for name, val in xml_ele.attrib.items():
+            if name not in node.attrib or bincfg_text(node.attrib[name], val[:2] == '0x') != val:
+                tmp_diffs.append(path + ': attribute ' + name + ' differs')
+        if len(node.attrib) != len(xml_ele.attrib): tmp_diffs.append(path + ': attribute count differs')
+        if not len(xml_ele):
+            text = (xml_ele.text or '').strip()
+            if bincfg_text(node.value, text[:2] == '0x') != text: tmp_diffs.append(path + ': value differs')
+        if len(node) != len(xml_ele): tmp_diffs.append(path + ': child count differs'); return
+        for xml_child, child in zip(xml_ele, node): chk(xml_child, child, path)
+
+    try: chk(root, bincfg_read(data), '')
+    except (ValueError, IndexError, struct.error) as e: tmp_diffs.append('binary config could not be read: ' + str(e))
+    return tmp_diffs
@@ -0,0 +1,220 @@
+"""
+File:       dash_cost.py
+Function:   This file handles estimating how long the dash takes to redraw each page, so pages that are too
+            heavy to redraw within the dash refresh period are flagged before a config is loaded on a dash.
+
+            The estimate uses the compiled render plan (see dash_render.py): at each refresh the dash restores
+            the page regions from the static page image, redraws the live items in them, and decodes the CAN
+            channel updates received since the last refresh. Each of these is given a cost from a set of
+            coefficients (in microseconds), which are calibrated by timing the same drawing operations with a
+            micro-benchmark. The benchmark only uses PIL, so it can be run on the dash hardware with the CLI
+            "calibrate" command and the resulting calibration file copied back to the builder.
+"""
+from .sys import *
+from .com_defs import rectangle_points              #needed for pad polygons
+from .dash_render import render_plan, render_smooth, render_fontLoad, render_fontFile, render_bboxOverlap, render_num
+from PIL import ImageDraw
+import json
+import time
+
+#---cost model coefficients, in microseconds. Defaults are conservative values for the dash hardware
+Cost_coef_dflt = {'ITEM': 10.0,         #fixed cost of drawing any item
+                  'FILL_PX': 0.007,     #per pixel filled by a rectangle, oval, or pad
+                  'POLY_PT': 1.5,       #per point of a smoothed pad outline
+                  'GLYPH': 450.0,       #per text character
+                  'TEXT_PX': 0.2,       #per pixel of text box area
+                  'BLIT_PX': 0.007,     #per pixel copied from an image
+                  'CH_UPD': 13.0}       #per CAN channel value update (decode and format)
+
+#---calibration constants
+cost_calibFile = os.path.join(sys_cache_dir, 'frame_cost.json')    #default calibration file
+cost_calibReps = 50             #number of times each benchmark operation is timed, fastest time is used
+cost_calibSz = 200              #size in pixels of the benchmark fill and copy areas
+
+def cost_loadCoef(filepath=cost_calibFile):
+    """function loads the cost coefficients from a calibration file. Coefficients missing from the file
+    (or all of them, if there's no calibration file) use the default values.
+
+    :param filepath: (optional) calibration file path
+    :type filepath: `string`
+    :returns: cost coefficients
+    :rtype: `dictionary` {coef_name: microseconds}
+    """
+    tmp_coef = dict(Cost_coef_dflt)
+    try:
+        with open(filepath, 'r') as f: calib = json.load(f)
+    except (OSError, ValueError): return tmp_coef
+    tmp_coef.update({k: float(v) for k, v in calib.items() if k in Cost_coef_dflt})
+    return tmp_coef
+
+def cost_saveCoef(coef, filepath=cost_calibFile):
+    """function saves the cost coefficients to a calibration file
+
+    :param coef: cost coefficients
+    :type coef: `dictionary` {coef_name: microseconds}
+    :param filepath: (optional) calibration file path
+    :type filepath: `string`
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(filepath)), exist_ok=True)
+    with open(filepath, 'w') as f: json.dump(coef, f, indent=2)
+
+def cost_time(func, reps=cost_calibReps):
+    """function times the passed function and returns the fastest run
+
+    :param func: function to time, called with no arguments
+    :type func: `function`
+    :param reps: (optional) number of runs
+    :type reps: `int`
+    :returns: fastest run time in microseconds
+    :rtype: `float`
+    """
+    best = None
+    for i in range(reps):
+        t0 = time.perf_counter(); func(); t = time.perf_counter() - t0
+        if best is None or t < best: best = t
+    return best * 1e6
+
+def cost_calibrate(reps=cost_calibReps):
+    """function runs the micro-benchmark that calibrates the cost coefficients. Each coefficient is found
+    from the difference between two operations, so the fixed cost of an operation isn't counted twice.
+
+    :param reps: (optional) number of times each operation is timed
+    :type reps: `int`
+    :returns: cost coefficients
+    :rtype: `dictionary` {coef_name: microseconds}
+    """
+    sz = cost_calibSz
+    img = Image.new('RGB', (dash_xSz, dash_ySz))
+    static_img = Image.new('RGB', (dash_xSz, dash_ySz), '#636363')
+    draw = ImageDraw.Draw(img)
+
+    t_item = cost_time(lambda: draw.rectangle((0, 0, 1, 1), fill='#FF0000'), reps)
+    t_fill = cost_time(lambda: draw.rectangle((0, 0, sz-1, sz-1), fill='#FF0000'), reps)
+    t_blit = cost_time(lambda: img.paste(static_img.crop((0, 0, sz, sz)), (0, 0)), reps)
+
+    pad_outln = render_smooth(rectangle_points(0, 0, sz, sz//3))   #pad vs a plain rectangle of the same size
+    t_pad = cost_time(lambda: draw.polygon(pad_outln, fill='#FF0000'), reps)
+    t_rect = cost_time(lambda: draw.rectangle((0, 0, sz, sz//3), fill='#FF0000'), reps)
+
+    fnt_file = render_fontFile(PyDash_fonts[0])
+    fnt_sm = render_fontLoad(fnt_file, 12); fnt_lg = render_fontLoad(fnt_file, 48)
+    t_txt1 = cost_time(lambda: draw.text((0, 0), '8', font=fnt_sm, fill='#FF0000'), reps)
+    t_txt10 = cost_time(lambda: draw.text((0, 0), '8'*10, font=fnt_sm, fill='#FF0000'), reps)
+    t_txtLg = cost_time(lambda: draw.text((0, 0), '8'*10, font=fnt_lg, fill='#FF0000'), reps)
+    area_sm = fnt_sm.getlength('8'*10) * sum(fnt_sm.getmetrics())
+    area_lg = fnt_lg.getlength('8'*10) * sum(fnt_lg.getmetrics())
+
+    frame = bytes([0x12, 0x34, 0x56, 0x78, 0x9A, 0xBC, 0xDE, 0xF0])    #decode and format a channel value
+    t_ch = cost_time(lambda: '{:.{}f}'.format(int.from_bytes(frame[1:3], 'big') * 0.1 - 40, 1), reps)
+
+    return {'ITEM': t_item,
+            'FILL_PX': max(t_fill - t_item, 0) / (sz*sz),
+            'POLY_PT': max(t_pad - t_rect, 0) / len(pad_outln),
+            'GLYPH': max(t_txt10 - t_txt1, 0) / 9,
+            'TEXT_PX': max(t_txtLg - t_txt10, 0) / (area_lg - area_sm),
+            'BLIT_PX': t_blit / (sz*sz),
+            'CH_UPD': t_ch}
+
+def cost_area(bbox):
+    """function returns the area of a bounding box
+
+    :param bbox: bounding box (x0, y0, x1, y1)
+    :rtype: `int`
+    """
+    return max(bbox[2] - bbox[0], 0) * max(bbox[3] - bbox[1], 0)
+
+class dash_frameCost:
+    """class estimates the redraw time of every page. Two times are estimated for each page: the frame time,
+    which is the worst-case time of a single refresh when every dynamic element changes, and the switch time,
+    which is the time to show the page when switching to it."""
+    def __init__(self, master, coef=None):
+        """
+        :param master: reference back to the main/master window
+        :type master: `tk.window` ref
+        :param coef: (optional) cost coefficients. Defaults to the calibration file, if one exists
+        :type coef: `dictionary` {coef_name: microseconds}
+        """
+        self.coef = coef or cost_loadCoef()                             #cost coefficients
+        self.refresh = render_num(master.cfg_core.Refresh) or refrsh_rt #dash refresh period, ms
+        self.budget = self.refresh * dash_frameBudget                   #max redraw time, ms
+        self.plan = render_plan(master)                                 #compiled pages
+        self.pages = {}                                                 #page estimates. Format is {page_name: (frame_ms, switch_ms)}
+        for name, page in self.plan.pages.items(): self.pages.update({name: self.page_cost(page)})
+
+    def item_cost(self, item):
+        """function estimates the time to draw a single item
+
+        :param item: draw item
+        :type item: `render_item`
+        :returns: draw time in microseconds
+        :rtype: `float`
+        """
+        c = self.coef
+        cost = c['ITEM']
+        if item.type == 'TEXT':
+            cost += c['GLYPH'] * (item.max_chars or 0) + c['TEXT_PX'] * cost_area(item.damage or item.bbox)
+        elif item.type == 'POLY':
+            cost += c['POLY_PT'] * len(render_smooth(item.coords)) + c['FILL_PX'] * cost_area(item.bbox)
+        elif item.type in ('IMG', 'SPRITE'):              #a sprite frame is never bigger than the item
+            cost += c['BLIT_PX'] * cost_area(item.bbox)
+        else: cost += c['FILL_PX'] * cost_area(item.bbox)      #rectangles and ovals
+        return cost
+
+    def ch_updates(self, ch):
+        """function returns the number of value updates a CAN channel can receive in a single refresh. A
+        channel without a request frequency is counted as one update.
+
+        :param ch: CAN channel definition
+        :type ch: `CAN_ch`
+        :rtype: `int`
+        """
+        period = render_num(ch.req_freq)
+        if period is None or period <= 0: return 1
+        return max(-(-self.refresh // period), 1)              #ceiling division
+
+    def page_cost(self, page):
+        """function estimates the frame and switch time of a page
+
+        :param page: compiled page
+        :type page: `render_page`
+        :returns: frame time and switch time, in ms
+        :rtype: `tuple` (frame_ms, switch_ms)
+        """
+        c = self.coef
+        live = page.live_items()
+        frame = sum(c['BLIT_PX'] * cost_area(rgn) for rgn in page.regions)     #restore regions from the static image
+        frame += sum(self.item_cost(item) for item in live
+                     if any(render_bboxOverlap(item.damage or item.bbox, rgn) for rgn in page.regions))
+        chs = set(item.ch for item in live if item.ch is not None)
+        frame += c['CH_UPD'] * sum(self.ch_updates(self.plan.channels[ch]) for ch in chs)
+
+        switch = c['BLIT_PX'] * page.width * page.height                       #show the static image
+        switch += sum(self.item_cost(item) for item in live)
+        return (frame / 1000, switch / 1000)
+
+    def report(self):
+        """function builds a text summary of the page estimates, typically for the CLI
+
+        :returns: estimate summary
+        :rtype: `string`
+        """
+        tmp_rpt = 'Frame time budget: {:.1f} ms ({:.0f}% of the {} ms refresh)\n'.format(self.budget, 100*dash_frameBudget, self.refresh)
+        for name, (frame, switch) in self.pages.items():
+            page = self.plan.pages[name]
+            tmp_rpt += '  {:<20} {:>3} live items  {:>5.1f}% redrawn  frame {:>6.2f} ms  switch {:>6.2f} ms{}\n'.format(
+                name, len(page.live_items()), 100 * page.region_frac(), frame, switch,
+                '  OVER BUDGET' if frame > self.budget else '')
+        return tmp_rpt
+
+    def XML_dashCFG_checkErrs(self):
+        """function checks the page estimates. Any page with a frame time over the budget is added to the
+        temporary error dict.
+
+        :returns: dict of attributes with errors
+        :rtype: `dictionary` {attribute_name:"error message"}
+        """
+        tmp_err_list = {}   #temp dict for compiling errors
+        for name, (frame, switch) in self.pages.items():
+            if frame > self.budget:
+                tmp_err_list.update({name + '-frame_time':'Estimated redraw time of {:.1f} ms is over the {:.1f} ms budget for a {} ms refresh'.format(frame, self.budget, self.refresh)})
+        return tmp_err_list
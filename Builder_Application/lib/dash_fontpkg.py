@@ -0,0 +1,104 @@
+"""
+File:       dash_fontpkg.py
+Function:   This file handles bundling the fonts used by the dash pages into the dash configuration package.
+            Fonts are only referenced by typeface name in the dash config, so the dash relies on the fonts
+            installed on its OS. When the package is generated, each typeface used by a text item is
+            resolved to its font file (the PyDash font directory first, see `sys_font_dir`, then the system
+            font directories), subset to the characters the dash can draw with it, and saved in the package
+            font directory with the same file name as the render plan "FONT_FILE".
+
+            The characters of each font are the text of the static labels, plus the data label glyph set
+            (see dash_glyph.py). Subsetting uses the fontTools package. It is optional; without it the full
+            font files are bundled instead. Fonts that can't be found or read aren't bundled, and are reported
+            as package warnings (see `genXML_DashCFG`).
+"""
+from .sys import *
+from .dash_glyph import glyph_set          #needed for the characters of the data labels
+from PIL import ImageFont
+import shutil
+
+try:                                        #needed for font subsetting. Optional so the full fonts are bundled without it
+    from fontTools import subset as ft_subset
+    from fontTools.ttLib import TTLibError as ft_fontError
+    ft_errors = (ft_fontError, ft_subset.Subsetter.SubsettingError, OSError)  #fonts fontTools can't read or subset
+except ImportError: ft_subset = None; ft_errors = ()
+
+def fontpkg_path(font_src):
+    """function finds the font file to bundle for a text item font. If the font isn't in the PyDash font
+    directory, the file PIL loads from the system font directories is used.
+
+    :param font_src: font file path or name, as set by `render_fontFile`
+    :type font_src: `string`
+    :returns: font file path, or None if the font can't be found
+    :rtype: `string`
+    """
+    if font_src is None: return None
+    if os.path.isfile(font_src): return font_src
+    try: return ImageFont.truetype(font_src, 12).path
+    except OSError: return None
+
+def fontpkg_chars(plan):
+    """function finds the characters each font of a render plan needs to draw. Must be called before the
+    static page images are drawn, while the static labels are still in the draw lists.
+
+    :param plan: compiled render plan
+    :type plan: `render_plan`
+    :returns: font characters. Format is {font_src: (font_file, set of characters)}. Typefaces without a font
+        file are keyed by the typeface, with a font_file of None
+    :rtype: `dictionary`
+    """
+    tmp_fonts = {}
+    for page in plan.pages.values():
+        for item in page.items:
+            if item.type != 'TEXT' or item.font is None: continue
+            font_src = item.src if item.font_file is not None else item.font[0]    #typeface if the font file wasn't found
+            chars = tmp_fonts.setdefault(font_src, (item.font_file, set()))[1]
+            if item.layer == 'DYNAMIC': chars.update(glyph_set(item))
+            else: chars.update(str(item.text or '').replace('\n', ''))
+    return tmp_fonts
+
+def fontpkg_subset(src, dst, chars):
+    """function saves a copy of a font that only contains the passed characters. Glyph positioning and
+    substitution (kerning, ligatures) of those characters is kept, hinting is removed.
+
+    :param src: font file path
+    :type src: `string`
+    :param dst: subset font file path
+    :type dst: `string`
+    :param chars: characters to keep
+    :type chars: `set` of `string`
+    """
+    options = ft_subset.Options()
+    options.hinting = False                 #the dash draws with anti-aliasing, hinting only adds size
+    options.notdef_outline = True           #keep a visible missing glyph box
+    font = ft_subset.load_font(src, options)
+    subsetter = ft_subset.Subsetter(options)
+    subsetter.populate(unicodes=[ord(c) for c in chars])
+    subsetter.subset(font)
+    ft_subset.save_font(font, dst, options)
+    font.close()
+
+def fontpkg_bundle(fonts, font_dir):
+    """function saves the fonts of a package. Fonts are subset if fontTools is available, otherwise the
+    full font files are copied.
+
+    :param fonts: font characters, see `fontpkg_chars`
+    :type fonts: `dictionary`
+    :param font_dir: directory to save the fonts in
+    :type font_dir: `string`
+    :returns: font files (or typefaces) that couldn't be found or read. The dash falls back to its installed fonts for these
+    :rtype: `list` of `string`
+    """
+    tmp_missing = []
+    os.makedirs(font_dir, exist_ok=True)
+    for font_src, (font_file, chars) in fonts.items():
+        src = fontpkg_path(font_src) if font_file is not None else None
+        if src is None: tmp_missing.append(font_file or font_src); continue
+        dst = os.path.join(font_dir, font_file)
+        try:
+            if ft_subset is None: shutil.copyfile(src, dst)
+            else:
+                try: fontpkg_subset(src, dst, chars)
+                except ft_errors: shutil.copyfile(src, dst)     #font fontTools can't subset, bundle it as-is
+        except OSError: tmp_missing.append(font_file)           #font file can't be read
+    return tmp_missing
@@ -0,0 +1,166 @@
+"""
+File:       dash_gauge.py
+Function:   This file handles the images of the gauge indicators. Drawing a smooth (anti-aliased) rotated
+            needle is slow on the dash, and the gauge face never changes. When the dash configuration
+            package is generated, the face of each gauge is drawn once (supersampled, then downsampled)
+            and drawn into the static page image like any other static image. The needle is drawn once
+            for each angle the dash can show and the frames are packed into a single grayscale sprite
+            sheet per gauge. The dash picks the frame closest to the channel value and copies it, tinted
+            with the needle color, instead of drawing the needle.
+
+            The number of frames is set so the needle tip moves about one pixel between frames, limited
+            to `gauge_spriteMax`. The sprite sheets are added to the render plan (see dash_render.py), and
+            each gauge needle item has the index of its sheet. Frame metrics are saved in the render plan
+            with each sheet:
+                X, Y, W, H:     frame box in the sprite sheet image
+                XOFF, YOFF:     frame box offset from the gauge position (anchor NW, same as the render plan)
+            Frame 0 is the lower bound of the scale, the last frame is the upper bound.
+"""
+from .sys import *
+from .com_defs import gauge_point, gauge_ticks     #needed for the gauge geometry, same as the editor
+from .dash_glyph import glyph_pack                 #needed to pack the needle frames
+from PIL import ImageDraw
+import math
+
+#---gauge image constants
+gauge_ss = 4                    #supersampling factor, images are drawn this many times larger then downsampled
+gauge_spriteMax = 360           #most frames in a needle sprite sheet
+gauge_faceImg = 'gauge_{}_face.png'     #file name of a face image. Formatted with the gauge index in the render plan
+gauge_needleImg = 'gauge_{}_needle.png' #file name of a needle sprite sheet. Formatted with the gauge index in the render plan
+
+def gauge_frames(ele):
+    """function calculates the number of needle frames of a gauge, about one per pixel of needle tip travel
+
+    :param ele: gauge indicator config
+    :type ele: `Indicator_Gauge`
+    :rtype: `int`
+    """
+    tip_r = (ele.size or 0)/2*gauge_needleLen
+    return min(max(int(math.ceil(math.radians(abs(ele.ang_sweep or 0))*tip_r)) + 1, 2), gauge_spriteMax)
+
+def gauge_face(ele, fill, outline):
+    """function draws the face of a gauge, the same as it's drawn by the editor without the needle
+
+    :param ele: gauge indicator config
+    :type ele: `Indicator_Gauge`
+    :param fill: HEX face color, None for no fill
+    :type fill: `string`
+    :param outline: HEX outline and tick color, None for no outline
+    :type outline: `string`
+    :returns: face image, transparent outside the face
+    :rtype: `PIL.Image` in RGBA mode
+    """
+    size = max(ele.size or 0, 1)
+    ss = size*gauge_ss; r = ss/2
+    img = Image.new('RGBA', (ss, ss), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    draw.ellipse((0, 0, ss - 1, ss - 1), fill=fill, outline=outline, width=2*gauge_ss)
+    if outline is not None:
+        for ang, is_major in gauge_ticks(ele.ang_start or 0, ele.ang_sweep or 0, ele.ticks_major, ele.ticks_minor):
+            r_in = r*(gauge_tickOut - (gauge_tickMajor if is_major else gauge_tickMinor))
+            draw.line(gauge_point(r, r, r_in, ang) + gauge_point(r, r, r*gauge_tickOut, ang),
+                      fill=outline, width=(2 if is_major else 1)*gauge_ss)
+    return img.resize((size, size), Image.LANCZOS)
+
+def gauge_needle(ele, ang):
+    """function draws the needle and hub of a gauge at the passed angle
+
+    :param ele: gauge indicator config
+    :type ele: `Indicator_Gauge`
+    :param ang: needle angle
+    :type ang: `float` in degrees
+    :returns: needle coverage, and its box offset from the gauge position
+    :rtype: `tuple` (`PIL.Image` in L mode, xoff, yoff)
+    """
+    size = ele.size or 0
+    r = size/2
+    tip = gauge_point(r, r, r*gauge_needleLen, ang)
+    pad = max(size*gauge_needleW/2, size*gauge_hubR) + 1
+    x0 = int(math.floor(min(r, tip[0]) - pad)); y0 = int(math.floor(min(r, tip[1]) - pad))
+    x1 = int(math.ceil(max(r, tip[0]) + pad)); y1 = int(math.ceil(max(r, tip[1]) + pad))
+
+    mask = Image.new('L', ((x1 - x0)*gauge_ss, (y1 - y0)*gauge_ss), 0)     #only the box around the needle is drawn
+    draw = ImageDraw.Draw(mask)
+    ss = lambda x, y: ((x - x0)*gauge_ss, (y - y0)*gauge_ss)
+    needle_w = max(size*gauge_needleW, 1)*gauge_ss
+    cx, cy = ss(r, r); tx, ty = ss(*tip)
+    draw.line((cx, cy, tx, ty), fill=255, width=int(round(needle_w)))
+    draw.ellipse((tx - needle_w/2, ty - needle_w/2, tx + needle_w/2, ty + needle_w/2), fill=255)   #round cap, same as the editor
+    hub_r = size*gauge_hubR*gauge_ss
+    draw.ellipse((cx - hub_r, cy - hub_r, cx + hub_r, cy + hub_r), fill=255)
+    return mask.resize((x1 - x0, y1 - y0), Image.LANCZOS), x0, y0
+
+class gauge_sprite:
+    """class contains the needle frames of a single gauge, packed into one sprite sheet image"""
+    def __init__(self, ele):
+        """
+        :param ele: gauge indicator config
+        :type ele: `Indicator_Gauge`
+        """
+        self.ele = ele                  #gauge indicator config
+        self.image = None               #sprite sheet image file name, set once packed
+        self.width = 0                  #sprite sheet width in pixels
+        self.height = 0                 #sprite sheet height in pixels
+        self.frames = []                #frame metrics, in needle angle order. Format is [(x, y, w, h, xoff, yoff)]
+
+    def pack(self):
+        """function draws every needle frame and packs them into the sprite sheet image
+
+        :returns: sprite sheet image, the needle coverage of each pixel
+        :rtype: `PIL.Image` in L mode
+        """
+        ang_start = self.ele.ang_start or 0; ang_sweep = self.ele.ang_sweep or 0
+        num_frames = gauge_frames(self.ele)
+        tmp_frames = []                                         #format is (mask, xoff, yoff)
+        for i in range(num_frames):
+            mask, xoff, yoff = gauge_needle(self.ele, ang_start + ang_sweep*i/(num_frames - 1))
+            bbox = mask.getbbox() or (0, 0, 0, 0)               #trim empty rows and columns
+            tmp_frames.append((mask.crop(bbox), xoff + bbox[0], yoff + bbox[1]))
+        pos, self.width, self.height = glyph_pack({i: f[0].size for i, f in enumerate(tmp_frames)})
+
+        img = Image.new('L', (self.width, self.height), 0)
+        self.frames = []
+        for i, (mask, xoff, yoff) in enumerate(tmp_frames):
+            img.paste(mask, pos[i])
+            self.frames.append(pos[i] + mask.size + (xoff, yoff))
+        return img
+
+    def save(self, img_dir, gauge_idx):
+        """function packs the sprite sheet and saves the sprite sheet image
+
+        :param img_dir: directory to save the sprite sheet image in
+        :type img_dir: `string`
+        :param gauge_idx: index of the gauge in the render plan. Element names are only unique within a page
+        :type gauge_idx: `int`
+        """
+        img = self.pack()
+        self.image = gauge_needleImg.format(gauge_idx)
+        img.save(os.path.join(img_dir, self.image))
+
+def gauge_bake(plan, img_dir):
+    """function draws the face image and needle sprite sheet of every gauge in a render plan. Must be
+    called before the static page images are drawn, so the faces are drawn into them.
+
+    :param plan: compiled render plan
+    :type plan: `render_plan`
+    :param img_dir: directory to save the images in
+    :type img_dir: `string`
+    :returns: needle sprite sheets, also saved to the plan `sprites`
+    :rtype: `list` of `gauge_sprite`
+    """
+    tmp_idx = {}                                                #index of each gauge. Format is {id(gauge config): index}
+    plan.sprites = []
+    for page in plan.pages.values():
+        for item in page.items:
+            if item.ele is None: continue
+            gauge_idx = tmp_idx.setdefault(id(item.ele), len(tmp_idx))     #face and needle of a gauge share the index
+            if item.type == 'IMG':                              #gauge face
+                item.image = gauge_faceImg.format(gauge_idx)
+                item.src = os.path.join(img_dir, item.image)
+                gauge_face(item.ele, item.fill, item.outline).save(item.src)
+            elif item.type == 'SPRITE':                         #gauge needle
+                item.sprite = len(plan.sprites)
+                plan.sprites.append(gauge_sprite(item.ele))
+                plan.sprites[item.sprite].save(img_dir, gauge_idx)
+                item.image = plan.sprites[item.sprite].image
+    return plan.sprites
@@ -0,0 +1,139 @@
+"""
+File:       dash_glyph.py
+Function:   This file handles the glyph atlases of the data labels. Data label values are redrawn at every
+            refresh, and rasterizing the glyphs of the value text is most of the text drawing time on the
+            dash. When the dash configuration package is generated, every character a data label can show
+            (digits, sign, and decimal point) is drawn once for each font and size used by the data labels,
+            and packed into a single grayscale atlas image per font and size. The dash can then copy each
+            glyph from the atlas, tinted with the label color, instead of drawing the text.
+
+            The atlases are added to the render plan (see dash_render.py), and each data label item has the
+            index of its atlas. The glyph metrics are saved in the render plan with each atlas:
+                X, Y, W, H:     glyph box in the atlas image
+                XOFF, YOFF:     glyph box offset from the text position (anchor NW, same as the render plan)
+                ADV:            distance to the position of the next glyph
+"""
+from .sys import *
+from .dash_render import render_fontLoad
+from PIL import ImageDraw
+import math
+
+#---glyph atlas constants
+glyph_atlasImg = 'glyph_{}_{}.png'  #file name of an atlas image. Formatted with the font file name (no extension) and pixel size
+glyph_pad = 1                   #empty pixels between glyphs in the atlas, so scaled or filtered copies don't bleed
+glyph_valueChars = '0123456789-'    #characters every data label value can show. The decimal point is added if `sigdig` is set
+
+def glyph_set(item):
+    """function returns the characters a data label item can show
+
+    :param item: data label draw item
+    :type item: `render_item`
+    :rtype: `set` of `string`
+    """
+    tmp_chars = set(glyph_valueChars)
+    if (item.sigdig or 0) > 0: tmp_chars.add('.')
+    return tmp_chars
+
+def glyph_pack(sizes, pad=glyph_pad):
+    """function packs boxes into a single image. Boxes are placed on rows (tallest first) in an image
+    about as wide as it is tall.
+
+    :param sizes: box sizes. Format is {key: (width, height)}
+    :type sizes: `dictionary`
+    :param pad: (optional) empty pixels between boxes
+    :type pad: `int`
+    :returns: box positions, format is {key: (x, y)}, and the image width and height
+    :rtype: `tuple` (positions, width, height)
+    """
+    tmp_pos = {}
+    area = sum((w + pad) * (h + pad) for w, h in sizes.values())
+    max_w = max([w for w, h in sizes.values()] or [0])
+    width = max(int(math.ceil(math.sqrt(area))), max_w + pad, 1)
+
+    x = y = row_h = 0
+    for key in sorted(sizes, key=lambda k: (sizes[k][1], k), reverse=True):
+        w, h = sizes[key]
+        if x + w > width: x, y, row_h = 0, y + row_h + pad, 0     #start a new row
+        tmp_pos.update({key: (x, y)})
+        x += w + pad; row_h = max(row_h, h)
+    return tmp_pos, width, max(y + row_h, 1)
+
+class glyph_atlas:
+    """class contains the glyphs of a single font and size, packed into one atlas image"""
+    def __init__(self, font_src, font_file, font_px):
+        """
+        :param font_src: font file path, used to draw the glyphs
+        :type font_src: `string`
+        :param font_file: font file name, as written to the render plan
+        :type font_file: `string`
+        :param font_px: font size in pixels
+        :type font_px: `int`
+        """
+        self.font_src = font_src        #font file path
+        self.font_file = font_file      #font file name
+        self.font_px = font_px          #font size in pixels
+        self.chars = set()              #characters to draw
+        self.image = None               #atlas image file name, set once packed
+        self.width = 0                  #atlas image width in pixels
+        self.height = 0                 #atlas image height in pixels
+        self.ascent = 0                 #font ascent in pixels
+        self.descent = 0                #font descent in pixels
+        self.glyphs = {}                #glyph metrics. Format is {char: (x, y, w, h, xoff, yoff, adv)}
+
+    def pack(self):
+        """function draws every glyph and packs them into the atlas image. Glyphs are placed on rows
+        (tallest first) in an atlas about as wide as it is tall.
+
+        :returns: atlas image, the glyph coverage of each pixel
+        :rtype: `PIL.Image` in L mode
+        """
+        pil_fnt = render_fontLoad(self.font_src, self.font_px)
+        self.ascent, self.descent = pil_fnt.getmetrics()
+        tmp_glyphs = []                                         #format is (char, glyph bbox)
+        for char in sorted(self.chars):
+            x0, y0, x1, y1 = pil_fnt.getbbox(char)
+            tmp_glyphs.append((char, (x0, y0, max(x1, x0), max(y1, y0))))
+        pos, self.width, self.height = glyph_pack({c: (b[2] - b[0], b[3] - b[1]) for c, b in tmp_glyphs})
+        for char, (x0, y0, x1, y1) in tmp_glyphs:
+            self.glyphs.update({char: pos[char] + (x1 - x0, y1 - y0, x0, y0, int(round(pil_fnt.getlength(char))))})
+
+        img = Image.new('L', (self.width, self.height), 0)
+        draw = ImageDraw.Draw(img)
+        for char, (x, y, w, h, xoff, yoff, adv) in self.glyphs.items():
+            if w > 0 and h > 0: draw.text((x - xoff, y - yoff), char, font=pil_fnt, fill=255)
+        return img
+
+    def save(self, img_dir):
+        """function packs the atlas and saves the atlas image
+
+        :param img_dir: directory to save the atlas image in
+        :type img_dir: `string`
+        """
+        img = self.pack()
+        self.image = glyph_atlasImg.format(os.path.splitext(self.font_file or 'default')[0].replace(' ', '_'), self.font_px)
+        img.save(os.path.join(img_dir, self.image))
+
+def glyph_bake(plan, img_dir):
+    """function builds the glyph atlas of every font and size used by the data labels of a render plan,
+    and sets the atlas index of each data label item
+
+    :param plan: compiled render plan
+    :type plan: `render_plan`
+    :param img_dir: directory to save the atlas images in
+    :type img_dir: `string`
+    :returns: glyph atlases, also saved to the plan `atlases`
+    :rtype: `list` of `glyph_atlas`
+    """
+    tmp_idx = {}                                                #atlas of each font and size. Format is {(font_src, font_px): index}
+    plan.atlases = []
+    for page in plan.pages.values():
+        for item in page.items:
+            if item.type != 'TEXT' or item.layer != 'DYNAMIC' or item.font_px is None: continue
+            key = (item.src, item.font_px)
+            if key not in tmp_idx:
+                tmp_idx.update({key: len(plan.atlases)})
+                plan.atlases.append(glyph_atlas(item.src, item.font_file, item.font_px))
+            item.atlas = tmp_idx[key]
+            plan.atlases[item.atlas].chars.update(glyph_set(item))
+    for atlas in plan.atlases: atlas.save(img_dir)
+    return plan.atlases
@@ -0,0 +1,144 @@
+"""
+File:       dash_manifest.py
+Function:   This file handles the manifest of a dash configuration package. Every package contains a manifest
+            listing each file in the package with its content hash and size. When a new package is built
+            against the manifest of the last package loaded on the dash, only the files whose hash changed
+            need to be sent. That "delta" package contains the changed files, the complete manifest of the
+            new build, and a list of files to remove from the dash.
+
+            Manifest format:
+                <MANIFEST VER="1" TYPE="FULL" or "DELTA" BASE="hash of the manifest the delta applies to">
+                    <FILE PATH="images/Background.png" HASH="sha256 hex" SIZE="bytes" />...n
+                    <REMOVE PATH="images/old.png" />...n        (delta packages only)
+                </MANIFEST>
+
+            NOTE: like CAN_decode.py, this file does not import any of the tkinter based application files
+            so it can be shared as-is with the dash application.
+"""
+
+import os
+import hashlib
+import zipfile
+import xml.etree.ElementTree as ET
+
+#---manifest constants
+manifest_name = 'PyDash_Manifest.xml'   #manifest file name, in the package root
+manifest_ver = '1'                      #manifest format version
+manifest_chunk = 1 << 16                #file read size when hashing
+
+#---manifest types
+Manifest_types = {'FULL': 'FULL',       #package contains every file
+                  'DELTA': 'DELTA'}     #package only contains the files changed from the base manifest
+
+def manifest_hash(data):
+    """function calculates the content hash of a file, or of bytes already in memory
+
+    :param data: file path, or file contents
+    :type data: `string` or `bytes`
+    :returns: sha256 hex digest
+    :rtype: `string`
+    """
+    h = hashlib.sha256()
+    if isinstance(data, bytes): h.update(data)
+    else:
+        with open(data, 'rb') as f:
+            for chunk in iter(lambda: f.read(manifest_chunk), b''): h.update(chunk)
+    return h.hexdigest()
+
+def manifest_build(pkg_dir):
+    """function hashes every file in a package directory. The manifest itself isn't included.
+
+    :param pkg_dir: package directory
+    :type pkg_dir: `string`
+    :returns: package files. Format is {relative_path: (hash, size)}, paths use "/" separators
+    :rtype: `dictionary`
+    """
+    tmp_files = {}
+    for root, dirs, files in os.walk(pkg_dir):
+        for name in files:
+            filepath = os.path.join(root, name)
+            rel_path = os.path.relpath(filepath, pkg_dir).replace(os.sep, '/')
+            if rel_path == manifest_name: continue
+            tmp_files.update({rel_path: (manifest_hash(filepath), os.path.getsize(filepath))})
+    return dict(sorted(tmp_files.items()))
+
+def manifest_XML(files, base=None, remove=()):
+    """function builds the manifest XML
+
+    :param files: package files. Format is {relative_path: (hash, size)}
+    :type files: `dictionary`
+    :param base: (optional) hash of the base manifest, only for delta packages
+    :type base: `string`
+    :param remove: (optional) paths to remove from the dash, only for delta packages
+    :type remove: `list` of `string`
+    :returns: manifest element tree
+    :rtype: XML ET.file() object
+    """
+    root = ET.Element('MANIFEST')
+    root.set('VER', manifest_ver)
+    root.set('TYPE', Manifest_types['FULL'] if base is None else Manifest_types['DELTA'])
+    if base is not None: root.set('BASE', base)
+    for path, (file_hash, size) in files.items():
+        ET.SubElement(root, 'FILE', {'PATH': path, 'HASH': file_hash, 'SIZE': str(size)})
+    for path in remove: ET.SubElement(root, 'REMOVE', {'PATH': path})
+    tree = ET.ElementTree(root)
+    ET.indent(tree, space="  ")
+    return tree
+
+def manifest_parse(data):
+    """function reads the files listed in a manifest
+
+    :param data: manifest file contents
+    :type data: `bytes`
+    :returns: package files. Format is {relative_path: (hash, size)}
+    :rtype: `dictionary`
+    """
+    root = ET.fromstring(data)
+    if root.tag != 'MANIFEST': raise ValueError('Not a PyDash package manifest')
+    return {f.get('PATH'): (f.get('HASH'), int(f.get('SIZE', 0))) for f in root.findall('FILE')}
+
+def manifest_load(filepath):
+    """function loads the manifest of a previous build, either from a package zip or a manifest file
+
+    :param filepath: package zip or manifest file path
+    :type filepath: `string`
+    :returns: manifest contents, or None if there's no manifest (like a package built before manifests)
+    :rtype: `bytes`
+    """
+    try:
+        if zipfile.is_zipfile(filepath):
+            with zipfile.ZipFile(filepath) as zf: return zf.read(manifest_name)
+        with open(filepath, 'rb') as f: return f.read()
+    except (OSError, KeyError): return None
+
+def manifest_delta(new_files, old_files):
+    """function compares the files of a new build with a previous build
+
+    :param new_files: files of the new build. Format is {relative_path: (hash, size)}
+    :type new_files: `dictionary`
+    :param old_files: files of the previous build. Format is {relative_path: (hash, size)}
+    :type old_files: `dictionary`
+    :returns: paths that are new or changed, and paths that were removed
+    :rtype: `tuple` (changed, removed) of `list`
+    """
+    changed = [path for path, (file_hash, size) in new_files.items()
+               if path not in old_files or old_files[path][0] != file_hash]
+    removed = [path for path in old_files if path not in new_files]
+    return changed, removed
+
+def manifest_verify(pkg_dir, files):
+    """function checks the files in a package directory against a manifest, typically on the dash after a
+    delta package is applied
+
+    :param pkg_dir: package directory
+    :type pkg_dir: `string`
+    :param files: manifest files. Format is {relative_path: (hash, size)}
+    :type files: `dictionary`
+    :returns: paths that are missing or don't match the manifest
+    :rtype: `list` of `string`
+    """
+    tmp_bad = []
+    for path, (file_hash, size) in files.items():
+        filepath = os.path.join(pkg_dir, *path.split('/'))
+        if not os.path.isfile(filepath) or manifest_hash(filepath) != file_hash: tmp_bad.append(path)
+    return tmp_bad
@@ -0,0 +1,157 @@
+"""
+File:       dash_rawimg.py
+Function:   This file handles the optional raw image export of the dash configuration package. Each image that
+            the dash draws (the static image of each page, plus any image left in a page draw list) is saved
+            as a raw pixel blob in the native pixel format of the display, at the size it's placed on the
+            page. The dash can then mmap a blob and copy it straight to the display, instead of decoding and
+            color converting a PNG or JPG on boot and on every page switch.
+
+            Blob format (little endian):
+                header (16 bytes):  magic "PDRI", version (uint8), pixel format (uint8, value of `Rawimg_fmts`),
+                                    width (uint16), height (uint16), row stride in bytes (uint32), 2 pad bytes
+                pixel data:         height rows of stride bytes. RGB565 pixels are uint16, RGB888 pixels are
+                                    3 bytes in R, G, B order.
+
+            Converting images is slow compared to the rest of the package, so the conversions are run in a
+            process pool, and each converted blob is cached by the hash of its source file, size, and format.
+            Unchanged images are copied from the cache the next time a package is made.
+"""
+from .sys import *
+from .dash_manifest import manifest_hash       #needed for the cache key of each source image
+from PIL import ImageChops
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import struct
+import shutil
+import mmap
+
+#---raw image constants
+rawimg_magic = b'PDRI'          #file magic
+rawimg_ver = 1                  #format version
+rawimg_hdr = struct.Struct('<4sBBHHI2x')    #file header, see the format above
+rawimg_ext = '.raw'             #raw image file extension, replaces the source image extension
+rawimg_cacheDir = os.path.join(sys_cache_dir, 'rawimg')    #converted blob cache
+
+#---raw pixel formats. Format is {name: (header value, bytes per pixel)}
+Rawimg_fmts = {'RGB565': (1, 2),
+               'RGB888': (2, 3)}
+
+def rawimg_name(file_name):
+    """function returns the raw image file name of a package image
+
+    :param file_name: package image file name
+    :type file_name: `string`
+    :rtype: `string`
+    """
+    return os.path.splitext(file_name)[0] + rawimg_ext
+
+def rawimg_pixels(img, px_fmt):
+    """function converts an RGB image to raw pixel data
+
+    :param img: image to convert
+    :type img: `PIL.Image` in RGB mode
+    :param px_fmt: pixel format, key of `Rawimg_fmts`
+    :type px_fmt: `string`
+    :returns: pixel data, rows are not padded
+    :rtype: `bytes`
+    """
+    if px_fmt == 'RGB888': return img.tobytes()
+    r, g, b = img.split()           #RGB565, built a byte at a time so the whole image is converted by PIL
+    px_hi = ImageChops.add(r.point(lambda v: v & 0xF8), g.point(lambda v: v >> 5))             #RRRRRGGG
+    px_lo = ImageChops.add(g.point(lambda v: (v << 3) & 0xE0), b.point(lambda v: v >> 3))      #GGGBBBBB
+    return Image.merge('LA', (px_lo, px_hi)).tobytes()      #interleaved lo, hi bytes = little endian uint16
+
+def rawimg_encode(src, size, px_fmt):
+    """function converts an image file to a raw image blob. Runs in the process pool, so it only uses
+    picklable arguments.
+
+    :param src: source image file path
+    :type src: `string`
+    :param size: placed image size (width, height). The image is resized if it doesn't match
+    :type size: `tuple`
+    :param px_fmt: pixel format, key of `Rawimg_fmts`
+    :type px_fmt: `string`
+    :returns: raw image blob, header and pixel data
+    :rtype: `bytes`
+    """
+    with Image.open(src) as src_img:
+        img = src_img.convert('RGB')
+        if img.size != tuple(size): img = img.resize(tuple(size), Image.LANCZOS)
+    fmt_val, px_bytes = Rawimg_fmts[px_fmt]
+    hdr = rawimg_hdr.pack(rawimg_magic, rawimg_ver, fmt_val, img.width, img.height, img.width * px_bytes)
+    return hdr + rawimg_pixels(img, px_fmt)
+
+def rawimg_cacheKey(src, size, px_fmt):
+    """function returns the cache key of a converted image
+
+    :rtype: `string`
+    """
+    return '{}_{}x{}_{}_v{}'.format(manifest_hash(src), size[0], size[1], px_fmt, rawimg_ver)
+
+def rawimg_export(jobs, out_dir, px_fmt, cache_dir=rawimg_cacheDir, workers=None):
+    """function saves the raw image blobs of the package. Blobs are copied from the cache when possible,
+    the rest are converted in a process pool and added to the cache. If a process pool can't be started,
+    the images are converted in this process.
+
+    :param jobs: images to export. Format is {raw_file_name: (source_path, (width, height))}
+    :type jobs: `dictionary`
+    :param out_dir: directory to save the blobs in
+    :type out_dir: `string`
+    :param px_fmt: pixel format, key of `Rawimg_fmts`
+    :type px_fmt: `string`
+    :param cache_dir: (optional) blob cache directory, None to disable the cache
+    :type cache_dir: `string`
+    :param workers: (optional) max number of worker processes, defaults to the number of CPUs
+    :type workers: `int`
+    :returns: number of blobs copied from the cache
+    :rtype: `int`
+    """
+    if cache_dir is not None: os.makedirs(cache_dir, exist_ok=True)
+    tmp_todo = {}                                               #jobs not in the cache. Format is {raw_file_name: cache_path}
+    for name, (src, size) in jobs.items():
+        cache_path = os.path.join(cache_dir, rawimg_cacheKey(src, size, px_fmt) + rawimg_ext) if cache_dir is not None else None
+        if cache_path is not None and os.path.isfile(cache_path): shutil.copyfile(cache_path, os.path.join(out_dir, name))
+        else: tmp_todo.update({name: cache_path})
+
+    names = list(tmp_todo)
+    args = ([jobs[n][0] for n in names], [jobs[n][1] for n in names], [px_fmt] * len(names))
+    if len(names) > 1:                                          #a pool is only worth starting for more than one image
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool: blobs = list(pool.map(rawimg_encode, *args))
+        except (OSError, BrokenProcessPool): blobs = list(map(rawimg_encode, *args))
+    else: blobs = list(map(rawimg_encode, *args))
+
+    for name, blob in zip(names, blobs):
+        with open(os.path.join(out_dir, name), 'wb') as f: f.write(blob)
+        if tmp_todo[name] is not None:
+            with open(tmp_todo[name], 'wb') as f: f.write(blob)
+    return len(jobs) - len(names)
+
+def rawimg_header(buf):
+    """function reads the header of a raw image blob
+
+    :param buf: raw image blob, or at least its header
+    :type buf: `bytes`, `mmap`, or other buffer
+    :returns: image info. Format is {'fmt': name, 'width': px, 'height': px, 'stride': bytes, 'offset': bytes}
+    :rtype: `dictionary`
+    """
+    magic, ver, fmt_val, width, height, stride = rawimg_hdr.unpack_from(buf, 0)
+    if magic != rawimg_magic or ver != rawimg_ver: raise ValueError('Not a PyDash raw image, or unsupported version')
+    px_fmt = next((k for k, v in Rawimg_fmts.items() if v[0] == fmt_val), None)
+    if px_fmt is None: raise ValueError('Unknown raw image pixel format ' + str(fmt_val))
+    return {'fmt': px_fmt, 'width': width, 'height': height, 'stride': stride, 'offset': rawimg_hdr.size}
+
+def rawimg_open(filepath):
+    """function maps a raw image blob into memory without reading it, typically on the dash
+
+    :param filepath: raw image file path
+    :type filepath: `string`
+    :returns: image info (see `rawimg_header`) and the read-only mapped blob. Pixel data starts at the
+        info 'offset'
+    :rtype: `tuple` (info, mmap)
+    """
+    with open(filepath, 'rb') as f: buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try: return rawimg_header(buf), buf
+    except (struct.error, ValueError):
+        buf.close()
+        raise
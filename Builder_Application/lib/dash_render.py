@@ -0,0 +1,656 @@
+"""
+File:       dash_render.py
+Function:   This file handles compiling the dash pages into a render plan when the dash configuration package
+            is generated. Every named reference of a page element (colors, fonts, images, CAN channels) is
+            resolved to its concrete value, the text, pad, and indicator bounding boxes are calculated, and
+            each page is flattened into a single draw list in its final z-order. The dash can then draw a
+            page straight from the list without looking up names or measuring text at run time.
+
+            Text is measured with the PyDash font files (see `sys_font_dir`) instead of tkinter fonts, so
+            the plan can be compiled without a display.
+
+            Once compiled, the static content of each page (background, static labels, and pads that never
+            change) is drawn into a single page image with PIL, so the dash only needs to show one image and
+            then draw the dynamic elements on top of it.
+
+            Each dynamic item also gets a worst-case damage rectangle (the largest area it can draw), and the
+            overlapping rectangles of a page are merged into a region map. At each refresh the dash only
+            needs to restore a changed region from the static image and redraw the items in it, instead of
+            redrawing the full display.
+
+            The plan can be compiled before the config is checked (see the frame cost estimate). Values that are
+            missing or aren't numbers never raise: elements without a position are skipped, and other values
+            fall back to their defaults. The config check reports them.
+"""
+from .sys import *
+from .com_defs import int_str, rectangle_points, gauge_point   #needed for element values, pad polygons, and gauges
+from PIL import ImageFont, ImageDraw
+import math
+
+#---render item types
+Render_types = {'IMG': 1,       #image, drawn at coords with anchor NW
+                'RECT': 2,      #rectangle (bar indicators)
+                'POLY': 3,      #smoothed polygon (background pads)
+                'TEXT': 4,      #text, drawn at coords with anchor NW
+                'OVAL': 5,      #oval (bullet indicators)
+                'SPRITE': 6}    #frame of a sprite sheet picked by the channel value, drawn at coords (gauge needles)
+
+#---render layers
+Render_layer = {'STATIC': 1,    #item never changes once the page is drawn
+                'DYNAMIC': 2}   #item is updated from a CAN channel
+
+render_fontCache = {}           #loaded PIL fonts. Format is {(font_file, px_size): ImageFont}
+render_fontSysCache = {}        #system font files found for a typeface. Format is {typeface: font file path or None}
+render_smoothSteps = 8          #number of line segments per curve when drawing smoothed polygons
+render_staticImg = '{}_static.png'  #file name of the pre-drawn static image of a page. Formatted with the page name
+render_dmgMargin = 1            #pixels added around each damage rectangle for outlines and anti-aliased edges
+
+def render_num(val):
+    """function converts an element value to a number. Unlike `int_str`, a value that isn't a number returns None
+    instead of raising, so a config that hasn't been checked can still be compiled.
+
+    :param val: value to convert
+    :type val: `string`, `integer`, `float`, or `none`
+    :rtype: `integer` or `float`, None if the value is missing or isn't a number
+    """
+    try: return int_str(val)
+    except (ValueError, TypeError, ZeroDivisionError): return None
+
+def render_placed(eles):
+    """function returns the page elements that have a position. Elements without one are reported by the config check
+
+    :param eles: page element configs
+    :type eles: `iterable`
+    :rtype: `list`
+    """
+    return [ele for ele in eles if isinstance(ele.x0, (int, float)) and isinstance(ele.y0, (int, float))]
+
+def render_fontSys(typeface):
+    """function finds the font file of a typeface in the system font directories (see `sys_fontSysDirs`). The
+    file name must match the typeface, ignoring case, spaces, dashes and underscores, either as-is or with a
+    "Regular" suffix. For example "Cascadia Mono" matches "CascadiaMono.ttf" or "CascadiaMono-Regular.ttf".
+
+    :param typeface: font typeface
+    :type typeface: `string`
+    :returns: font file path, or None if no font file matches
+    :rtype: `string`
+    """
+    if typeface not in render_fontSysCache:
+        norm = lambda name: rgx.sub(r'[\s_\-]', '', str(name)).lower()
+        key = norm(typeface)
+        tmp_regular = None                                  #file with the "Regular" suffix, used if there's no exact match
+        for font_dir in sys_fontSysDirs:
+            for root, dirs, files in os.walk(font_dir):
+                for file_name in sorted(files):
+                    stem, ext = os.path.splitext(file_name)
+                    if ext.lower() not in sys_fontExts: continue
+                    if norm(stem) == key:
+                        render_fontSysCache[typeface] = os.path.join(root, file_name)
+                        return render_fontSysCache[typeface]
+                    if norm(stem) == key + 'regular' and tmp_regular is None: tmp_regular = os.path.join(root, file_name)
+        render_fontSysCache[typeface] = tmp_regular
+    return render_fontSysCache[typeface]
+
+def render_fontFile(typeface):
+    """function finds the font file of the passed typeface. For a PyDash font the PyDash font directory is used
+    if it's available, otherwise only the file name is returned and PIL searches the system font directories.
+    Other typefaces are searched for in the system font directories (see `render_fontSys`).
+
+    :param typeface: font typeface, typically one of `PyDash_fonts`
+    :type typeface: `string`
+    :returns: font file path, or None if the typeface isn't a PyDash font and isn't installed
+    :rtype: `string`
+    """
+    file_name = PyDash_fontFiles.get(typeface)
+    if file_name is None: return render_fontSys(typeface)
+    file_path = os.path.join(sys_font_dir, file_name)
+    if os.path.isfile(file_path): return file_path
+    return file_name
+
+def render_fontPx(fnt):
+    """function converts the font point size to the pixel size drawn on the dash. Like tkinter, a
+    negative size is already in pixels.
+
+    :param fnt: font definition
+    :type fnt: `dash_font`
+    :rtype: `int`
+    """
+    point = render_num(fnt.point) or 0
+    if point < 0: return -point
+    return max(int(round(point * dash_fontScale)), 1)
+
+def render_font(fnt):
+    """function loads the PIL font of the passed font definition
+
+    :param fnt: font definition
+    :type fnt: `dash_font`
+    :rtype: `PIL.ImageFont`
+    """
+    return render_fontLoad(render_fontFile(fnt.typeface), render_fontPx(fnt))
+
+def render_fontLoad(font_file, px_size):
+    """function loads a PIL font from a font file. Loaded fonts are cached, and the PIL default font is used
+    if the font file can't be loaded.
+
+    :param font_file: font file path
+    :type font_file: `string`
+    :param px_size: font size in pixels
+    :type px_size: `int`
+    :rtype: `PIL.ImageFont`
+    """
+    key = (font_file, px_size)
+    if key not in render_fontCache:
+        try: render_fontCache[key] = ImageFont.truetype(key[0], key[1])
+        except (OSError, TypeError, AttributeError): render_fontCache[key] = ImageFont.load_default(key[1])
+    return render_fontCache[key]
+
+def render_textBBox(fnt, text, x0, y0):
+    """function calculates the bounding box of text drawn with anchor NW. Each line is the font line
+    spacing (ascent + descent) tall, and the box is as wide as the longest line.
+
+    :param fnt: font definition
+    :type fnt: `dash_font`
+    :param text: text to measure
+    :type text: `string`
+    :param x0: text x position
+    :type x0: `int`
+    :param y0: text y position
+    :type y0: `int`
+    :returns: bounding box
+    :rtype: `tuple` (x0, y0, x1, y1)
+    """
+    pil_fnt = render_font(fnt)
+    lines = str(text or '').split('\n')
+    ascent, descent = pil_fnt.getmetrics()
+    width = max(pil_fnt.getlength(line) for line in lines)
+    return (x0, y0, x0 + int(round(width)), y0 + (ascent + descent) * len(lines))
+
+def render_valueTxt(max_val, sigdig):
+    """function builds the longest value text a data label can show, with every digit shown as "0". The
+    value has at most the number of whole digits of the max value and `sigdig` digits after the decimal.
+
+    :param max_val: data label max value text
+    :type max_val: `string`
+    :param sigdig: number of digits after the decimal
+    :type sigdig: `int` or `string`
+    :rtype: `string`
+    """
+    max_txt = str(max_val or '').strip()
+    num_whole = max(len(max_txt.lstrip('-').split('.')[0]), 1)     #whole digits of the max value
+    num_dec = max(int(render_num(sigdig) or 0), 0)                  #digits after the decimal
+    tmp_txt = ('-' if max_txt.startswith('-') else '') + '0'*num_whole
+    if num_dec > 0: tmp_txt += '.' + '0'*num_dec
+    return tmp_txt
+
+def render_valueBBox(fnt, max_val, sigdig, x0, y0):
+    """function calculates the largest bounding box a data label value can be drawn in. The longest value
+    text (see `render_valueTxt`) is measured with every digit sized as the widest digit of the font.
+
+    :param fnt: font definition
+    :type fnt: `dash_font`
+    :param max_val: data label max value text
+    :type max_val: `string`
+    :param sigdig: number of digits after the decimal
+    :type sigdig: `int` or `string`
+    :param x0: text x position
+    :type x0: `int`
+    :param y0: text y position
+    :type y0: `int`
+    :returns: bounding box
+    :rtype: `tuple` (x0, y0, x1, y1)
+    """
+    pil_fnt = render_font(fnt)
+    ascent, descent = pil_fnt.getmetrics()
+    dig_w = max(pil_fnt.getlength(str(d)) for d in range(10))
+    width = sum(dig_w if c == '0' else pil_fnt.getlength(c) for c in render_valueTxt(max_val, sigdig))
+    width = max(width, pil_fnt.getlength(str(max_val or '').strip()))  #max value may not be a number
+    return (x0, y0, x0 + int(math.ceil(width)), y0 + ascent + descent)
+
+def render_smooth(points, steps=render_smoothSteps):
+    """function converts the points of a closed polygon into the outline tkinter draws for a smoothed polygon.
+    Like tkinter, each point is the control point of a quadratic curve between the midpoints of its edges.
+
+    :param points: flat list of polygon points
+    :type points: `list` of `int` [x0, y0, x1, y1, ...]
+    :param steps: (optional) number of line segments per curve
+    :type steps: `int`
+    :returns: outline points
+    :rtype: `list` of (x, y)
+    """
+    pts = list(zip(points[0::2], points[1::2]))
+    if len(pts) > 1 and pts[0] == pts[-1]: pts.pop()     #closing point is implied
+    tmp_outln = []
+    for i in range(len(pts)):
+        (x0, y0), (x1, y1), (x2, y2) = pts[i-1], pts[i], pts[(i+1) % len(pts)]
+        ax, ay = (x0+x1)/2, (y0+y1)/2                       #curve start, midpoint of the previous edge
+        bx, by = (x1+x2)/2, (y1+y2)/2                       #curve end, midpoint of the next edge
+        for n in range(steps):
+            t = n / steps
+            tmp_outln.append(((1-t)**2*ax + 2*(1-t)*t*x1 + t**2*bx, (1-t)**2*ay + 2*(1-t)*t*y1 + t**2*by))
+    return tmp_outln
+
+def render_bboxOverlap(a, b):
+    """function checks if two bounding boxes overlap
+
+    :param a: bounding box (x0, y0, x1, y1)
+    :param b: bounding box (x0, y0, x1, y1)
+    :rtype: `boolean`
+    """
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+def render_bboxUnion(a, b):
+    """function returns the smallest bounding box containing both passed boxes
+
+    :param a: bounding box (x0, y0, x1, y1)
+    :param b: bounding box (x0, y0, x1, y1)
+    :rtype: `tuple` (x0, y0, x1, y1)
+    """
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+def render_padBBox(bbox):
+    """function calculates the background pad box of a text bounding box, the same as the editor pad
+    (see `elePad_create`)
+
+    :param bbox: text bounding box
+    :type bbox: `tuple` (x0, y0, x1, y1)
+    :rtype: `tuple` (x0, y0, x1, y1)
+    """
+    return (bbox[0] - pad_margin, bbox[1], bbox[2] + pad_margin, bbox[3])
+
+def render_gaugeDamage(ele):
+    """function calculates the largest area a gauge needle can draw, which is the box around the hub and
+    every needle tip position in the sweep
+
+    :param ele: gauge indicator config
+    :type ele: `Indicator_Gauge`
+    :returns: bounding box
+    :rtype: `tuple` (x0, y0, x1, y1)
+    """
+    size = render_num(ele.size) or 0
+    r = size/2; cx = ele.x0 + r; cy = ele.y0 + r
+    ang_start = render_num(ele.ang_start) or 0; ang_sweep = render_num(ele.ang_sweep) or 0
+    tip_r = r*gauge_needleLen
+    angs = [ang_start, ang_start + ang_sweep]                  #ends of the sweep, plus each quarter turn in it
+    angs += [a for a in range(-720, 721, 90) if min(angs) < a < max(angs)]
+    pts = [gauge_point(cx, cy, tip_r, a) for a in angs]
+    pad = max(size*gauge_needleW/2, size*gauge_hubR)
+    xs = [p[0] for p in pts] + [cx]; ys = [p[1] for p in pts] + [cy]
+    return (int(math.floor(min(xs) - pad)), int(math.floor(min(ys) - pad)),
+            int(math.ceil(max(xs) + pad)), int(math.ceil(max(ys) + pad)))
+
+class render_item:
+    """class contains a single draw item of a compiled page. Only the attributes used by the item type are
+    set, the rest are left as None and aren't written to the render plan."""
+    def __init__(self, item_type, name, layer, **kwargs):
+        self.type = item_type                       #item type, key of `Render_types`
+        self.name = name                            #name of the page element the item draws
+        self.layer = layer                          #item layer, key of `Render_layer`
+        self.z = None                               #draw order on the page, lowest is drawn first
+        self.coords = kwargs.get('coords')          #draw coords. (x, y) for text and images, (x0, y0, x1, y1) for rectangles and ovals, point list for polygons
+        self.bbox = kwargs.get('bbox')              #bounding box (x0, y0, x1, y1)
+        self.fill = kwargs.get('fill')              #HEX fill color
+        self.fill_hi = kwargs.get('fill_hi')        #HEX fill color for the "hi" state (bullet indicators)
+        self.outline = kwargs.get('outline')        #HEX outline color
+        self.text = kwargs.get('text')              #static text
+        self.font = kwargs.get('font')              #font tuple
+        self.font_file = kwargs.get('font_file')    #font file name
+        self.font_px = kwargs.get('font_px')        #font size in pixels
+        self.image = kwargs.get('image')            #image file name
+        self.parent = kwargs.get('parent')          #item the background pad belongs to
+        self.ch = kwargs.get('ch')                  #index of the CAN channel in the render plan channels
+        self.sigdig = kwargs.get('sigdig')          #number of digits after the decimal
+        self.lim_lo = kwargs.get('lim_lo')          #bullet lo limit
+        self.lim_hi = kwargs.get('lim_hi')          #bullet hi limit
+        self.scale_lo = kwargs.get('scale_lo')      #bar lower bound of scale
+        self.scale_hi = kwargs.get('scale_hi')      #bar upper bound of scale
+        self.lim_DngrLo = kwargs.get('lim_DngrLo')  #danger low limit, if warnings are enabled
+        self.lim_WarnLo = kwargs.get('lim_WarnLo')  #warning low limit, if warnings are enabled
+        self.lim_WarnHi = kwargs.get('lim_WarnHi')  #warning high limit, if warnings are enabled
+        self.lim_DngrHi = kwargs.get('lim_DngrHi')  #danger high limit, if warnings are enabled
+        self.clr_alertFG = kwargs.get('clr_alertFG')#HEX alert text color, if warnings are enabled
+        self.clr_warn = kwargs.get('clr_warn')      #HEX warning color, if warnings are enabled
+        self.clr_dngr = kwargs.get('clr_dngr')      #HEX danger color, if warnings are enabled
+
+        self.damage = kwargs.get('damage')          #worst-case damage rectangle (x0, y0, x1, y1) of a dynamic item
+        self.region = None                          #index of the page region containing the damage rectangle
+        self.atlas = None                           #index of the glyph atlas of a data label, see dash_glyph.py
+        self.sprite = None                          #index of the sprite sheet of a gauge needle, see dash_gauge.py
+
+        #-----local vars
+        self.src = kwargs.get('src')                #source file path of the image or font, used when drawing the static image
+        self.max_chars = kwargs.get('max_chars')    #most characters the text can have, used for the frame cost estimate
+        self.ele = kwargs.get('ele')                #page element config, used to draw gauge images
+
+        #--create tupple for class attributes used to generate the render plan
+        self.fields_dashCFG = ('z', 'coords', 'bbox', 'fill', 'fill_hi', 'outline', 'text', 'font', 'font_file', 'font_px',
+                               'image', 'parent', 'ch', 'sigdig', 'lim_lo', 'lim_hi', 'scale_lo', 'scale_hi',
+                               'lim_DngrLo', 'lim_WarnLo', 'lim_WarnHi', 'lim_DngrHi', 'clr_alertFG', 'clr_warn', 'clr_dngr',
+                               'damage', 'region', 'atlas', 'sprite')
+
+class render_page:
+    """class contains the compiled draw list of a single page"""
+    def __init__(self, name, width, height, bg_clr):
+        self.name = name            #page name
+        self.width = width          #page width in pixels
+        self.height = height        #page height in pixels
+        self.bg_clr = bg_clr        #HEX background color
+        self.items = []             #draw list, in z-order
+        self.regions = []           #merged damage rectangles of the dynamic items. Format is [(x0, y0, x1, y1)]
+
+    def add_item(self, item):
+        """function adds an item to the top of the draw list
+
+        :param item: draw item
+        :type item: `render_item`
+        """
+        item.z = len(self.items)
+        self.items.append(item)
+
+    def layer_items(self, layer):
+        """function returns the draw items of the passed layer, in z-order
+
+        :param layer: item layer
+        :type layer: key of `Render_layer`
+        :rtype: `list` of `render_item`
+        """
+        return [item for item in self.items if item.layer == layer]
+
+    def calc_regions(self):
+        """function builds the region map of the page. The damage rectangle of each dynamic item is expanded
+        by the damage margin and clipped to the page, then overlapping rectangles are merged until none of
+        the regions overlap. Each dynamic item is tagged with the index of its region."""
+        tmp_rgns = []                                           #regions being merged. Format is [[bbox, [items]]]
+        for item in self.layer_items('DYNAMIC'):
+            x0, y0, x1, y1 = item.damage or item.bbox
+            item.damage = (max(x0 - render_dmgMargin, 0), max(y0 - render_dmgMargin, 0),
+                           min(x1 + render_dmgMargin, self.width), min(y1 + render_dmgMargin, self.height))
+            tmp_rgns.append([item.damage, [item]])
+
+        merged = True
+        while merged:                                           #merge until no regions overlap
+            merged = False
+            for i in range(len(tmp_rgns)):
+                for j in range(len(tmp_rgns) - 1, i, -1):
+                    if render_bboxOverlap(tmp_rgns[i][0], tmp_rgns[j][0]):
+                        bbox, items = tmp_rgns.pop(j)
+                        tmp_rgns[i][0] = render_bboxUnion(tmp_rgns[i][0], bbox)
+                        tmp_rgns[i][1] += items
+                        merged = True
+
+        tmp_rgns.sort(key=lambda rgn: (rgn[0][1], rgn[0][0]))  #top to bottom, left to right
+        self.regions = [bbox for bbox, items in tmp_rgns]
+        for idx, (bbox, items) in enumerate(tmp_rgns):
+            for item in items: item.region = idx
+
+    def region_frac(self):
+        """function returns the fraction of the page covered by the region map, which is the most of the
+        display that is redrawn in a single refresh
+
+        :rtype: `float` from 0 to 1
+        """
+        area = sum((x1 - x0) * (y1 - y0) for x0, y0, x1, y1 in self.regions)
+        return area / (self.width * self.height)
+
+    def live_items(self):
+        """function returns the items that are drawn live by the dash once the static content is pre-drawn.
+        These are the dynamic items, plus any static item that's drawn above a dynamic item it overlaps (it
+        can't be pre-drawn, the dynamic item would cover it).
+
+        :returns: live items, in z-order
+        :rtype: `list` of `render_item`
+        """
+        tmp_items = []
+        dyn_bbox = []                                           #bounding boxes of the dynamic items drawn so far
+        for item in self.items:
+            if item.layer == 'DYNAMIC': dyn_bbox.append(item.bbox); tmp_items.append(item)
+            elif any(render_bboxOverlap(item.bbox, bbox) for bbox in dyn_bbox): tmp_items.append(item)
+        return tmp_items
+
+    def bake_static(self, img_dir):
+        """function draws the static items of the page into a single page image, then replaces them in the
+        draw list with that image. Only the live items (see `live_items`) are left in the draw list.
+
+        :param img_dir: directory to save the page image in
+        :type img_dir: `string`
+        :returns: number of items drawn into the page image
+        :rtype: `int`
+        """
+        img = Image.new('RGBA', (self.width, self.height), self.bg_clr or '#000000')
+        draw = ImageDraw.Draw(img)
+        tmp_items = self.live_items()                           #items left in the draw list
+        for item in self.items:
+            if item not in tmp_items: self.draw_item(img, draw, item)
+        num_baked = len(self.items) - len(tmp_items)
+
+        file_name = render_staticImg.format(self.name)
+        img.convert('RGB').save(os.path.join(img_dir, file_name))
+        self.items = []
+        self.add_item(render_item('IMG', self.name + '_static', 'STATIC', coords=(0, 0),
+                                  bbox=(0, 0, self.width, self.height), image=file_name))
+        for item in tmp_items: self.add_item(item)
+        return num_baked
+
+    def draw_item(self, img, draw, item):
+        """function draws a static item into the page image, the same as it's drawn by the editor
+
+        :param img: page image
+        :type img: `PIL.Image`
+        :param draw: page image draw context
+        :type draw: `PIL.ImageDraw`
+        :param item: static item to draw
+        :type item: `render_item`
+        """
+        if item.type == 'IMG':
+            with Image.open(item.src) as src_img: img.alpha_composite(src_img.convert('RGBA'), tuple(item.coords))
+        elif item.type == 'POLY':
+            if item.fill is not None: draw.polygon(render_smooth(item.coords), fill=item.fill)
+        elif item.type == 'TEXT':
+            if item.fill is None or item.font_px is None: return
+            pil_fnt = render_fontLoad(item.src, item.font_px)
+            ascent, descent = pil_fnt.getmetrics()
+            x0, y0 = item.coords
+            for i, line in enumerate(str(item.text or '').split('\n')):   #one line at a time, spaced like tkinter
+                draw.text((x0, y0 + i*(ascent + descent)), line, font=pil_fnt, fill=item.fill)
+
+class render_plan:
+    """class compiles the render plan of all pages in the configuration. Pages are drawn in the same order
+    as the editor draws them (see `editrCntl.buildPage`): background color, background image, BG bar indicators,
+    static labels, data labels, bullet indicators, FG bar indicators, then gauge indicators. Background pads
+    are placed directly below their label."""
+    def __init__(self, master):
+        self.master_ref = master    #master window ref
+        self.channels = []          #CAN channels used by the pages, item `ch` is the index in this list
+        self.ch_idx = {}            #index of each used channel. Format is {ch_NAME: index}
+        self.pages = {}             #compiled pages. Format is {page_name: render_page}
+        self.atlases = []           #glyph atlases of the data labels, item `atlas` is the index in this list
+        self.sprites = []           #needle sprite sheets of the gauges, item `sprite` is the index in this list
+        self.compile()
+
+    def bake_static(self, img_dir):
+        """function draws the static image of every page
+
+        :param img_dir: directory to save the page images in
+        :type img_dir: `string`
+        :returns: number of items drawn into the page images. Format is {page_name: num_items}
+        :rtype: `dictionary`
+        """
+        return {name: page.bake_static(img_dir) for name, page in self.pages.items()}
+
+    def clr(self, name):
+        """function resolves a named theme color
+
+        :param name: named color
+        :type name: `string`
+        :returns: HEX color, or None if undefined
+        :rtype: `string`
+        """
+        return self.master_ref.cfg_theme.colors.get(name)
+
+    def channel(self, name):
+        """function resolves a named CAN channel to its index in the render plan channel list. Channels are
+        added to the list the first time they are used.
+
+        :param name: named CAN channel
+        :type name: `string`
+        :returns: channel index, or None if undefined
+        :rtype: `int`
+        """
+        if name not in self.ch_idx:
+            ch = self.master_ref.cfg_CAN.data_ch.get(name)
+            if ch is None: return None
+            self.ch_idx.update({name: len(self.channels)})
+            self.channels.append(ch)
+        return self.ch_idx[name]
+
+    def alert_kwargs(self, ele_cfg):
+        """function resolves the warning limits and alert colors of an element with warnings enabled
+
+        :param ele_cfg: element config (data label or bar indicator)
+        :type ele_cfg: `Label_Data` or `Indicator_Bar`
+        :rtype: `dictionary` of `render_item` kwargs
+        """
+        if not ele_cfg.warn_en: return {}
+        thm = self.master_ref.cfg_theme
+        return {'lim_DngrLo': ele_cfg.lim_DngrLo, 'lim_WarnLo': ele_cfg.lim_WarnLo,
+                'lim_WarnHi': ele_cfg.lim_WarnHi, 'lim_DngrHi': ele_cfg.lim_DngrHi,
+                'clr_alertFG': self.clr(thm.alert_FG), 'clr_warn': self.clr(thm.alert_warn), 'clr_dngr': self.clr(thm.alert_dngr)}
+
+    def compile(self):
+        """function compiles the draw list of every page"""
+        for name, page in self.master_ref.cfg_pages.items():
+            self.pages.update({name: self.compile_page(page)})
+
+    def compile_page(self, page):
+        """function compiles the draw list of a single page
+
+        :param page: page to compile
+        :type page: `dash_page`
+        :rtype: `render_page`
+        """
+        cfg = self.master_ref.cfg_core
+        width = render_num(page.width) or render_num(cfg.Res_x) or dash_xSz
+        height = render_num(page.height) or render_num(cfg.Res_y) or dash_ySz
+        tmp_page = render_page(page.name, width, height, self.clr(page.bg_clr))
+
+        img_path = self.master_ref.cfg_theme.images.get(page.bg_img)
+        if img_path is not None:
+            try:
+                with Image.open(img_path) as img: img_w, img_h = img.size
+            except OSError: img_w, img_h = width, height        #image is missing, assume it covers the page
+            tmp_page.add_item(render_item('IMG', page.bg_img, 'STATIC', coords=(0, 0), bbox=(0, 0, img_w, img_h),
+                                          image=os.path.basename(img_path), src=img_path))
+
+        for ele in render_placed(page.Ind_bar.values()):
+            if ele.ordr == 'BG': tmp_page.add_item(self.compile_bar(ele))
+        for ele in render_placed(page.Lbl_stc.values()):
+            for item in self.compile_lblStc(ele): tmp_page.add_item(item)
+        for ele in render_placed(page.Lbl_dat.values()):
+            for item in self.compile_lblDat(ele): tmp_page.add_item(item)
+        for ele in render_placed(page.Ind_blt.values()):
+            tmp_page.add_item(self.compile_blt(ele))
+        for ele in render_placed(page.Ind_bar.values()):
+            if ele.ordr != 'BG': tmp_page.add_item(self.compile_bar(ele))
+        for ele in render_placed(page.Ind_gau.values()):
+            for item in self.compile_gau(ele): tmp_page.add_item(item)
+        tmp_page.calc_regions()
+        return tmp_page
+
+    def compile_text(self, ele, size_text, layer, **kwargs):
+        """function compiles a text label and its background pad (if padded)
+
+        :param ele: label config
+        :type ele: `Label_Static` or `Label_Data`
+        :param size_text: text used to size the label
+        :type size_text: `string`
+        :param layer: text item layer
+        :type layer: key of `Render_layer`
+        :returns: list of draw items, pad first
+        :rtype: `list` of `render_item`
+        """
+        tmp_items = []
+        fnt = self.master_ref.cfg_theme.fonts.get(ele.font)
+        font_kwargs = {}
+        bbox = (ele.x0, ele.y0, ele.x0, ele.y0)
+        if fnt is not None:
+            font_file = render_fontFile(fnt.typeface)
+            font_kwargs = {'font': fnt.fnt_tup, 'font_px': render_fontPx(fnt), 'src': font_file,
+                           'font_file': os.path.basename(font_file) if font_file is not None else None}
+            bbox = render_textBBox(fnt, size_text, ele.x0, ele.y0)
+            if layer == 'DYNAMIC':                          #value text can be wider than the sizing text
+                kwargs.update({'damage': render_bboxUnion(bbox, render_valueBBox(fnt, size_text, kwargs.get('sigdig'), ele.x0, ele.y0)),
+                               'max_chars': len(render_valueTxt(size_text, kwargs.get('sigdig')))})
+            else: kwargs.update({'max_chars': len(str(size_text or '').replace('\n', ''))})
+
+        if ele.pad:
+            pad_bbox = render_padBBox(bbox)
+            pad_layer = 'DYNAMIC' if kwargs.get('clr_warn') is not None else 'STATIC'  #pad changes color with alerts
+            tmp_items.append(render_item('POLY', ele.name + '_pad', pad_layer, coords=rectangle_points(*pad_bbox),
+                                         bbox=pad_bbox, fill=self.clr(ele.clr_bg), parent=ele.name))
+        tmp_items.append(render_item('TEXT', ele.name, layer, coords=(ele.x0, ele.y0), bbox=bbox,
+                                     fill=self.clr(ele.fill), **font_kwargs, **kwargs))
+        return tmp_items
+
+    def compile_lblStc(self, ele):
+        """function compiles a static label
+
+        :param ele: static label config
+        :type ele: `Label_Static`
+        :rtype: `list` of `render_item`
+        """
+        return self.compile_text(ele, ele.text, 'STATIC', text=ele.text)
+
+    def compile_lblDat(self, ele):
+        """function compiles a data label. The label is sized using the max value text of the label, the
+        same as it's shown in the editor.
+
+        :param ele: data label config
+        :type ele: `Label_Data`
+        :rtype: `list` of `render_item`
+        """
+        return self.compile_text(ele, ele.max_val, 'DYNAMIC', ch=self.channel(ele.data_ch),
+                                 sigdig=render_num(ele.sigdig), **self.alert_kwargs(ele))
+
+    def compile_blt(self, ele):
+        """function compiles a bullet indicator
+
+        :param ele: bullet indicator config
+        :type ele: `Indicator_Bullet`
+        :rtype: `render_item`
+        """
+        size = render_num(ele.size) or 0
+        bbox = (ele.x0, ele.y0, ele.x0 + size, ele.y0 + size)
+        return render_item('OVAL', ele.name, 'DYNAMIC', coords=bbox, bbox=bbox, fill=self.clr(ele.clr_lo),
+                           fill_hi=self.clr(ele.clr_hi), outline=self.clr(ele.outln), ch=self.channel(ele.data_ch),
+                           lim_lo=ele.lim_lo, lim_hi=ele.lim_hi)
+
+    def compile_bar(self, ele):
+        """function compiles a bar indicator. The coords are the full (100%) bar.
+
+        :param ele: bar indicator config
+        :type ele: `Indicator_Bar`
+        :rtype: `render_item`
+        """
+        bbox = (ele.x0, ele.y0, ele.x0 + (render_num(ele.width) or 0), ele.y0 + (render_num(ele.height) or 0))
+        return render_item('RECT', ele.name, 'DYNAMIC', coords=bbox, bbox=bbox, fill=self.clr(ele.fill),
+                           outline=self.clr(ele.outln), ch=self.channel(ele.data_ch),
+                           scale_lo=ele.scale_lo, scale_hi=ele.scale_hi, **self.alert_kwargs(ele))
+
+    def compile_gau(self, ele):
+        """function compiles a gauge indicator into its face, which never changes, and its needle. The face
+        and needle images are drawn when the package is generated (see dash_gauge.py), so the dash only
+        copies an image for each.
+
+        :param ele: gauge indicator config
+        :type ele: `Indicator_Gauge`
+        :returns: list of draw items, face first
+        :rtype: `list` of `render_item`
+        """
+        size = render_num(ele.size) or 0
+        bbox = (ele.x0, ele.y0, ele.x0 + size, ele.y0 + size)
+        face = render_item('IMG', ele.name + '_face', 'STATIC', coords=(ele.x0, ele.y0), bbox=bbox,
+                           fill=self.clr(ele.fill), outline=self.clr(ele.outln), ele=ele)
+        needle = render_item('SPRITE', ele.name, 'DYNAMIC', coords=(ele.x0, ele.y0), bbox=bbox,
+                             damage=render_gaugeDamage(ele), fill=self.clr(ele.needle), ch=self.channel(ele.data_ch),
+                             scale_lo=ele.scale_lo, scale_hi=ele.scale_hi, ele=ele)
+        return [face, needle]
+
@@ -7,12 +7,16 @@ Function:   This file handles any of the primary dash editor window control defi
 """
 from .sys import *
 
-from datetime import datetime, timedelta
-import math
 from .com_defs import instance_widget           #needed for adding widgets to canvas after importing
 from .com_defs import addImg                    #needed for placing images on a page/frame
 from .com_defs import DashEle_types, Ele_Order  #needed for element processing
-from .com_defs import Label_Static, Label_Data, Indicator_Bullet, Indicator_Bar     #needed for making new widgets
+from .com_defs import Label_Static, Label_Data, Indicator_Bullet, Indicator_Bar, Indicator_Gauge     #needed for making new widgets
+from .com_defs import weak_attr                 #needed for the back-references of the element bindings
+import bisect
+import time
+from collections import deque, OrderedDict, Counter
+import weakref
+import gc
 
 #------------editor control class
 class editrCntl:
@@ -27,6 +31,9 @@ class editrCntl:
         self.configFile_dir = None          #XML configuration file directory
         self.configFile_name = None         #XML configuration file name
         self.current_wigtCfg = None         #config of the currently clicked widget
+        self.canv_pool = FrmEdit_canvPool(master)   #stack of built page canvases, for page switching
+        self.res_mgr = FrmEdit_resources(master)    #canvases, images, and bindings made for the pages and elements
+        self.gc_pause = FrmEdit_gcPause()           #garbage collector pause times, for the debug tools
 
     def ChangeEditorCanv(self, event):
         """function updates the displayed dash page when selected from the dropdown box
@@ -44,12 +51,21 @@ class editrCntl:
         """
         self.current_canv_name = canvName                                   #set current canvas name
         self.master_ref.cbo_frame.set(self.current_canv_name)               #set combo box selection (only needed if loading)
-        try: self.current_canv.pack_forget()                                #remove the current canvas (if its been set)
-        except: pass                                                        #if its not set then not needed
-        
-        self.current_canv = self.master_ref.cfg_pages[canvName].canvObj     #set the "current canvas" based on the passed canvas name
         self.current_page = self.master_ref.cfg_pages[canvName]             #set the current page
-        self.current_canv.pack(fill= tk.BOTH, expand=True)                  #place the new canvas in frame
+        self.current_canv = self.canv_pool.show(self.current_page)          #raise the page canvas, and set it as the "current canvas"
+        self.upd_status()                                                   #update the page switch time readout
+
+    def gotoEditorCanv_step(self, step):
+        """function goes to the page before or after the current page, in the page order. Used by the page hotkeys.
+
+        :param step: pages to move, negative for previous pages
+        :type step: `int`
+        """
+        pg_names = list(self.master_ref.cfg_pages.keys())
+        if not self.enable_cntl or len(pg_names) == 0: return
+        if self.current_canv_name in pg_names: pg_idx = pg_names.index(self.current_canv_name) + step
+        else: pg_idx = 0
+        self.gotoEditorCanv(pg_names[pg_idx % len(pg_names)])
 
     def cboFrames_upd(self):
         """function updates the "pages" or "frames" combobox on the main window. This is typically
@@ -66,14 +82,15 @@ class editrCntl:
         """function checks to see if the editor should be reset. This is usually in cases where a
         page is being deleted. The nomenclature of "Reset" w.r.t. the main editor means that it should
         be reverted back to a default state"""
+        self.canv_pool.prune()                    #remove canvases of deleted pages from the stack
         if self.current_canv_name in self.master_ref.cfg_pages: pass  #if the current canvas is still in the pages dict, then everything's OK
         else: self.ResetEditor()                  #otherwise the editor needs to be reset (likely has been deleted)
+        self.res_mgr.prune()                      #free the canvases and bindings of deleted pages
 
     def ResetEditor(self):
         """function resets the editor window. The goal is to clear out the active frame and clear 
         the current window so everything goes back to an "unselected" state"""
-        try: self.current_canv.pack_forget()    #remove the current canvas (if its been set)
-        except: pass                            #if its not set then not needed
+        self.canv_pool.clear()                  #remove all canvases from the stack
         self.current_canv = None                #set current canvas to None
         self.cboFrames_upd()          #reset combo selection box for frames
     
@@ -93,12 +110,7 @@ class editrCntl:
         :type psd_page: `dash_page` class instance
         """
         pg_canv = psd_page.canvObj  #canvas object for the editor
-
-        #--add page background image
-        frm_bg_img = self.master_ref.cfg_theme.images.get(psd_page.bg_img)  #frame background image path
-        if frm_bg_img is not None:
-            img = addImg(pg_canv, frm_bg_img)   #add background image
-            pg_canv.bg_img = img                #add/update image to canvas element dict to prevent trash collection
+        self.res_mgr.track_page(psd_page)   #track the canvas and background image, added by `buildPages_canv`
 
         #--add page elements
         for ele_cfg in psd_page.Lbl_stc.values():  #loop through all static label configs
@@ -109,6 +121,19 @@ class editrCntl:
             self.addWidget(DashEle_types['IND_BLT'], pg_canv, ele_cfg)
         for ele_cfg in psd_page.Ind_bar.values():  #loop through all bar indicator configs
             self.addWidget(DashEle_types['IND_BAR'], pg_canv, ele_cfg)
+        for ele_cfg in psd_page.Ind_gau.values():  #loop through all gauge indicator configs
+            self.addWidget(DashEle_types['IND_GAU'], pg_canv, ele_cfg)
+
+    def upd_status(self):
+        """function updates the editor status line on the main window, with the page switch time readout"""
+        tmp_status = []
+        t_last, t_avg, t_max = self.canv_pool.latency()
+        if t_last is not None: tmp_status.append('Page switch: {:.1f} ms (avg {:.1f} ms, max {:.1f} ms)'.format(t_last, t_avg, t_max))
+        num_built = len([pg for pg in self.master_ref.cfg_pages.values() if pg.canvObj is not None])
+        if num_built > 0:
+            tmp_status.append('Pages built: {} of {}, about {:.1f} of {} MB'.format(num_built, len(self.master_ref.cfg_pages),
+                                                                               self.canv_pool.mem_total()/2**20, self.master_ref.pool_budgetMB.get()))
+        self.master_ref.status_var.set('   '.join(tmp_status))
 
     def addWidget(self, ele_type, ref_canv, ele_cfg):
         """function instances new dash element to the passed canvas. This is typically used when
@@ -130,8 +155,10 @@ class editrCntl:
                                                ele_cfg.get_edtr_wgt_kwargs())   #create new widget and assign to object ref in class
         ele_cfg.upd_config({'objID':ele_refID, 'padID':ele_padID})              #set editor canvas refID and background pad ID
         
-        try:    #re-order the element if an order is specified
-            if ele_cfg.ordr == Ele_Order['BG']: ref_canv.lower(ele_cfg.objID)
+        try:    #re-order the element if an order is specified. BG elements go below the others, above the background image
+            if Ele_Order.get(ele_cfg.ordr) == Ele_Order['BG']:
+                if ref_canv.find_withtag(page_bgTag): ref_canv.tag_raise(ele_cfg.objID, page_bgTag)
+                else: ref_canv.tag_lower(ele_cfg.objID)
         except: pass
 
         ele_cfg.editor_canvObj = ref_canv                                       #set editor canvas reference for later use/updating editor
@@ -141,7 +168,9 @@ class editrCntl:
     def delWidget(self):
         """function deletes the currently selected widget"""
         if self.current_wigtCfg is not None:
-            self.current_page.del_element(self.current_wigtCfg)             #delete current selected widget
+            del_cfg = self.current_wigtCfg
+            self.current_page.del_element(del_cfg)                          #delete current selected widget
+            self.res_mgr.free_ele(del_cfg)                                  #free the element bindings and clear the selection
         else:
             messagebox.showerror("Error", "No element selected to delete!") #or display error
            
@@ -158,6 +187,7 @@ class editrCntl:
         elif ele_type == DashEle_types['LBL_DAT']: new_cfg = Label_Data(**tmp_ele_info)
         elif ele_type == DashEle_types['IND_BLT']: new_cfg = Indicator_Bullet(**tmp_ele_info)
         elif ele_type == DashEle_types['IND_BAR']: new_cfg = Indicator_Bar(**tmp_ele_info)
+        elif ele_type == DashEle_types['IND_GAU']: new_cfg = Indicator_Gauge(**tmp_ele_info)
 
         self.current_page.update_eleCfg({tmp_ele_info.get('name'): new_cfg})             #add new element to the page config
         eleCfg_ref = self.current_page.get_eleCfg(ele_type, tmp_ele_info.get('name'))    #get element configuration class reference after adding
@@ -191,18 +221,716 @@ class editrCntl:
         self.master_ref.btn_dLabel.config(state=upd_state)
         self.master_ref.btn_bltInd.config(state=upd_state)
         self.master_ref.btn_barInd.config(state=upd_state)
+        self.master_ref.btn_gauInd.config(state=upd_state)
         self.master_ref.btn_delEle.config(state=upd_state)
 
-#------------widget moving class
+#------------page switching
+class FrmEdit_canvPool:
+    '''class keeps the built page canvases stacked in the editor display frame. Each canvas is placed to fill the frame
+    once, and switching pages only raises the target canvas above the others, so Tk doesn't re-calculate the geometry
+    or re-draw a page that's already been shown. After each switch the pages next to the current page (in the page
+    order) are stacked below it in idle time, one page per idle callback, so flipping through the pages doesn't wait
+    on a first display. The time of each switch is kept for the status readout.
+
+    The built canvases are kept under a memory budget (set from the view menu). When the estimated memory of the built
+    pages is over the budget, the least recently shown pages are torn down (canvas, items, bindings, and images) and
+    re-built from the page config the next time they're shown. Prefetched pages count as the least recently shown, and
+    a page is only prefetched if its estimated memory fits in the budget, so a prefetch never tears down a page.'''
+    def __init__(self, master):
+        """
+        :param master: master window ref
+        :type master: `wndw_Main`
+        """
+        self.master_ref = master                    #master window ref
+        self.stacked = []                           #canvases placed in the display frame
+        self.lru = OrderedDict()                    #built pages, least recently shown first. Format is {page: None}
+        self.prefetch_q = []                        #pages to stack in idle time
+        self.prefetch_id = None                     #scheduled prefetch, if any
+        self.switch_ms = deque(maxlen=pool_latencyLen)  #recent page switch times, in ms
+
+    def stack(self, page, below=None):
+        """function places a page canvas in the display frame, if it's not already placed. Canvases are built
+        (see `editrCntl.buildPage`) if needed.
+
+        :param page: page to stack
+        :type page: `dash_page`
+        :param below: (optional) canvas to stack the page canvas below, so it stays hidden
+        :type below: `tk.canvas` reference
+        :returns: page canvas
+        :rtype: `tk.canvas` reference
+        """
+        if page.canvObj is None:                    #canvas not built
+            page.buildPages_canv()
+            self.master_ref.editr_cntl.buildPage(page)
+        canv = page.canvObj
+        if canv not in self.stacked:
+            canv.place(x=0, y=0, relwidth=1, relheight=1)   #fill the frame, same as the page canvas was packed
+            if below is not None: tk.Misc.lower(canv, below)  #Canvas.lower is for canvas items, use the widget lower
+            self.stacked.append(canv)
+        return canv
+
+    def show(self, page):
+        """function raises the canvas of a page above the other pages, and queues the prefetch of the pages next to it
+
+        :param page: page to show
+        :type page: `dash_page`
+        :returns: page canvas
+        :rtype: `tk.canvas` reference
+        """
+        t0 = time.perf_counter()
+        canv = self.stack(page)
+        tk.Misc.tkraise(canv)                       #Canvas.tkraise is for canvas items, use the widget raise
+        canv.update_idletasks()                     #finish the geometry and re-draw, so it's part of the switch time
+        self.switch_ms.append((time.perf_counter() - t0)*1000)
+        self.lru[page] = None; self.lru.move_to_end(page)   #most recently shown
+        self.evict(page)
+        self.prefetch(page)
+        return canv
+
+    def prefetch(self, page):
+        """function queues the pages next to the passed page to be stacked in idle time, closest first. Any pages
+        still queued from the last switch are dropped.
+
+        :param page: current page
+        :type page: `dash_page`
+        """
+        pages = list(self.master_ref.cfg_pages.values())
+        if page not in pages: return
+        pg_idx = pages.index(page)
+        self.prefetch_q = []
+        for n in range(1, pool_prefetch + 1):
+            for nbr in (pages[(pg_idx + n) % len(pages)], pages[(pg_idx - n) % len(pages)]):
+                if nbr is not page and nbr not in self.prefetch_q: self.prefetch_q.append(nbr)
+        if self.prefetch_id is None and len(self.prefetch_q) > 0:
+            self.prefetch_id = self.master_ref.after_idle(self.prefetch_step)
+
+    def prefetch_step(self):
+        """function stacks the next queued page below the current page, then schedules the next one"""
+        self.prefetch_id = None
+        crnt_canv = self.master_ref.editr_cntl.current_canv
+        if len(self.prefetch_q) == 0 or crnt_canv is None: return
+        page = self.prefetch_q.pop(0)
+        if page in self.master_ref.cfg_pages.values() and self.prefetch_fits(page):
+            self.stack(page, crnt_canv)
+            if page not in self.lru: self.lru[page] = None; self.lru.move_to_end(page, last=False)    #least recently shown
+            self.master_ref.editr_cntl.upd_status()     #update the memory readout
+        if len(self.prefetch_q) > 0: self.prefetch_id = self.master_ref.after_idle(self.prefetch_step)
+
+    def prefetch_fits(self, page):
+        """function checks if a page can be prefetched without going over the memory budget. Pages that are already
+        built don't use more memory.
+
+        :param page: page to prefetch
+        :type page: `dash_page`
+        :rtype: `boolean`
+        """
+        if page.canvObj is not None: return True
+        return self.mem_total() + page_memPlan(page) <= self.budget()
+
+    def budget(self):
+        """function returns the memory budget of the built page canvases
+
+        :rtype: `int` in bytes
+        """
+        return self.master_ref.pool_budgetMB.get()*2**20
+
+    def mem_total(self):
+        """function estimates the memory held by the built page canvases
+
+        :rtype: `int` in bytes
+        """
+        return sum(page_memEst(pg.canvObj) for pg in self.master_ref.cfg_pages.values())
+
+    def evict(self, keep=None):
+        """function tears down the least recently shown pages until the built pages are under the memory budget.
+        Pages built outside of the pool (like new pages) are torn down first.
+
+        :param keep: (optional) page to keep, defaults to the current page
+        :type keep: `dash_page`
+        """
+        if keep is None: keep = self.master_ref.editr_cntl.current_page
+        budget = self.budget()
+        tmp_mem = self.mem_total()
+        pages = list(self.master_ref.cfg_pages.values())
+        tmp_order = [pg for pg in pages if pg.canvObj is not None and pg not in self.lru] + list(self.lru)
+        for page in tmp_order:
+            if tmp_mem <= budget: break
+            if page is keep or page.canvObj is None: continue
+            tmp_mem -= self.teardown(page)
+        self.master_ref.editr_cntl.upd_status()     #update the memory readout
+
+    def teardown(self, page):
+        """function frees the canvas of a page and clears the canvas refs of its elements. The page config is kept,
+        so the canvas is re-built (see `stack`) the next time the page is shown.
+
+        :param page: page to tear down
+        :type page: `dash_page`
+        :returns: estimated memory freed
+        :rtype: `int` in bytes
+        """
+        canv = page.canvObj
+        tmp_mem = page_memEst(canv)
+        self.lru.pop(page, None)
+        if page in self.prefetch_q: self.prefetch_q.remove(page)
+        if canv in self.stacked: self.stacked.remove(canv)
+        self.master_ref.editr_cntl.res_mgr.free_page(page)     #frees the canvas, its image, and the element bindings
+        return tmp_mem
+
+    def prune(self):
+        """function removes the canvases of pages that are no longer defined from the stack"""
+        tmp_canvs = [pg.canvObj for pg in self.master_ref.cfg_pages.values()]
+        for canv in [c for c in self.stacked if c not in tmp_canvs]:
+            canv.place_forget()
+            self.stacked.remove(canv)
+        pages = list(self.master_ref.cfg_pages.values())
+        for page in [pg for pg in self.lru if pg not in pages]: self.lru.pop(page)
+
+    def clear(self):
+        """function removes all canvases from the stack, and drops any queued prefetch"""
+        if self.prefetch_id is not None: self.master_ref.after_cancel(self.prefetch_id)
+        self.prefetch_id = None
+        self.prefetch_q = []
+        for canv in self.stacked: canv.place_forget()
+        self.stacked = []
+        self.lru.clear()
+
+    def latency(self):
+        """function returns the recent page switch times
+
+        :returns: last, average, and longest switch time. All None if no page has been shown
+        :rtype: `tuple` of `float` in ms
+        """
+        if len(self.switch_ms) == 0: return None, None, None
+        return self.switch_ms[-1], sum(self.switch_ms)/len(self.switch_ms), max(self.switch_ms)
+
+def page_memEst(canv):
+    """function estimates the memory held by a page canvas, its items, and its background image. Only used for the
+    page memory budget, so it's a rough estimate (see `pool_canvBytes` and `pool_itemBytes`).
+
+    :param canv: page canvas, None if not built
+    :type canv: `tk.canvas` reference
+    :rtype: `int` in bytes
+    """
+    if canv is None: return 0
+    tmp_mem = pool_canvBytes + len(canv.find_all())*pool_itemBytes
+    img = getattr(canv, 'bg_img', None)
+    if img is not None: tmp_mem += img.width()*img.height()*4     #tk photo images are 4 bytes per pixel
+    return tmp_mem
+
+def page_memPlan(page):
+    """function estimates the memory a page canvas will hold once it's built, from the page config. Same as
+    `page_memEst`, with `pool_eleItems` canvas items per element.
+
+    :param page: page, typically not built yet
+    :type page: `dash_page`
+    :rtype: `int` in bytes
+    """
+    num_eles = sum(len(d) for d in (page.Lbl_stc, page.Lbl_dat, page.Ind_blt, page.Ind_bar, page.Ind_gau))
+    tmp_mem = pool_canvBytes + num_eles*pool_eleItems*pool_itemBytes
+    img_path = page.master_ref.cfg_theme.images.get(page.bg_img) if page.master_ref is not None else None
+    if img_path is not None:
+        try:
+            with Image.open(img_path) as img: tmp_mem += img.width*img.height*4     #only the header is read
+        except OSError: pass
+    return tmp_mem
+
+#------------resource lifecycle
+class FrmEdit_resources:
+    '''class tracks the editor resources made for each page and element: the page canvas and its background image, and
+    the editor bindings of each element (see `FrmEdit_bind_widget_control`). The resources of a page or element are freed
+    together when it's deleted, when a page canvas is torn down, and when the config is cleared or re-loaded, instead of
+    waiting on (or being missed by) the garbage collector. Freed objects are kept as weak references, so the leak report
+    can list any that are still referenced somewhere.'''
+    def __init__(self, master):
+        """
+        :param master: master window ref
+        :type master: `wndw_Main`
+        """
+        self.master_ref = master                    #master window ref
+        self.pages = {}                             #tracked page canvases. Format is {page: canvas}
+        self.eles = {}                              #tracked element bindings. Format is {element: FrmEdit_bind_widget_control}
+        self.freed = []                             #freed objects. Format is [(type name, weakref)]
+
+    def track_page(self, page):
+        """function tracks the canvas of a page, once it's built
+
+        :param page: page
+        :type page: `dash_page`
+        """
+        if page.canvObj is not None: self.pages.update({page: page.canvObj})
+
+    def track_ele(self, ele_cfg, wgt_ctl):
+        """function tracks the editor bindings of an element. Bindings from an earlier build of the element are freed.
+
+        :param ele_cfg: element config
+        :type ele_cfg: `element class` - Example of an element class instance would be `Label_Static`
+        :param wgt_ctl: element editor bindings
+        :type wgt_ctl: `FrmEdit_bind_widget_control`
+        """
+        old_ctl = self.eles.get(ele_cfg)
+        if old_ctl is not None and old_ctl is not wgt_ctl: self.unbind(old_ctl)
+        self.eles.update({ele_cfg: wgt_ctl})
+
+    def unbind(self, wgt_ctl):
+        """function removes the canvas bindings and edge index entry of an element, if its canvas still exists
+
+        :param wgt_ctl: element editor bindings
+        :type wgt_ctl: `FrmEdit_bind_widget_control`
+        """
+        wgt_ctl.widgetUnbind()
+        edge_idx = getattr(wgt_ctl.parent_canv, 'edge_idx', None)
+        if edge_idx is not None: edge_idx.del_ele(id(wgt_ctl.ele_cfg))
+        self.freed_add(wgt_ctl)
+
+    def free_ele(self, ele_cfg):
+        """function frees the editor resources of an element: its bindings, and any canvas items left in its element
+        group. The canvas refs of the element config are cleared, and it's de-selected if it was selected.
+
+        :param ele_cfg: element config
+        :type ele_cfg: `element class` - Example of an element class instance would be `Label_Static`
+        """
+        wgt_ctl = self.eles.pop(ele_cfg, None)
+        if wgt_ctl is not None:
+            self.unbind(wgt_ctl)
+            try: wgt_ctl.parent_canv.delete(ele_grpTag.format(ele_cfg.name))   #items not deleted with the element (like gauge parts)
+            except tk.TclError: pass                                            #canvas already destroyed
+        ele_cfg.upd_config({'objID': None, 'padID': None})
+        ele_cfg.editor_canvObj = None; ele_cfg.wgtCtl = None
+        cntl = self.master_ref.editr_cntl
+        if ele_cfg is cntl.current_wigtCfg:             #selected element, clear the selection and properties pane
+            cntl.current_wigtCfg = None
+            self.master_ref.editr_wgtProps.current_wigtCfg = None
+            if hasattr(self.master_ref.editr_wgtProps, 'prop_frame'): self.master_ref.editr_wgtProps.vw_clearFrame()
+
+    def free_page(self, page):
+        """function frees the editor resources of a page: the bindings of its elements, its background image, and its
+        canvas (with all of its items). The page config is kept.
+
+        :param page: page
+        :type page: `dash_page`
+        """
+        canv = self.pages.pop(page, page.canvObj)
+        for ele_cfg in [ele for ele, ctl in self.eles.items() if ctl.parent_canv is canv]: self.free_ele(ele_cfg)
+        if canv is not None:
+            img = getattr(canv, 'bg_img', None)
+            if img is not None:
+                canv.bg_img = None
+                try: img.tk.call('image', 'delete', img.name)     #free the image data now, not when the last ref is dropped
+                except tk.TclError: pass
+                self.freed_add(img)
+            canv.edge_idx = None
+            try: canv.destroy()
+            except tk.TclError: pass
+            self.freed_add(canv)
+        if page.canvObj is canv: page.canvObj = None
+
+    def prune(self):
+        """function frees the resources of tracked pages that are no longer defined (deleted pages)"""
+        pages = list(self.master_ref.cfg_pages.values())
+        for page in [pg for pg in self.pages if pg not in pages]: self.free_page(page)
+
+    def free_all(self):
+        """function frees the resources of every tracked page and element, typically when the config is cleared or
+        before a config is loaded"""
+        for page in list(self.pages): self.free_page(page)
+        for ele_cfg in list(self.eles): self.free_ele(ele_cfg)
+
+    def freed_add(self, obj):
+        """function keeps a weak reference to a freed object, for the leak report
+
+        :param obj: freed object
+        :type obj: `object`
+        """
+        self.freed.append((type(obj).__name__, weakref.ref(obj)))
+
+    def report(self):
+        """function builds the leak report. A full garbage collection is run first, so freed objects that are still
+        alive are referenced from somewhere (a leak) and not just waiting on the collector.
+
+        :returns: report text
+        :rtype: `string`
+        """
+        gc.collect()
+        pages = list(self.master_ref.cfg_pages.values())
+        self.freed = [(name, ref) for name, ref in self.freed if ref() is not None]     #drop the collected objects
+        tmp_alive = Counter(name for name, ref in self.freed)
+        tmp_canvs = [c for c in self.master_ref.frm_DashDisplay.winfo_children() if isinstance(c, tk.Canvas)]
+        tmp_untracked = [c for c in tmp_canvs if c not in self.pages.values()]
+        tmp_imgs = [getattr(c, 'bg_img', None) for c in self.pages.values()]
+
+        tmp_rpt = 'Tracked pages: {} of {} defined\n'.format(len(self.pages), len(pages))
+        tmp_rpt += 'Tracked element bindings: {}\n'.format(len(self.eles))
+        tmp_rpt += 'Page canvases: {} ({} not tracked)\n'.format(len(tmp_canvs), len(tmp_untracked))
+        tmp_rpt += 'Tk images: {} ({} page backgrounds)\n'.format(len(self.master_ref.tk.call('image', 'names')),
+                                                               len([i for i in tmp_imgs if i is not None]))
+        tmp_rpt += 'Deleted pages not freed: {}\n'.format(len([pg for pg in self.pages if pg not in pages]))
+        tmp_rpt += 'Freed objects still referenced: '
+        if len(tmp_alive) == 0: tmp_rpt += 'none'
+        else: tmp_rpt += ', '.join('{} {}'.format(n, name) for name, n in sorted(tmp_alive.items()))
+        return tmp_rpt
+
+class FrmEdit_gcPause:
+    '''class measures the pauses of the garbage collector, using the `gc.callbacks` hook. Each collection is timed from
+    its start to its stop callback, and the times are kept for each generation.'''
+    def __init__(self):
+        self.t_start = None                         #start time of the running collection
+        self.count = [0, 0, 0]                      #collections of each generation
+        self.total_ms = [0.0, 0.0, 0.0]             #total pause time of each generation
+        self.max_ms = [0.0, 0.0, 0.0]               #longest pause of each generation
+        self.collected = [0, 0, 0]                  #objects freed by each generation
+        gc.callbacks.append(self.gc_event)
+
+    def gc_event(self, phase, info):
+        """function is called by the garbage collector at the start and stop of each collection
+
+        :param phase: 'start' or 'stop'
+        :type phase: `string`
+        :param info: collection info, 'generation' and (at stop) 'collected'
+        :type info: `dictionary`
+        """
+        if phase == 'start': self.t_start = time.perf_counter(); return
+        if self.t_start is None: return
+        pause_ms = (time.perf_counter() - self.t_start)*1000; self.t_start = None
+        gen = min(info.get('generation', 0), 2)
+        self.count[gen] += 1
+        self.total_ms[gen] += pause_ms
+        self.max_ms[gen] = max(self.max_ms[gen], pause_ms)
+        self.collected[gen] += info.get('collected', 0)
+
+    def reset(self):
+        """function clears the pause times"""
+        self.count = [0, 0, 0]; self.total_ms = [0.0, 0.0, 0.0]
+        self.max_ms = [0.0, 0.0, 0.0]; self.collected = [0, 0, 0]
+
+    def report(self):
+        """function builds the pause report, one line per generation
+
+        :returns: report text
+        :rtype: `string`
+        """
+        tmp_rpt = ''
+        for gen in range(3):
+            tmp_rpt += 'Gen {}: {} collections, {:.1f} ms total, {:.1f} ms max, {} objects freed\n'.format(
+                gen, self.count[gen], self.total_ms[gen], self.max_ms[gen], self.collected[gen])
+        tmp_rpt += 'Objects tracked by the collector: {}'.format(len(gc.get_objects()))
+        return tmp_rpt
+
+#------------element alignment
+class FrmEdit_edgeIdx:
+    '''class indexes the edges and centers of the elements on a page, for the alignment guides. The left edges, centers,
+    and right edges of every element are kept in one sorted array, and the top edges, centers, and bottom edges in another.
+    The entries of an element are replaced when it's added, moved, or changed, so finding the closest edge while dragging
+    is a bisect of each array instead of a scan of every element on the page.'''
+    def __init__(self):
+        self.x_vals = []                    #sorted x positions of element edges and centers. Format is [(x, element key)]
+        self.y_vals = []                    #sorted y positions of element edges and centers. Format is [(y, element key)]
+        self.ele_vals = {}                  #index entries of each element, for removal. Format is {element key: (x entries, y entries)}
+
+    def upd_ele(self, ele_key, bbox):
+        """function adds or replaces the edges of an element
+
+        :param ele_key: element key, unique for each element on the page
+        :type ele_key: `int`
+        :param bbox: element bounding box (x0, y0, x1, y1), None if the element has nothing drawn
+        :type bbox: `tuple`
+        """
+        self.del_ele(ele_key)
+        if bbox is None: return
+        x0, y0, x1, y1 = bbox
+        ent_x = ((x0, ele_key), ((x0 + x1)//2, ele_key), (x1, ele_key))
+        ent_y = ((y0, ele_key), ((y0 + y1)//2, ele_key), (y1, ele_key))
+        for ent in ent_x: bisect.insort(self.x_vals, ent)
+        for ent in ent_y: bisect.insort(self.y_vals, ent)
+        self.ele_vals.update({ele_key: (ent_x, ent_y)})
+
+    def del_ele(self, ele_key):
+        """function removes the edges of an element, if indexed
+
+        :param ele_key: element key
+        :type ele_key: `int`
+        """
+        ents = self.ele_vals.pop(ele_key, None)
+        if ents is None: return
+        for vals, ent_axis in zip((self.x_vals, self.y_vals), ents):
+            for ent in ent_axis: del vals[bisect.bisect_left(vals, ent)]
+
+    def find(self, axis, pos, excl_key, max_dist):
+        """function finds the indexed edge or center closest to any of the passed positions. For each position only
+        the entries on either side of its bisect point are checked, skipping the (at most 3) entries of the excluded
+        element.
+
+        :param axis: axis to search, 'x' or 'y'
+        :type axis: `string`
+        :param pos: positions of the moved element edges and center
+        :type pos: `tuple` of `int`
+        :param excl_key: key of the moved element, so it doesn't align to itself. None if not indexed
+        :type excl_key: `int`
+        :param max_dist: furthest distance to align
+        :type max_dist: `int` in pixels
+        :returns: distance to move and the aligned position, or None if nothing is in range
+        :rtype: `tuple` (distance, position)
+        """
+        vals = self.x_vals if axis == 'x' else self.y_vals
+        best = None
+        for p in pos:
+            i = bisect.bisect_left(vals, (p,))                      #first entry at or after the position
+            i_hi = i
+            while i_hi < len(vals) and vals[i_hi][1] == excl_key: i_hi += 1
+            i_lo = i - 1
+            while i_lo >= 0 and vals[i_lo][1] == excl_key: i_lo -= 1
+            for n in (i_lo, i_hi):
+                if n < 0 or n >= len(vals): continue
+                dist = vals[n][0] - p
+                if abs(dist) <= max_dist and (best is None or abs(dist) < abs(best[0])): best = (dist, vals[n][0])
+        return best
+
+def edgeIdx_get(canv):
+    """function returns the edge index of a page canvas, making it if needed. The index is kept on the canvas so it's
+    removed with the page.
+
+    :param canv: page canvas
+    :type canv: `tk.canvas` reference
+    :rtype: `FrmEdit_edgeIdx`
+    """
+    if getattr(canv, 'edge_idx', None) is None: canv.edge_idx = FrmEdit_edgeIdx()
+    return canv.edge_idx
+
+def snap_axis(edge_idx, axis, lo, hi, excl_key, guides, grid):
+    """function snaps one axis of an element move. Aligning to another element takes priority over the grid.
+
+    :param edge_idx: edge index of the page
+    :type edge_idx: `FrmEdit_edgeIdx`
+    :param axis: axis to snap, 'x' or 'y'
+    :type axis: `string`
+    :param lo: moved element low edge (left or top)
+    :type lo: `int`
+    :param hi: moved element high edge (right or bottom)
+    :type hi: `int`
+    :param excl_key: key of the moved element in the edge index
+    :type excl_key: `int`
+    :param guides: snap to other elements
+    :type guides: `bool`
+    :param grid: grid size, None to not snap to the grid
+    :type grid: `int`
+    :returns: distance to move and the guide position (None if not aligned to an element)
+    :rtype: `tuple`
+    """
+    if guides:
+        hit = edge_idx.find(axis, (lo, (lo + hi)//2, hi), excl_key, snap_guide_dist)
+        if hit is not None: return hit
+    if grid: return int(round(lo/grid))*grid - lo, None
+    return 0, None
+
+def snap_move(master, canv, bbox, dx, dy, excl_key=None):
+    """function snaps the move of an element (or the "positioning" rectangle of a new element) using the editor view
+    options. An edge or center within `snap_guide_dist` of an edge or center of another element on the page is aligned
+    to it, otherwise the top-left corner is moved to the grid if it's enabled.
+
+    :param master: master window ref, for the view options
+    :type master: `wndw_Main`
+    :param canv: page canvas
+    :type canv: `tk.canvas` reference
+    :param bbox: element bounding box before the move (x0, y0, x1, y1)
+    :type bbox: `tuple`
+    :param dx: requested move in x
+    :type dx: `int` in pixels
+    :param dy: requested move in y
+    :type dy: `int` in pixels
+    :param excl_key: (optional) key of the moved element in the edge index
+    :type excl_key: `int`
+    :returns: snapped move and the guide positions, None for no guide
+    :rtype: `tuple` (dx, dy, guide x, guide y)
+    """
+    edge_idx = edgeIdx_get(canv)
+    guides = master.snap_guides_on.get()
+    grid = master.snap_grid_size.get() if master.snap_grid_on.get() else None
+    snp_x, gx = snap_axis(edge_idx, 'x', bbox[0] + dx, bbox[2] + dx, excl_key, guides, grid)
+    snp_y, gy = snap_axis(edge_idx, 'y', bbox[1] + dy, bbox[3] + dy, excl_key, guides, grid)
+    return dx + snp_x, dy + snp_y, gx, gy
+
+def guide_draw(canv, gx=None, gy=None):
+    """function redraws the alignment guide lines on a page canvas. Called without guide positions to remove them.
+
+    :param canv: page canvas
+    :type canv: `tk.canvas` reference
+    :param gx: (optional) x position of the vertical guide
+    :type gx: `int`
+    :param gy: (optional) y position of the horizontal guide
+    :type gy: `int`
+    """
+    canv.delete(guide_tag)
+    if gx is not None: canv.create_line(gx, 0, gx, dash_ySz, fill=guide_clr, dash=guide_dash, tags=guide_tag)
+    if gy is not None: canv.create_line(0, gy, dash_xSz, gy, fill=guide_clr, dash=guide_dash, tags=guide_tag)
+
+#------------widget moving classes
+class FrmEdit_motion:
+    '''class collapses a stream of mouse motion events into at most one canvas update per display frame. Only
+    the newest event is kept, and it's applied right away if a frame has passed since the last update (using
+    the event time), otherwise once the rest of the frame has passed.'''
+    def __init__(self, widget, callback, frame_ms=drag_frame_ms):
+        """
+        :param widget: widget used to schedule the updates
+        :type widget: `tk.Widget`
+        :param callback: method that makes the canvas update, called with the newest event
+        :type callback: bound method
+        :param frame_ms: (optional) minimum time between updates
+        :type frame_ms: `int` in ms
+        """
+        self.widget = widget                        #widget used to schedule the updates
+        self.callback = weakref.WeakMethod(callback)    #canvas update function, weak so the owner isn't a reference cycle
+        self.frame_ms = frame_ms                    #minimum time between updates
+        self.pending = None                         #newest event not applied yet
+        self.after_id = None                        #scheduled update, if any
+        self.t_last = None                          #event time of the last applied update
+
+    def motion(self, evnt):
+        """function queues a motion event, replacing any queued event that hasn't been applied yet
+
+        :param evnt: the event information about the triggering event.
+        :type evnt: `Event` tkinter object
+        """
+        self.pending = evnt
+        if self.after_id is not None: return        #update is already scheduled for this frame
+        dt = self.frame_ms if self.t_last is None else evnt_dt(self.t_last, evnt.time)
+        if dt >= self.frame_ms: self.apply()
+        else: self.after_id = self.widget.after(self.frame_ms - dt, self.apply)
+
+    def apply(self):
+        """function applies the newest queued event, if there is one"""
+        self.after_id = None
+        if self.pending is None: return
+        evnt = self.pending; self.pending = None
+        self.t_last = evnt.time
+        callback = self.callback()
+        if callback is not None: callback(evnt)
+
+    def flush(self):
+        """function applies the newest queued event now, typically when the mouse is released"""
+        self.cancel_after()
+        self.apply()
+
+    def reset(self):
+        """function drops any queued event, typically when a new drag starts or the mouse leaves the canvas"""
+        self.cancel_after()
+        self.pending = None
+        self.t_last = None
+
+    def cancel_after(self):
+        """function cancels the scheduled update, if any"""
+        if self.after_id is not None: self.widget.after_cancel(self.after_id)
+        self.after_id = None
+
+def evnt_dt(t_start, t_end):
+    """function calculates the time between two tkinter event times. Event times are a 32 bit ms counter
+    from the windowing system, so the difference is taken modulo 32 bits in case the counter wrapped.
+
+    :param t_start: event time of the earlier event
+    :type t_start: `int` in ms
+    :param t_end: event time of the later event
+    :type t_end: `int` in ms
+    :returns: time between the events
+    :rtype: `int` in ms
+    """
+    return (t_end - t_start) & 0xFFFFFFFF
+
+class FrmEdit_nudge:
+    '''class moves the selected element with the arrow keys. Key presses, including auto-repeats while a key is held,
+    are added up and the element is moved at most once per display frame with a single canvas move of the element
+    group. The properties pane and the alignment guide edges are only updated once the key is released.'''
+    def __init__(self, master, frame_ms=drag_frame_ms):
+        """
+        :param master: master window ref
+        :type master: `wndw_Main`
+        :param frame_ms: (optional) minimum time between moves
+        :type frame_ms: `int` in ms
+        """
+        self.master_ref = master                    #master window ref
+        self.frame_ms = frame_ms                    #minimum time between moves
+        self.acc_dx = 0; self.acc_dy = 0            #nudges added up since the last move
+        self.after_id = None                        #scheduled move, if any
+        self.release_id = None                      #scheduled end of the nudge, if any
+        self.t_last = None                          #event time of the last move
+        self.moved_cfg = None                       #element moved since the last key release
+
+    def key_press(self, evnt, dx, dy):
+        """function adds a nudge for an arrow key press, and moves the element now if a frame has passed since the
+        last move, otherwise once the rest of the frame has passed
+
+        :param evnt: the event information about the triggering event.
+        :type evnt: `Event` tkinter object
+        :param dx: pixels to nudge in x
+        :type dx: `int`
+        :param dy: pixels to nudge in y
+        :type dy: `int`
+        """
+        if not self.master_ref.editr_cntl.enable_cntl: return
+        if evnt.widget.winfo_class() in nudge_inputCls: return  #arrow keys are used by the input widget
+        self.cancel_release()                       #an auto-repeat, the key is still held
+        self.acc_dx += dx; self.acc_dy += dy
+        if self.after_id is not None: return        #move is already scheduled for this frame
+        dt = self.frame_ms if self.t_last is None else evnt_dt(self.t_last, evnt.time)
+        self.t_last = evnt.time
+        if dt >= self.frame_ms: self.apply()
+        else: self.after_id = self.master_ref.after(self.frame_ms - dt, self.apply)
+
+    def apply(self):
+        """function moves the selected element by the added up nudges. Only the element config and the canvas
+        element group are updated."""
+        self.after_id = None
+        dx = self.acc_dx; dy = self.acc_dy
+        self.acc_dx = 0; self.acc_dy = 0
+        ele_cfg = self.master_ref.editr_cntl.current_wigtCfg
+        if ele_cfg is None or (dx == 0 and dy == 0): return
+        ele_cfg.upd_config({'x0': ele_cfg.x0 + dx, 'y0': ele_cfg.y0 + dy})            #update config information with new position
+        if(hasattr(ele_cfg, 'x1')):                                                     #if element has an x1, y1, attribute that has to be udpated as well
+            ele_cfg.upd_config({'x1': ele_cfg.x1 + dx, 'y1': ele_cfg.y1 + dy})
+        ele_cfg.editor_canvObj.move(ele_grpTag.format(ele_cfg.name), dx, dy)          #move the whole element group
+        if self.moved_cfg not in (None, ele_cfg): self.moved_cfg.wgtCtl.edge_upd()    #selection changed during the nudge, finish the last element
+        self.moved_cfg = ele_cfg
+
+    def key_release(self, evnt):
+        """function handles an arrow key release. Auto-repeat sends a release right before each repeated press, so the
+        nudge is only ended if no press follows within `nudge_release_ms`.
+
+        :param evnt: (not used) the event information about the triggering event.
+        :type evnt: `Event` tkinter object
+        """
+        self.cancel_release()
+        self.release_id = self.master_ref.after(nudge_release_ms, self.release)
+
+    def release(self):
+        """function ends a nudge. Any remaining nudge is applied, then the properties pane and alignment guide edges
+        of the moved element are updated."""
+        self.release_id = None
+        if self.after_id is not None: self.master_ref.after_cancel(self.after_id)
+        self.apply()
+        self.t_last = None
+        if self.moved_cfg is None: return
+        ele_cfg = self.moved_cfg; self.moved_cfg = None
+        if ele_cfg.wgtCtl is not None: ele_cfg.wgtCtl.edge_upd()    #update the element edges at the new position, if the page wasn't torn down
+        if ele_cfg is self.master_ref.editr_cntl.current_wigtCfg:
+            self.master_ref.editr_wgtProps.clicked_wgt(ele_cfg)     #update the properties view
+
+    def cancel_release(self):
+        """function cancels the scheduled end of the nudge, if any"""
+        if self.release_id is not None: self.master_ref.after_cancel(self.release_id)
+        self.release_id = None
+
 class FrmEdit_bind_widget_control:
     '''class for binding click/move/edit actions to elements in the editor'''
+    master_ref = weak_attr()                        #weak, the element owns this class
+    ele_cfg = weak_attr()
     def __init__(self, master, parent_canv, ele_cfg):
         self.master_ref = master                    #reference back to the master window
         self.parent_canv = parent_canv              #parent canvas assocaited with the widget
         self.ele_cfg = ele_cfg                      #base element config data
         self.ele_ID = ele_cfg.objID                 #element reference ID for use with the widget edit/control
+        self.drag_motion = FrmEdit_motion(parent_canv, self.drag_move)  #collapses drag motion to one move per frame
+        self.bind_ids = []                          #canvas bindings, for removal. Format is [(sequence, function ID)]
         self.upd_refs()                             #update external refs
+        self.edge_upd()                             #add the element edges for the alignment guides
         self.frameEditor_widgetBind()               #call bindings    
+        master.editr_cntl.res_mgr.track_ele(ele_cfg, self)  #track the bindings, so they're freed with the element
 
     def upd_refs(self):
         """function updates any class refs that are used for editor widget manipulation. For example, each
@@ -211,11 +939,26 @@ class FrmEdit_bind_widget_control:
         if hasattr(self.ele_cfg, 'padID'):self.pad_id = self.ele_cfg.padID    #background pad reference ID
         else: self.pad_id = None
 
+    def edge_upd(self):
+        """function updates the element edges in the page edge index (see `FrmEdit_edgeIdx`). Called after the
+        element is added, moved, or changed on the canvas."""
+        edgeIdx_get(self.parent_canv).upd_ele(id(self.ele_cfg), self.parent_canv.bbox(ele_grpTag.format(self.ele_cfg.name)))
+
     def frameEditor_widgetBind(self):
         """function binds mouse actions to the widget (dash element)"""
-        self.parent_canv.tag_bind(self.ele_ID, '<ButtonPress-1>', self.widget_click)
-        self.parent_canv.tag_bind(self.ele_ID, "<B1-Motion>", self.widget_drag)
-        self.parent_canv.tag_bind(self.ele_ID, "<ButtonRelease-1>", self.widget_release)
+        for seq, func in (('<ButtonPress-1>', self.widget_click),
+                          ("<B1-Motion>", self.widget_drag),
+                          ("<ButtonRelease-1>", self.widget_release)):
+            self.bind_ids.append((seq, self.parent_canv.tag_bind(self.ele_ID, seq, func)))
+
+    def widgetUnbind(self):
+        """function removes the mouse bindings of the widget. The Tcl commands made for the bindings are deleted too,
+        otherwise they keep this class (and the element) referenced until the canvas is destroyed."""
+        self.drag_motion.cancel_after()
+        for seq, func_id in self.bind_ids:
+            try: self.parent_canv.tag_unbind(self.ele_ID, seq, func_id)
+            except tk.TclError: pass                #canvas already destroyed, the commands were deleted with it
+        self.bind_ids = []
 
     def widget_click(self, evnt):
         """function handles the actions to perform when a widget is clicked. An example of this is
@@ -225,28 +968,46 @@ class FrmEdit_bind_widget_control:
         :type evnt: `Event` tkinter object
         """
         self.frmEditor_widgetLocked = True                          #lock widget temporarily
-        self.frmEditor_tClick = datetime.now()                      #set time mouse was clicked - for "debounce" of clicks
+        self.frmEditor_tClick = evnt.time                           #set event time mouse was clicked - for "debounce" of clicks
         self.frmEditor_x0 = evnt.x ; self.frmEditor_y0 = evnt.y     #set the initial "zero" point for the widget being moved (based on mouse position)
+        self.drag_dx = 0; self.drag_dy = 0                          #snapped move the element group was last moved to
+        self.drag_bbox = self.parent_canv.bbox(ele_grpTag.format(self.ele_cfg.name))  #element box before the move, for snapping
+        self.drag_motion.reset()                                    #drop any motion left from the last drag
         self.uXmoveRect_make(evnt)                                  #make the "positioning" rectangle for visual indication
         self.master_ref.editr_wgtProps.clicked_wgt(self.ele_cfg)    #update the properties view
         self.master_ref.editr_cntl.clicked_wgt(self.ele_cfg)        #update the current clicked widget in the control class
     
     def widget_drag(self, event):
         """function handles when a widget can be click/dragged in the editor by a user. Includes a built-in
-        "debounce" so that users don't accidentally move when initially clicking
+        "debounce" so that users don't accidentally move when initially clicking. Motion events are collapsed
+        so the element is moved at most once per display frame (see `FrmEdit_motion`).
         
         :param evnt: the event information about the triggering event.
         :type evnt: `Event` tkinter object
         """
         #--mouse click/unlock for "debounce" of the click/drag
         if(self.frmEditor_widgetLocked):                #if mouse is clicked and widget is locked
-            dt = self.delta_ms(self.frmEditor_tClick)   #calc time difference
+            dt = self.delta_ms(self.frmEditor_tClick, event.time)   #calc time difference
             if (dt > click_delay):                      #if the "debounce" or time delay has elapsed
                 self.frmEditor_widgetLocked = False     #then unlock widget movement
         
         #--updating position if its a valid drag
         if (not self.frmEditor_widgetLocked):           #if widget is unlocked, then move it
-            self.uXmoveRect_updPos(event)               #update position of the "positioning" rectangle for visual indication
+            self.drag_motion.motion(event)              #queue the move for the next frame
+
+    def drag_move(self, evnt):
+        """function moves the element group (element, background pad, and "positioning" rectangle) to the
+        mouse position with a single canvas move, snapped to the grid or other elements (see `snap_move`). Called
+        by `drag_motion` at most once per frame.
+
+        :param evnt: the newest motion event
+        :type evnt: `Event` tkinter object
+        """
+        dx, dy, gx, gy = snap_move(self.master_ref, self.parent_canv, self.drag_bbox,
+                                   evnt.x - self.frmEditor_x0, evnt.y - self.frmEditor_y0, id(self.ele_cfg))   #snapped move from the click position
+        self.parent_canv.move(ele_grpTag.format(self.ele_cfg.name), dx - self.drag_dx, dy - self.drag_dy)      #move the whole element group
+        self.drag_dx = dx; self.drag_dy = dy                    #update the moved position
+        guide_draw(self.parent_canv, gx, gy)                    #show the alignment guides
             
     def widget_release(self, event):
         """function handles the updates to a dash element after a click/drag and the mouse is released
@@ -254,30 +1015,30 @@ class FrmEdit_bind_widget_control:
         :param evnt: the event information about the triggering event.
         :type evnt: `Event` tkinter object
         """
-        self.uXmoveRect_del()                                               #delete the "positioning" rectangle
         if (not self.frmEditor_widgetLocked):                               #if widget is unlocked, then calculate updated position
-            dx = event.x - self.frmEditor_x0; dy = event.y - self.frmEditor_y0  #calculate change in mouse position
-            self.parent_canv.move(self.ele_ID, dx, dy)                              #move parent object
-            if self.pad_id is not None: self.parent_canv.move(self.pad_id, dx, dy)  #move background pad
+            self.drag_motion.motion(event); self.drag_motion.flush()        #move the element group to the release position
+            dx = self.drag_dx; dy = self.drag_dy                            #snapped change in position, already moved on the canvas
             new_x0 = self.ele_cfg.x0 + dx; new_y0 = self.ele_cfg.y0 + dy    #calc the new X0 and Y0 to update config
             self.ele_cfg.upd_config({'x0': new_x0, 'y0': new_y0})           #update config information with new position
             if(hasattr(self.ele_cfg, 'x1')):                                #if element has an x1, y1, attribute that has to be udpated as well
                 new_x1 = self.ele_cfg.x1 + dx; new_y1 = self.ele_cfg.y1 + dy    #calc the new X1 and Y1 to update config
                 self.ele_cfg.upd_config({'x1': new_x1, 'y1': new_y1})           #update config information with new position
             self.master_ref.editr_wgtProps.clicked_wgt(self.ele_cfg)        #call function to update the properties view
+        self.uXmoveRect_del()                                               #delete the "positioning" rectangle
+        self.edge_upd()                                                     #update the element edges at the new position
 
-    def delta_ms(self, start_time):
-        """function handles the "debounce" when a user attempts to click/drag a dash element
+    def delta_ms(self, start_time, crnt_time):
+        """function handles the "debounce" when a user attempts to click/drag a dash element. Uses the event
+        times instead of the system clock, so it's a subtraction per motion event.
         
-        :param start_time: the time assigned when an element is first clicked
+        :param start_time: the event time assigned when an element is first clicked
         :type start_time: `int`
+        :param crnt_time: the event time of the current motion event
+        :type crnt_time: `int`
         :returns: time delta from the start time to current
-        :rtype: `int`
+        :rtype: `int` in ms
         """
-        crnt_time = datetime.now()                  #get current time object
-        dt = crnt_time - start_time                 #find overall time delta
-        dt = math.trunc(dt.total_seconds()*1000)    #convert to ms    
-        return dt
+        return evnt_dt(start_time, crnt_time)
    
     def uXmoveRect_make(self, evnt):
         """function makes the UI helper "move rectangle" that shows the element position when
@@ -291,25 +1052,13 @@ class FrmEdit_bind_widget_control:
         else: wX0, wY0, wX1, wY1 = self.parent_canv.bbox(self.ele_ID)   #otherwise just the object
         self.uxRect_x0 = evnt.x; self.uxRect_y0 = evnt.y                #set the initial "zero" point for "positioning" rectangle                                                        
         self.frmEditor_UXrect = self.parent_canv.create_rectangle(wX0,wY0, wX1,wY1, 
-                                                                  outline='black', width=2) #make the "positioning" rectangle
-    
-    def uXmoveRect_updPos(self, evnt):
-        """Function handles the position updates for the UI helper "move rectangle. Some important
-        things to remember about this:
-            ~event.x and event.y are the mouse position relative to the 0,0 of the widget that is clicked
-            (upper-left corner) not the canvas
-            ~x_root and y_root are relative to the phyasical computer monitor not the widget, or editor application
-
-        param evnt: the event information about the triggering event.
-        :type evnt: `Event` tkinter object
-        """
-        dx = evnt.x - self.uxRect_x0; self.uxRect_x0=evnt.x     #calculate pixels moved and update new "zero" position
-        dy = evnt.y - self.uxRect_y0; self.uxRect_y0=evnt.y
-        self.parent_canv.move(self.frmEditor_UXrect, dx, dy)    #move "positioning" rect
+                                                                  outline='black', width=2,
+                                                                  tags=ele_grpTag.format(self.ele_cfg.name)) #make the "positioning" rectangle, moved with the element group
 
     def uXmoveRect_del(self):
         """function handles removing the UI helper "move rectangle" when the mouse is released"""
         self.parent_canv.delete(self.frmEditor_UXrect)          #delte the "positioning" rectangle
+        guide_draw(self.parent_canv)                            #remove the alignment guides
 
 class FrmEdit_widget_place:
     """class to handle the required functions when placing a new widget created from the editor window"""
@@ -319,6 +1068,7 @@ class FrmEdit_widget_place:
         self.allow_place = False                        #allow placing the widget
         self.ele_type = ele_type                        #type of widget being placed
         self.wgt_kwarg = passed_wgt_kwarg.copy()        #copy of kwargs for widget being placed
+        self.place_motion = FrmEdit_motion(self.ref_canv, self.uXmoveRect_updPos)   #collapses motion to one rectangle move per frame
 
         #results vars
         self.placed = tk.BooleanVar(value=False)    #new widget has been placed; needs to be boolvar so wait_variable can be used in main window
@@ -340,6 +1090,7 @@ class FrmEdit_widget_place:
         """
         if not self.placed.get():
             self.uXmoveRect_make(event)     #make the "positioning" rectangle
+            self.uXmoveRect_updPos(event)   #snap the "positioning" rectangle
             self.allow_place = True         #allow placing the widget if in frame
     
     def place_leave(self, event):
@@ -349,6 +1100,7 @@ class FrmEdit_widget_place:
         :type evnt: `Event` tkinter object
         """
         if not self.placed.get():
+            self.place_motion.reset()       #drop any queued move
             self.uXmoveRect_del()           #delete the "positioning" rectangle
             self.allow_place = False        #do not allow placing the widget if out of frame
     
@@ -360,7 +1112,7 @@ class FrmEdit_widget_place:
         :type evnt: `Event` tkinter object
         """
         if not self.placed.get():
-            self.uXmoveRect_updPos(event)               #update position of the "positioning" rectangle for visual indication
+            self.place_motion.motion(event)             #update position of the "positioning" rectangle at the next frame
 
     def place_click(self, event):
         """function handles the actual placement of the new widget (dash element) when clicking in the editor window
@@ -369,11 +1121,14 @@ class FrmEdit_widget_place:
         :type evnt: `Event` tkinter object
         """
         if not self.placed.get() and self.allow_place:
-            self.placed_coords.update({'x0':event.x, 'y0':event.y})         #set the resultant placed coords
+            self.place_motion.motion(event); self.place_motion.flush()      #snap the "positioning" rectangle to the click position
+            plc_x = self.uxRect_x0; plc_y = self.uxRect_y0                  #snapped placement position
+            self.placed_coords.update({'x0':plc_x, 'y0':plc_y})             #set the resultant placed coords
             if hasattr(self.wgt_kwarg, 'x1'):                               #if element requires x1, y1 coords then update those as well
                 w = self.wgt_kwarg.get('x1') - self.wgt_kwarg.get('x0');        #calc width
                 h = self.wgt_kwarg.get('y1') - self.wgt_kwarg.get('y0');        #calc height
-                self.placed_coords.update({'x1':event.x+w, 'y1':event.y+h})     #set the new x1, y1
+                self.placed_coords.update({'x1':plc_x+w, 'y1':plc_y+h})         #set the new x1, y1
+            self.place_motion.reset()                               #drop any queued move
             self.uXmoveRect_del()                                   #delete the "positioning" rectangle
             self.placed.set(True)                                   #update the positioning flag
 
@@ -402,13 +1157,17 @@ class FrmEdit_widget_place:
         """
         rect = self.frmEditor_UXrect
         prnt_canv = self.ref_canv  #parent canvas
-        dx = evnt.x - self.uxRect_x0; self.uxRect_x0=evnt.x     #calculate pixels moved and update new "zero" position
-        dy = evnt.y - self.uxRect_y0; self.uxRect_y0=evnt.y
+        new_x, new_y, gx, gy = snap_move(self.master_ref, prnt_canv,
+                                         (0, 0, self.widgt_width, self.widgt_height), evnt.x, evnt.y)  #snapped rectangle position
+        dx = new_x - self.uxRect_x0; self.uxRect_x0=new_x       #calculate pixels moved and update new "zero" position
+        dy = new_y - self.uxRect_y0; self.uxRect_y0=new_y
         prnt_canv.move(rect, dx, dy)                            #move "positioning" rect
+        guide_draw(prnt_canv, gx, gy)                           #show the alignment guides
 
     def uXmoveRect_del(self):
         """function handles removing the UI helper "move rectangle" when the mouse is released"""
         self.ref_canv.delete(self.frmEditor_UXrect)    #delte the "positioning" rectangle
+        guide_draw(self.ref_canv)                      #remove the alignment guides
 
     def preCalc_widgetSize(self):
         """function calculates the size of the new widget before placing. This information is
@@ -13,13 +13,16 @@ from .com_defs import dash_page             #needed for Dash Pages
 from .com_defs import DashEle_types         #needed for element processing
 from .com_defs import Ele_Order             #needed for element ordering in editor
 from .com_defs import Move_Page             #needed for page manipulation
-from .com_defs import updPages              #needed to update pages on config changes
+from .com_defs import updPages, updColor    #needed to update pages on config changes
 from .com_defs import strvar_str            #needed for the properties display and (none) stringvars
 from .com_defs import tup_str               #needed for deletion error messages
 from .com_defs import elePad_create         #needed for danger/warning color window
 from tkinter import Text, Scrollbar         #needed for help file
-from .com_defs import Label_Static, Label_Data, Indicator_Bullet, Indicator_Bar     #needed for handling properties
+from .com_defs import Label_Static, Label_Data, Indicator_Bullet, Indicator_Bar, Indicator_Gauge     #needed for handling properties
 from .com_defs import file_open_dialogue
+from .com_defs import wndw_notify, Popup_types    #needed for replay warnings
+from .CAN_replay import CAN_replay, CANreplay_speeds    #needed for CAN log replay
+from .CAN_dbc import CANdbc_load, CANdbc_maxList        #needed for DBC import
 
 class wndw_Colors(tk.Toplevel):
     '''Editor window for theme colors'''
@@ -120,7 +123,8 @@ class wndw_Colors(tk.Toplevel):
         if(new_color.result is not None):               #if a record was created or modified
             self.colors_ref.update(new_color.result)    #add/update dict
             self.lstbx_colors_upd()                     #update listbox
-            updPages(self.master_ref)                   #update all pages with edited property
+            for clr_name in new_color.result:
+                updColor(self.master_ref, clr_name)     #update all page objects tagged with the edited color
 
     def color_del(self):
         """function removes the configuration definition. Additionally, before removing, the external
@@ -531,9 +535,10 @@ class wndw_Fonts(tk.Toplevel):
         new_font = self.font_props(self, sel_font)
         self.grab_set() #force re-focus on current window  
         if(new_font.result is not None):                        #if a record was added or modified
-            self.fonts_ref.update({new_font.result.font_name : new_font.result})    #add/update font
+            self.master_ref.cfg_theme.set_fonts([new_font.result])  #add/update font, and its named tk font
             self.lstbx_fonts_upd()                              #update listbox
-            updPages(self.master_ref)                           #update all pages with edited property
+            for page in self.master_ref.cfg_pages.values():
+                page.update_font(new_font.result.font_name)     #re-size the pads of the labels using the font
 
     class font_props(tk.Toplevel):
         """toplevel window for modifing font configuration definitions. When instancing, if no configuration
@@ -1031,10 +1036,12 @@ class wndw_CANcore(tk.Toplevel):
         self.resizable(False,False)     #fixed size
 
         #---references to main objects
+        self.master_ref = master        #set reference to parent object
         self.CAN_ref = master.cfg_CAN   #reference to core CAN object
 
         #---local vars for updating values
         self.PID_var = tk.StringVar()       #stringvar for base PID value
+        self.bitrate_var = tk.StringVar()   #stringvar for bus bitrate value
         self.rxFilter_var = tk.BooleanVar() #boolvar for enabling RX filter
 
         self.config_window()
@@ -1052,6 +1059,12 @@ class wndw_CANcore(tk.Toplevel):
         entry_PID = tk.Entry(self.frm_main, width=10, textvariable=self.PID_var)
         entry_PID.grid(row=0, column=1, padx=10, pady=10)
 
+        #Bus bitrate
+        lbl_bitrate = tk.Label(self.frm_main, text="Bitrate (bits/sec)", font=font_hdr2)
+        lbl_bitrate.grid(row=1, column=0, padx=10, pady=(0,10))
+        cbo_bitrate = ttk.Combobox(self.frm_main, width=10, values=CAN_bitrates, textvariable=self.bitrate_var)
+        cbo_bitrate.grid(row=1, column=1, padx=10, pady=(0,10))
+
         #CAN RX filter enable
         chk_bold = tk.Checkbutton(self, text="Enable RX filter", font=font_hdr2, variable=self.rxFilter_var, onvalue=True, offvalue=False)
         chk_bold.grid(row=1, column=0 ,columnspan=2, padx=10, pady=(0,10), sticky=tk.W)
@@ -1067,6 +1080,7 @@ class wndw_CANcore(tk.Toplevel):
     def load_settings(self):
         """function loads the currently defined information into the editor window"""
         self.PID_var.set(self.CAN_ref.base_PID or sys_CAN_base_PID)
+        self.bitrate_var.set(self.CAN_ref.bitrate or sys_CAN_bitrate)
         self.rxFilter_var.set(self.CAN_ref.rx_filter or False)
 
     def on_save(self):
@@ -1075,6 +1089,7 @@ class wndw_CANcore(tk.Toplevel):
             messagebox.showwarning("Warning", "Required fields are missing, cannot save.")
         else:                                               #otherwise update config
             self.CAN_ref.base_PID = self.PID_var.get()
+            self.CAN_ref.bitrate = int(self.bitrate_var.get())     #checked by missing_req_fields
             self.CAN_ref.rx_filter = self.rxFilter_var.get()
             self.destroy()
 
@@ -1089,7 +1104,8 @@ class wndw_CANcore(tk.Toplevel):
         :rtype: `bool` - true if required fields are missing
         """
         #--create tuple of required fields
-        req_fields = (self.PID_var.get() or None,)
+        req_fields = (self.PID_var.get() or None,
+                      self.bitrate_var.get() if self.bitrate_var.get().isdigit() else None)
 
         if None in req_fields: return True  #if at least one required field is missing, return true
         else: return False
@@ -1103,6 +1119,7 @@ class wndw_CANch(tk.Toplevel):
         self.resizable(False,False)     #fixed size
         
         #---references to main objects
+        self.master_ref = master        #set reference to parent object
         self.CAN_ref = master.cfg_CAN   #reference to core CAN object
 
         self.config_window()
@@ -1126,6 +1143,8 @@ class wndw_CANch(tk.Toplevel):
         btn_chEdit.grid(row=1, column=0, padx=10, pady=(10,0))
         btn_chDel=tk.Button(self.frm_alt,text="Delete Channel", command=self.ch_del)
         btn_chDel.grid(row=2, column=0, padx=10, pady=10)
+        btn_chImport=tk.Button(self.frm_alt,text="Import DBC", command=self.ch_import)
+        btn_chImport.grid(row=3, column=0, padx=10, pady=(0,10))
 
     def lstbx_ch_upd(self):
         """function populates the listbox of available config definitions based on the current theme values"""
@@ -1133,6 +1152,36 @@ class wndw_CANch(tk.Toplevel):
         for key, val in self.CAN_ref.data_ch.items():
             self.lstbx_ch.insert(tk.END, f"{key}:{val.PID}")    #populate with current list
 
+    def ch_import(self):
+        """function prompts the user for a DBC file, then opens the signal selection window. The selected
+        signals are added as CAN channels. Any selected signals that can't be used as a CAN channel are
+        listed in a warning."""
+        dialogue_opts = { 'initialdir':self.master_ref.editr_cntl.configFile_dir,
+                          'filetypes':[('DBC','*.dbc'), ('All Files','*.*')],
+                          'title':'Import DBC'
+                        }                                       #set the dialogue options
+        file_dir, file_name = file_open_dialogue(dialogue_opts) #get the location and file to open
+        if file_name is None: return                            #user canceled
+
+        try: dbc_idx = CANdbc_load(file_dir+file_name)          #load the DBC index, cached if unchanged
+        except OSError as err:
+            messagebox.showerror("Error", "Unable to open DBC file: " + str(err), parent=self)
+            return
+
+        new_chs = self.DBC_select(self, dbc_idx)
+        self.grab_set() #force re-focus on current window
+
+        if new_chs.result is not None:                          #if signals were imported
+            tmp_chs, tmp_skipped = dbc_idx.to_CANch(new_chs.result, self.CAN_ref.data_ch.keys())
+            self.CAN_ref.data_ch.update(tmp_chs)                #add new CAN channels
+            self.lstbx_ch_upd()                                 #update listbox
+            if tmp_skipped:
+                err_msg = "The following signals can't be used as a CAN channel and were not imported:\n\n"
+                for k,v in tmp_skipped.items(): err_msg += k + ': ' + v +'\n'
+                wndw_notify(self, {'type':Popup_types['WARN'],
+                                   'title':'DBC IMPORT',
+                                   'message':err_msg})
+
     def ch_add(self):
         """function calls the config modification window for a new entry."""
         self.ch_modify(None)
@@ -1345,6 +1394,195 @@ class wndw_CANch(tk.Toplevel):
             if None in req_fields: return True  #if at least one required field is missing, return true
             else: return False
 
+    class DBC_select(tk.Toplevel):
+        """toplevel window for selecting the DBC signals to import as CAN channels. Signals are filtered by
+        the search text, and multiple signals can be selected. Large DBC files can have too many signals to
+        show at once, so only the first matches are listed but "Import All Matches" imports every match."""
+        def __init__(self, master, dbc_idx):
+            super().__init__(master)
+            self.grab_set()                     #force focus
+            self.title("Import DBC Signals")    #title bar
+            self.resizable(False,False)         #fixed size
+            self.result = None                  #list of selected signal rows
+            self.dbc_idx = dbc_idx              #DBC index
+            self.matches = []                   #signal rows matching the search text
+
+            #--working vars to store properties
+            self.search_var = tk.StringVar()
+            self.status_var = tk.StringVar()
+
+            #--search and signal list
+            self.frm_main = tk.Frame(self, highlightthickness=0)
+            self.frm_main.grid(row=0, column=0)
+            lbl_search = tk.Label(self.frm_main, text="Search", font=font_hdr2)
+            lbl_search.grid(row=0, column=0, padx=10, pady=(10,0))
+            entry_search = tk.Entry(self.frm_main, width=40, textvariable=self.search_var)
+            entry_search.grid(row=0, column=1, columnspan=2, padx=10, pady=(10,0), sticky=tk.W)
+            self.search_var.trace_add("write", self.lstbx_sig_upd)     #update list when the search changes
+
+            self.lstbx_sig = tk.Listbox(self.frm_main, width=60, height=20, selectmode=tk.EXTENDED)
+            self.lstbx_sig.grid(row=1, column=0, columnspan=2, padx=(10,0), pady=10)
+            scrl_sig = Scrollbar(self.frm_main, command=self.lstbx_sig.yview)
+            scrl_sig.grid(row=1, column=2, padx=(0,10), pady=10, sticky=tk.NS)
+            self.lstbx_sig.config(yscrollcommand=scrl_sig.set)
+            lbl_status = tk.Label(self.frm_main, textvariable=self.status_var, font=font_norm1)
+            lbl_status.grid(row=2, column=0, columnspan=3, padx=10, sticky=tk.W)
+
+            #---control buttons
+            self.frm_cntl = tk.Frame(self, highlightthickness=0)
+            self.frm_cntl.grid(row=1, column=0)
+            btn_import=tk.Button(self.frm_cntl,text="Import Selected", command=self.on_import)
+            btn_import.grid(row=0, column=0, padx=10, pady=10)
+            btn_importAll=tk.Button(self.frm_cntl,text="Import All Matches", command=self.on_importAll)
+            btn_importAll.grid(row=0, column=1, padx=10, pady=10)
+            btn_cancel=tk.Button(self.frm_cntl,text="Cancel", command=self.on_close)
+            btn_cancel.grid(row=0, column=2, padx=10, pady=10)
+
+            self.lstbx_sig_upd()
+            entry_search.focus_set()
+            self.protocol("WM_DELETE_WINDOW", self.on_close) # Handle window close button
+            self.wait_window()  #wait in this window until destroyed
+
+        def lstbx_sig_upd(self, *args):
+            """function populates the listbox with the signals matching the search text
+
+            :param args: (unused) args from the stringvar trace
+            """
+            self.matches = self.dbc_idx.find(self.search_var.get())
+            self.lstbx_sig.delete(0,tk.END)                                 #clear any existing entries
+            self.lstbx_sig.insert(tk.END, *[self.dbc_idx.label(i) for i in self.matches[:CANdbc_maxList]])
+            tmp_status = '{} of {} signals match'.format(len(self.matches), self.dbc_idx.num_signals())
+            if len(self.matches) > CANdbc_maxList: tmp_status += ', showing the first {}'.format(CANdbc_maxList)
+            self.status_var.set(tmp_status)
+
+        def on_import(self):
+            """function sets the result to the selected signals and closes the window"""
+            if(len(self.lstbx_sig.curselection()) == 0):
+                messagebox.showwarning("Warning", "No signals selected. Please select the signals to import.", parent=self)
+            else:
+                self.result = [self.matches[i] for i in self.lstbx_sig.curselection()]
+                self.destroy()
+
+        def on_importAll(self):
+            """function sets the result to all signals matching the search text and closes the window"""
+            if len(self.matches) == 0:
+                messagebox.showwarning("Warning", "No signals match the search.", parent=self)
+            else:
+                self.result = list(self.matches)
+                self.destroy()
+
+        def on_close(self): #make no changes
+            """function is called when the close or exit buttons are selected. No signals are imported."""
+            self.destroy()
+
+class wndw_CANreplay(tk.Toplevel):
+    """editor window for replaying a CAN log into the dash editor. Unlike the other editor windows, this window
+    does not grab focus so users can change the displayed dash page while the log is replaying."""
+    def __init__(self, master):
+        super().__init__(master)
+        self.title("CAN Log Replay")    #title bar
+        self.resizable(False,False)     #fixed size
+        self.transient(master)          #keep on top of the main window
+        self.master_ref = master        #set reference to parent object
+
+        #---replay control
+        self.replay = CAN_replay(master)                    #replay controller
+        self.replay.upd_callback = self.upd_status          #update status display on each replay update
+
+        #---local vars for updating values
+        self.log_name = tk.StringVar(value='No log loaded') #loaded log file name
+        self.speed = tk.StringVar(value='1x')               #playback speed
+        self.status = tk.StringVar(value='')                #replay status
+
+        self.config_window()
+        self.protocol("WM_DELETE_WINDOW", self.on_close)    #handle window close button
+
+    def config_window(self):
+        """function loads the various elements of the replay pop-up window"""
+        self.frm_main = tk.Frame(self, highlightthickness=0)
+        self.frm_main.grid(row=0, column=0)
+
+        #log file
+        lbl_log = tk.Label(self.frm_main, text="CAN Log", font=font_hdr2)
+        lbl_log.grid(row=0, column=0, padx=10, pady=10)
+        lbl_logName = tk.Label(self.frm_main, textvariable=self.log_name, font=font_norm1, width=30, anchor=tk.W)
+        lbl_logName.grid(row=0, column=1, padx=10, pady=10)
+        btn_open=tk.Button(self.frm_main,text="Open Log", command=self.log_open)
+        btn_open.grid(row=0, column=2, padx=10, pady=10)
+
+        #playback speed
+        lbl_speed = tk.Label(self.frm_main, text="Speed", font=font_hdr2)
+        lbl_speed.grid(row=1, column=0, padx=10, pady=10)
+        cbo_speed = ttk.Combobox(self.frm_main, values=list(CANreplay_speeds.keys()), textvariable=self.speed, state='readonly', width=10)
+        cbo_speed.bind('<<ComboboxSelected>>', self.speed_upd)
+        cbo_speed.grid(row=1, column=1, padx=10, pady=10, sticky=tk.W)
+
+        #status
+        lbl_status = tk.Label(self.frm_main, textvariable=self.status, font=font_norm1)
+        lbl_status.grid(row=2, column=0, columnspan=3, padx=10, pady=(0,10), sticky=tk.W)
+
+        #---control buttons
+        self.frm_cntl = tk.Frame(self, highlightthickness=0)
+        self.frm_cntl.grid(row=1, column=0)
+        btn_play=tk.Button(self.frm_cntl,text="Play", command=self.replay.start)
+        btn_play.grid(row=0, column=0, padx=10, pady=(0,10))
+        btn_pause=tk.Button(self.frm_cntl,text="Pause", command=self.replay.pause)
+        btn_pause.grid(row=0, column=1, padx=10, pady=(0,10))
+        btn_stop=tk.Button(self.frm_cntl,text="Stop", command=self.replay_stop)
+        btn_stop.grid(row=0, column=2, padx=10, pady=(0,10))
+        btn_close=tk.Button(self.frm_cntl,text="Close", command=self.on_close)
+        btn_close.grid(row=0, column=3, padx=10, pady=(0,10))
+
+    def log_open(self):
+        """function prompts the user for a CAN log file and loads it for replay"""
+        dialogue_opts = { 'initialdir':self.master_ref.editr_cntl.configFile_dir,
+                          'filetypes':[('CAN Logs','*.log *.asc *.txt'), ('All Files','*.*')],
+                          'title':'Open CAN Log'
+                        }                                       #set the dialogue options
+        file_dir, file_name = file_open_dialogue(dialogue_opts) #get the location and file to open
+        if file_name is None: return                            #user canceled
+
+        try: self.replay.load_log(file_dir+file_name)           #load the log and build the decoder
+        except (ImportError, OSError) as err:
+            messagebox.showerror("Error", "Unable to load CAN log: " + str(err), parent=self)
+            return
+
+        self.log_name.set(file_name)
+        if self.replay.decoder.skipped:                         #let the user know about channels that can't be decoded
+            err_msg = "The following CAN channels can't be decoded and will not be replayed:\n\n"
+            for k,v in self.replay.decoder.skipped.items(): err_msg += k + ': ' + v +'\n'
+            wndw_notify(self, {'type':Popup_types['WARN'],
+                               'title':'CAN CHANNELS',
+                               'message':err_msg})
+        self.upd_status()
+
+    def speed_upd(self, event):
+        """function updates the playback speed when selected from the dropdown box
+
+        :param event: (unused) event args from the combobox update
+        """
+        self.replay.speed = CANreplay_speeds[self.speed.get()]
+
+    def upd_status(self):
+        """function updates the replay status text with the current log time and progress"""
+        if self.replay.reader is None: return
+        tmp_status = 'Log time: {:.1f}s   Read: {:.0f}%   Channels: {}'.format(self.replay.t_log,
+                                                                           self.replay.reader.progress()*100,
+                                                                           len(self.replay.values))
+        if self.replay.reader.eof and self.replay.reader.pending is None: tmp_status += '   (end of log)'
+        self.status.set(tmp_status)
+
+    def replay_stop(self):
+        """function stops the replay and restores the editor pages"""
+        self.replay.stop()
+        self.upd_status()
+
+    def on_close(self):
+        """function is called when the close or exit buttons are selected. The replay is stopped, and the
+        editor pages restored, before closing."""
+        self.replay.close()
+        self.destroy()
+
 class wndw_Pages(tk.Toplevel):
     """editor window for dash pages"""
     def __init__(self, master):
@@ -1605,6 +1843,7 @@ class wndw_Pages(tk.Toplevel):
                     upd_page = dash_page(**pg_kwargs)                        #create new page config
                     upd_page.master_ref = self.master_ref               #set the master reference for in-class functions
                     upd_page.buildPages_canv()                          #create a new canvas obj
+                    self.master_ref.editr_cntl.res_mgr.track_page(upd_page) #track the canvas, so it's freed with the page
                     self.result = {pg_kwargs.get('name') : upd_page}    #set result
                 else:                                       #if updating an existing page
                     self.passed_page.upd_config(pg_kwargs)              #then just update the page config
@@ -1666,6 +1905,7 @@ class wndw_newWidget(tk.Toplevel):
         elif self.ele_typ == DashEle_types['LBL_DAT']: self.config_eles_lbl_dat()
         elif self.ele_typ == DashEle_types['IND_BLT']: self.config_eles_ind_blt()
         elif self.ele_typ == DashEle_types['IND_BAR']: self.config_eles_ind_bar()             
+        elif self.ele_typ == DashEle_types['IND_GAU']: self.config_eles_ind_gau()
 
         #---save/control frame
         self.frm_cntl = tk.Frame(self, highlightthickness=0)
@@ -2034,6 +2274,113 @@ class wndw_newWidget(tk.Toplevel):
         dngrHI_entry.grid(row=12, column=1, padx=10, pady=10)
         dngrHI_entry.reqd = False #set as a required widget field
 
+    def config_eles_ind_gau(self):
+        """function creates the required fields for an analog gauge indicator. Additionally creates the required variables
+        and field requirement values to support element generation."""
+        #--reference name
+        ref_lbl = tk.Label(self.frm_main, text="Reference Name", font=font_hdr2)
+        ref_lbl.grid(row=0, column=0, padx=10, pady=10)
+        ref_entry = tk.Entry(self.frm_main, width=15); ref_entry.name='name'
+        ref_entry.value = tk.StringVar(); ref_entry.config(textvariable=ref_entry.value) #create value attrb var and assign
+        ref_entry.grid(row=0, column=1, padx=10, pady=10)
+        ref_entry.reqd = True #set as a required widget field
+
+        #--face color
+        fill_lbl = tk.Label(self.frm_main, text="Face Color", font=font_hdr2)
+        fill_lbl.grid(row=1, column=0, padx=10, pady=(10,0))
+        cbo_fill = ttk.Combobox(self.frm_main, values=list(self.master_colors.keys())); cbo_fill.name='fill'
+        cbo_fill.set("Select Color")
+        cbo_fill.value = tk.StringVar(); cbo_fill.config(textvariable=cbo_fill.value) #create value attrb var and assign
+        cbo_fill.grid(row=1, column=1, padx=10, pady=(10,0))
+        cbo_fill.reqd = True #set as a required widget field
+
+        #--outline and tick color
+        otln_lbl = tk.Label(self.frm_main, text="Outline Color", font=font_hdr2)
+        otln_lbl.grid(row=2, column=0, padx=10, pady=(10,0))
+        cbo_otln = ttk.Combobox(self.frm_main, values=list(self.master_colors.keys())); cbo_otln.name='outln'
+        cbo_otln.set("Select Color")
+        cbo_otln.value = tk.StringVar(); cbo_otln.config(textvariable=cbo_otln.value) #create value attrb var and assign
+        cbo_otln.grid(row=2, column=1, padx=10, pady=(10,0))
+        cbo_otln.reqd = True #set as a required widget field
+
+        #--needle color
+        ndl_lbl = tk.Label(self.frm_main, text="Needle Color", font=font_hdr2)
+        ndl_lbl.grid(row=3, column=0, padx=10, pady=(10,0))
+        cbo_ndl = ttk.Combobox(self.frm_main, values=list(self.master_colors.keys())); cbo_ndl.name='needle'
+        cbo_ndl.set("Select Color")
+        cbo_ndl.value = tk.StringVar(); cbo_ndl.config(textvariable=cbo_ndl.value) #create value attrb var and assign
+        cbo_ndl.grid(row=3, column=1, padx=10, pady=(10,0))
+        cbo_ndl.reqd = True #set as a required widget field
+
+        #--CAN channel
+        canCH_lbl = tk.Label(self.frm_main, text="CAN channel", font=font_hdr2)
+        canCH_lbl.grid(row=4, column=0, padx=10, pady=(10,0))
+        cbo_canCH = ttk.Combobox(self.frm_main, values=list(self.master_CANch.keys())); cbo_canCH.name='data_ch'
+        cbo_canCH.set("Select CAN Channel")
+        cbo_canCH.value = tk.StringVar(); cbo_canCH.config(textvariable=cbo_canCH.value) #create value attrb var and assign
+        cbo_canCH.grid(row=4, column=1, padx=10, pady=(10,0))
+        cbo_canCH.reqd = True #set as a required widget field
+
+        #--gauge size (diameter)
+        size_lbl = tk.Label(self.frm_main, text="Gauge Size", font=font_hdr2)
+        size_lbl.grid(row=5, column=0, padx=10, pady=(10,0))
+        size_entry = tk.Entry(self.frm_main, width=15); size_entry.name='size'
+        size_entry.value = tk.IntVar(); size_entry.config(textvariable=size_entry.value) #create value attrb var and assign
+        size_entry.grid(row=5, column=1, padx=10, pady=(10,0))
+        size_entry.reqd = True #set as a required widget field
+
+        #--minimum value (start of the sweep)
+        minval_lbl = tk.Label(self.frm_main, text="Min Value", font=font_hdr2)
+        minval_lbl.grid(row=6, column=0, padx=10, pady=(10,0))
+        minval_entry = tk.Entry(self.frm_main, width=15); minval_entry.name='scale_lo'
+        minval_entry.value = tk.StringVar(); minval_entry.config(textvariable=minval_entry.value) #create value attrb var and assign
+        minval_entry.grid(row=6, column=1, padx=10, pady=(10,0))
+        minval_entry.reqd = True #set as a required widget field
+
+        #--maximum value (end of the sweep)
+        maxval_lbl = tk.Label(self.frm_main, text="Max Value", font=font_hdr2)
+        maxval_lbl.grid(row=7, column=0, padx=10, pady=(10,0))
+        maxval_entry = tk.Entry(self.frm_main, width=15); maxval_entry.name='scale_hi'
+        maxval_entry.value = tk.StringVar(); maxval_entry.config(textvariable=maxval_entry.value) #create value attrb var and assign
+        maxval_entry.grid(row=7, column=1, padx=10, pady=(10,0))
+        maxval_entry.reqd = True #set as a required widget field
+
+        #--start angle, clockwise from straight up
+        angStart_lbl = tk.Label(self.frm_main, text="Start Angle", font=font_hdr2)
+        angStart_lbl.grid(row=8, column=0, padx=10, pady=(10,0))
+        angStart_entry = tk.Entry(self.frm_main, width=15); angStart_entry.name='ang_start'
+        angStart_entry.value = tk.IntVar(); angStart_entry.config(textvariable=angStart_entry.value) #create value attrb var and assign
+        angStart_entry.value.set(-135)
+        angStart_entry.grid(row=8, column=1, padx=10, pady=(10,0))
+        angStart_entry.reqd = True #set as a required widget field
+
+        #--sweep angle
+        angSweep_lbl = tk.Label(self.frm_main, text="Sweep Angle", font=font_hdr2)
+        angSweep_lbl.grid(row=9, column=0, padx=10, pady=(10,0))
+        angSweep_entry = tk.Entry(self.frm_main, width=15); angSweep_entry.name='ang_sweep'
+        angSweep_entry.value = tk.IntVar(); angSweep_entry.config(textvariable=angSweep_entry.value) #create value attrb var and assign
+        angSweep_entry.value.set(270)
+        angSweep_entry.grid(row=9, column=1, padx=10, pady=(10,0))
+        angSweep_entry.reqd = True #set as a required widget field
+
+        #--number of major ticks
+        tickMaj_lbl = tk.Label(self.frm_main, text="Major Ticks", font=font_hdr2)
+        tickMaj_lbl.grid(row=10, column=0, padx=10, pady=(10,0))
+        tickMaj_entry = tk.Entry(self.frm_main, width=15); tickMaj_entry.name='ticks_major'
+        tickMaj_entry.value = tk.IntVar(); tickMaj_entry.config(textvariable=tickMaj_entry.value) #create value attrb var and assign
+        tickMaj_entry.value.set(10)
+        tickMaj_entry.grid(row=10, column=1, padx=10, pady=(10,0))
+        tickMaj_entry.reqd = True #set as a required widget field
+
+        #--number of minor ticks per major tick
+        tickMin_lbl = tk.Label(self.frm_main, text="Minor Ticks", font=font_hdr2)
+        tickMin_lbl.grid(row=11, column=0, padx=10, pady=10)
+        tickMin_entry = tk.Entry(self.frm_main, width=15); tickMin_entry.name='ticks_minor'
+        tickMin_entry.value = tk.IntVar(); tickMin_entry.config(textvariable=tickMin_entry.value) #create value attrb var and assign
+        tickMin_entry.value.set(5)
+        tickMin_entry.grid(row=11, column=1, padx=10, pady=10)
+        tickMin_entry.reqd = True #set as a required widget field
+
     def limits_en(self):
         """function handles auxiliary field setting when the "warning enable" field is enabled or disabled.
         If limits are disabled, any related fields should be disabled and set to blank. If limits are enabled, it should
@@ -2137,6 +2484,7 @@ class vw_EditorWidget_props:
             case Label_Data(): self.vwPop_lblDat()
             case Indicator_Bullet(): self.vwPop_indBlt()
             case Indicator_Bar(): self.vwPop_indBar()
+            case Indicator_Gauge(): self.vwPop_indGau()
         
     def newProps_updWdgt(self, var_name, indx, mode):
         """function updates a dash element's defitinion when its properties are updated via user input
@@ -2152,6 +2500,7 @@ class vw_EditorWidget_props:
                 try: updKWARGS.update({widg.name: widg.value.get()})    #then add to temp dict with the 'name' arg as the key
                 except: updKWARGS.update({widg.name: None})             #assign none if entry widget is blank
         self.current_wigtCfg.editor_upd_config(updKWARGS)           #update object config and the editor object
+        self.current_wigtCfg.wgtCtl.edge_upd()                      #update the element edges for the alignment guides
     
     def vwPop_lblStat(self):
         """function updates the properties pane with the input fields for a static label. Additionally creates
@@ -2654,6 +3003,149 @@ class vw_EditorWidget_props:
 
         self.limits_load()  #set the limits fields on load
 
+    def vwPop_indGau(self):
+        """function updates the properties pane with the input fields for an analog gauge indicator. Additionally creates
+        the required variables and sets traces for the user inputs to trigger configuration updates."""
+        #cfg.name > label name
+        lbl_refname = tk.Label(self.prop_frame, text="Reference Name", font=font_hdr2)                  #entry label
+        lbl_refname.grid(row=0, column=0, padx=10, pady=(10,0))                                             #place
+        entry_refname = tk.Entry(self.prop_frame, width=15, state=tk.DISABLED)                          #entry widget
+        entry_refname.value = tk.StringVar(); entry_refname.config(textvariable=entry_refname.value)        #create value attrb var and assign to entry widget
+        entry_refname.value.set(self.current_wigtCfg.name)                                                  #set the current config value
+        entry_refname.name='name'                                                                           #assign name
+        entry_refname.value.trace_add("write", self.newProps_updWdgt)                                       #add trace to update function to update config
+        entry_refname.grid(row=0, column=1, padx=10, pady=(10,0))                                           #place
+
+        #cfg.x0 > position - X0
+        lbl_x0 = tk.Label(self.prop_frame, text="Pos - X0", font=font_hdr2)
+        lbl_x0.grid(row=1, column=0, padx=10, pady=(10,0))
+        entry_x0 = tk.Entry(self.prop_frame, width=15)
+        entry_x0.value = tk.IntVar(); entry_x0.config(textvariable=entry_x0.value)
+        entry_x0.value.set(self.current_wigtCfg.x0)
+        entry_x0.name = 'x0'
+        entry_x0.value.trace_add("write", self.newProps_updWdgt)
+        entry_x0.grid(row=1, column=1, padx=10, pady=(10,0))
+
+        #cfg.y0 > position - Y0
+        lbl_y0 = tk.Label(self.prop_frame, text="Pos - Y0", font=font_hdr2)
+        lbl_y0.grid(row=2, column=0, padx=10, pady=(10,0))
+        entry_y0 = tk.Entry(self.prop_frame, width=15)
+        entry_y0.value = tk.IntVar(); entry_y0.config(textvariable=entry_y0.value)
+        entry_y0.value.set(self.current_wigtCfg.y0)
+        entry_y0.name = 'y0'
+        entry_y0.value.trace_add("write", self.newProps_updWdgt)
+        entry_y0.grid(row=2, column=1, padx=10, pady=(10,0))
+
+        #cfg.size > gauge size (diameter)
+        lbl_size = tk.Label(self.prop_frame, text="Gauge Size", font=font_hdr2)
+        lbl_size.grid(row=3, column=0, padx=10, pady=(10,0))
+        entry_size = tk.Entry(self.prop_frame, width=15)
+        entry_size.value = tk.IntVar(); entry_size.config(textvariable=entry_size.value)
+        entry_size.value.set(self.current_wigtCfg.size)
+        entry_size.name = 'size'
+        entry_size.value.trace_add("write", self.newProps_updWdgt)
+        entry_size.grid(row=3, column=1, padx=10, pady=(10,0))
+
+        #cfg.fill > face color
+        lbl_fill = tk.Label(self.prop_frame, text="Face Color", font=font_hdr2)
+        lbl_fill.grid(row=4, column=0, padx=10, pady=(10,0))
+        cbo_fill = ttk.Combobox(self.prop_frame, values=list(self.master_colors.keys()))
+        cbo_fill.value = tk.StringVar(); cbo_fill.config(textvariable=cbo_fill.value)
+        cbo_fill.value.set(self.current_wigtCfg.fill)
+        cbo_fill.name = 'fill'
+        cbo_fill.value.trace_add("write", self.newProps_updWdgt)
+        cbo_fill.grid(row=4, column=1, padx=10, pady=(10,0))
+
+        #cfg.outln > outline and tick color
+        lbl_outln = tk.Label(self.prop_frame, text="Outline Color", font=font_hdr2)
+        lbl_outln.grid(row=5, column=0, padx=10, pady=(10,0))
+        cbo_outln = ttk.Combobox(self.prop_frame, values=list(self.master_colors.keys()))
+        cbo_outln.value = tk.StringVar(); cbo_outln.config(textvariable=cbo_outln.value)
+        cbo_outln.value.set(self.current_wigtCfg.outln)
+        cbo_outln.name = 'outln'
+        cbo_outln.value.trace_add("write", self.newProps_updWdgt)
+        cbo_outln.grid(row=5, column=1, padx=10, pady=(10,0))
+
+        #cfg.needle > needle color
+        lbl_needle = tk.Label(self.prop_frame, text="Needle Color", font=font_hdr2)
+        lbl_needle.grid(row=6, column=0, padx=10, pady=(10,0))
+        cbo_needle = ttk.Combobox(self.prop_frame, values=list(self.master_colors.keys()))
+        cbo_needle.value = tk.StringVar(); cbo_needle.config(textvariable=cbo_needle.value)
+        cbo_needle.value.set(self.current_wigtCfg.needle)
+        cbo_needle.name = 'needle'
+        cbo_needle.value.trace_add("write", self.newProps_updWdgt)
+        cbo_needle.grid(row=6, column=1, padx=10, pady=(10,0))
+
+        #cfg.data_ch > CAN channel
+        lbl_datach = tk.Label(self.prop_frame, text="CAN channel", font=font_hdr2)
+        lbl_datach.grid(row=7, column=0, padx=10, pady=(10,0))
+        cbo_datach = ttk.Combobox(self.prop_frame, values=list(self.master_CANch.keys()))
+        cbo_datach.value = tk.StringVar(); cbo_datach.config(textvariable=cbo_datach.value)
+        cbo_datach.value.set(self.current_wigtCfg.data_ch)
+        cbo_datach.name = 'data_ch'
+        cbo_datach.value.trace_add("write", self.newProps_updWdgt)
+        cbo_datach.grid(row=7, column=1, padx=10, pady=(10,0))
+
+        #cfg.scale_lo > minimum value (start of the sweep)
+        lbl_scalelo = tk.Label(self.prop_frame, text="Minimum Value", font=font_hdr2)
+        lbl_scalelo.grid(row=8, column=0, padx=10, pady=(10,0))
+        entry_scalelo = tk.Entry(self.prop_frame, width=15)
+        entry_scalelo.value = tk.StringVar(); entry_scalelo.config(textvariable=entry_scalelo.value)
+        entry_scalelo.value.set(strvar_str(self.current_wigtCfg.scale_lo))
+        entry_scalelo.name = 'scale_lo'
+        entry_scalelo.value.trace_add("write", self.newProps_updWdgt)
+        entry_scalelo.grid(row=8, column=1, padx=10, pady=(10,0))
+
+        #cfg.scale_hi > maximum value (end of the sweep)
+        lbl_scalehi = tk.Label(self.prop_frame, text="Maximum Value", font=font_hdr2)
+        lbl_scalehi.grid(row=9, column=0, padx=10, pady=(10,0))
+        entry_scalehi = tk.Entry(self.prop_frame, width=15)
+        entry_scalehi.value = tk.StringVar(); entry_scalehi.config(textvariable=entry_scalehi.value)
+        entry_scalehi.value.set(strvar_str(self.current_wigtCfg.scale_hi))
+        entry_scalehi.name = 'scale_hi'
+        entry_scalehi.value.trace_add("write", self.newProps_updWdgt)
+        entry_scalehi.grid(row=9, column=1, padx=10, pady=(10,0))
+
+        #cfg.ang_start > start angle, clockwise from straight up
+        lbl_angstart = tk.Label(self.prop_frame, text="Start Angle", font=font_hdr2)
+        lbl_angstart.grid(row=10, column=0, padx=10, pady=(10,0))
+        entry_angstart = tk.Entry(self.prop_frame, width=15)
+        entry_angstart.value = tk.IntVar(); entry_angstart.config(textvariable=entry_angstart.value)
+        entry_angstart.value.set(self.current_wigtCfg.ang_start)
+        entry_angstart.name = 'ang_start'
+        entry_angstart.value.trace_add("write", self.newProps_updWdgt)
+        entry_angstart.grid(row=10, column=1, padx=10, pady=(10,0))
+
+        #cfg.ang_sweep > sweep angle
+        lbl_angsweep = tk.Label(self.prop_frame, text="Sweep Angle", font=font_hdr2)
+        lbl_angsweep.grid(row=11, column=0, padx=10, pady=(10,0))
+        entry_angsweep = tk.Entry(self.prop_frame, width=15)
+        entry_angsweep.value = tk.IntVar(); entry_angsweep.config(textvariable=entry_angsweep.value)
+        entry_angsweep.value.set(self.current_wigtCfg.ang_sweep)
+        entry_angsweep.name = 'ang_sweep'
+        entry_angsweep.value.trace_add("write", self.newProps_updWdgt)
+        entry_angsweep.grid(row=11, column=1, padx=10, pady=(10,0))
+
+        #cfg.ticks_major > number of major ticks
+        lbl_ticksmajor = tk.Label(self.prop_frame, text="Major Ticks", font=font_hdr2)
+        lbl_ticksmajor.grid(row=12, column=0, padx=10, pady=(10,0))
+        entry_ticksmajor = tk.Entry(self.prop_frame, width=15)
+        entry_ticksmajor.value = tk.IntVar(); entry_ticksmajor.config(textvariable=entry_ticksmajor.value)
+        entry_ticksmajor.value.set(self.current_wigtCfg.ticks_major)
+        entry_ticksmajor.name = 'ticks_major'
+        entry_ticksmajor.value.trace_add("write", self.newProps_updWdgt)
+        entry_ticksmajor.grid(row=12, column=1, padx=10, pady=(10,0))
+
+        #cfg.ticks_minor > number of minor ticks per major tick
+        lbl_ticksminor = tk.Label(self.prop_frame, text="Minor Ticks", font=font_hdr2)
+        lbl_ticksminor.grid(row=13, column=0, padx=10, pady=10)
+        entry_ticksminor = tk.Entry(self.prop_frame, width=15)
+        entry_ticksminor.value = tk.IntVar(); entry_ticksminor.config(textvariable=entry_ticksminor.value)
+        entry_ticksminor.value.set(self.current_wigtCfg.ticks_minor)
+        entry_ticksminor.name = 'ticks_minor'
+        entry_ticksminor.value.trace_add("write", self.newProps_updWdgt)
+        entry_ticksminor.grid(row=13, column=1, padx=10, pady=10)
+
     def pad_tog(self):
         """function handles auxiliary field setting when the "background pad" field is enabled or disabled.
         If padding is disabled, any related fields should be disabled and set to blank. If padding is enabled, it should
@@ -26,6 +26,7 @@ dash_xSz = 1024         #X resolution
 dash_ySz = 600          #Y resolution
 dash_resRatio = dash_xSz/dash_ySz   #X/Y ratio
 refrsh_rt = 67          #refresh rate in ms
+dash_pxFmt = 'RGB565'   #native display pixel format, used for raw image blobs
 deflt_backlite = 100    #backlight PWM
 
 #---applciation constants
@@ -43,25 +44,79 @@ brdr_accent_offset = brdr_accent*2  #offset for dimentions of panes to account f
 #---misc constants
 pad_margin = 2      #the padding margin, in pixels, that the background pad rectangle is sized
 pad_radius = 20      #the radius of the background pad polygon
+gauge_tickOut = 0.95        #outer end of the gauge ticks, fraction of the gauge radius
+gauge_tickMajor = 0.15      #major tick length, fraction of the gauge radius
+gauge_tickMinor = 0.07      #minor tick length, fraction of the gauge radius
+gauge_needleLen = 0.85      #needle length, fraction of the gauge radius
+gauge_needleW = 0.025       #needle width, fraction of the gauge size
+gauge_hubR = 0.06           #needle hub radius, fraction of the gauge size
+clr_tagFmt = 'clr_{}:{}'    #canvas tag of an editor object using a named color. Formatted with the canvas option and color name
+clr_tagOpts = ('fill', 'outline')   #canvas options that are set from named colors
+ele_grpTag = 'ele:{}'       #canvas tag of all the objects of an editor element (element, pad, etc). Formatted with the element name
+guide_tag = 'edtr_guide'    #canvas tag of the editor alignment guide lines
+page_bgTag = 'page_bg'      #canvas tag of the page background image, BG elements are placed just above it
+guide_clr = '#FF00FF'       #alignment guide line color
+guide_dash = (4, 2)         #alignment guide line dash pattern
 clr_dflt_FG= "#000000"
 clr_dflt_WARN= "#C0C0C0"
 clr_dflt_DNGR= "#C0C0C0"
 
 #TODO: move these to a global program settings that can be configured by the user on the front-end
 click_delay = 50            #delay in miliseconds to check if left-mouse is still held (indicating a click and drag)
+drag_frame_ms = 16          #minimum time in miliseconds between canvas updates while dragging, about one display frame
+snap_grid_dflt = 10         #default editor snap grid size, in pixels
+snap_grid_sizes = (5, 10, 20, 25, 50)   #editor snap grid sizes that can be selected
+snap_guide_dist = 6         #distance in pixels an element edge or center snaps to the edge or center of another element
+pool_prefetch = 2           #pages on each side of the current page that are built and stacked in idle time, for instant switching
+pool_latencyLen = 50        #number of recent page switch times kept for the status readout
+pool_budgetDflt = 64        #default memory budget of the built page canvases, in MB
+pool_budgetsMB = (16, 32, 64, 128, 256, 512)    #page canvas memory budgets that can be selected, in MB
+pool_canvBytes = 65536      #estimated memory of an empty page canvas, in bytes
+pool_itemBytes = 1024       #estimated memory of a canvas item (with its tags, bindings, and Python refs), in bytes
+pool_eleItems = 8           #estimated canvas items per element of a page that isn't built yet (gauge ticks are items)
+nudge_keys = {'Left': (-1, 0), 'Right': (1, 0), 'Up': (0, -1), 'Down': (0, 1)}     #arrow key nudge directions. Format is {key: (dx, dy)}
+nudge_stepBig = 10          #pixels the selected element is nudged when shift is held
+nudge_release_ms = 30       #delay in miliseconds before a key release ends a nudge, auto-repeat sends a release before each repeat
+nudge_inputCls = ('Entry', 'TEntry', 'Spinbox', 'TSpinbox', 'TCombobox', 'Text', 'Listbox')    #widget classes that keep the arrow keys
 sys_wrap_len = 400          #custom warning box width
 sys_CAN_base_PID = '0x9A'   #base CAN PID default
+sys_CAN_bitrate = 500000    #CAN bus bitrate default, in bits/sec
+CAN_bitrates = (125000, 250000, 500000, 1000000)    #common CAN bus bitrates listed in the CAN settings window, in bits/sec
+CAN_busLoad_lim = 0.8       #max recommended worst-case CAN bus utilization
+CAN_rxFrm_budget = 100      #max number of CAN frames the dash can process in a single refresh period
+dash_frameBudget = 0.8      #max fraction of the refresh period a page redraw should take
+sys_cache_dir = os.path.join(os.path.expanduser('~'), '.PyDash_Builder', 'cache')  #builder cache directory
 
 #---configuration output constants
 dashCFG_PKGname = 'PyDash_Config'       #zip file name of the output package
+dashCFG_deltaName = 'PyDash_Config_delta'  #zip file name of a delta output package
 dashCFG_CFGname = 'PyDash_Config.xml'   #xml config file name
+dashCFG_BINname = 'PyDash_Config.bin'   #binary config file name
 dashCFG_imgDir = 'images'               #output image directory
+dashCFG_fontDir = 'fonts'               #output font directory
+dashCFG_renderName = 'PyDash_Render.xml'    #compiled page render plan file name
 
 #---Fonts
 """These are the fonts that are used in the PyDash. These should be the only fonts used in defining a theme"""
 PyDash_fonts = ['Liberation Sans', 'Liberation Serif', 'Liberation Mono',
                 'Anton', 'Archivo Narrow', 'Lemon', 'Sui Generis',
 			    'Microgramma D Extended']
+PyDash_fontFiles = {'Liberation Sans': 'LiberationSans-Regular.ttf',      #font file of each PyDash font. Format is {typeface: file_name}
+                    'Liberation Serif': 'LiberationSerif-Regular.ttf',
+                    'Liberation Mono': 'LiberationMono-Regular.ttf',
+                    'Anton': 'Anton-Regular.ttf',
+                    'Archivo Narrow': 'ArchivoNarrow-Regular.ttf',
+                    'Lemon': 'Lemon-Regular.ttf',
+                    'Sui Generis': 'Sui Generis Rg.otf',
+                    'Microgramma D Extended': 'Microgramma-D-Bold-Extended.ttf'}
+sys_font_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'Documentation', 'PyDash_Fonts')  #PyDash font files
+sys_fontSysDirs = [os.path.join(os.environ.get('WINDIR', 'C:\\Windows'), 'Fonts'),      #system font directories, searched for fonts that aren't PyDash fonts
+                   os.path.expanduser(os.path.join(os.environ.get('LOCALAPPDATA', '~'), 'Microsoft', 'Windows', 'Fonts')),
+                   '/usr/share/fonts', '/usr/local/share/fonts', os.path.expanduser('~/.local/share/fonts'), os.path.expanduser('~/.fonts'),
+                   '/Library/Fonts', '/System/Library/Fonts', os.path.expanduser('~/Library/Fonts')]
+sys_fontExts = ('.ttf', '.otf', '.ttc')     #font file extensions searched for in the system font directories
+dash_fontScale = 96/72          #font point to pixel scale on the dash (tk scaling at 96 DPI)
+dash_tkFontName = 'PyDash_fnt_{}'   #name of the named tk font of a theme font. Formatted with the theme font name
 
 help_fontZip_GITlink = 'https://github.com/JungleGim/PyDash_Builder/blob/2ec372851c0428101ded503dc9f5104ef4e3e72c/Documentation/PyDash_Fonts.zip'
 help_MS_fontInstall_link = 'https://www.microsoft.com/en-us/windows/learning-center/how-to-install-fonts-on-your-pc'